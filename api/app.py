@@ -1,13 +1,145 @@
-from fastapi import FastAPI
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from backend.core.admission import AdmissionController, AdmissionRejected, parse_trusted_sources
+from backend.core.audit_log import DEFAULT_AUDIT_LOG_PATH, AuditLog
+from backend.core.campus_router import (
+    DEFAULT_CAMPUS_ID,
+    DEFAULT_CONFIG_DIR,
+    CampusDirectory,
+    CampusRouter,
+    UnknownCampusError,
+)
+from backend.core.coordinator import (
+    add_escalation_sink,
+    add_sink,
+    build_payload,
+    remove_escalation_sink,
+    remove_sink,
+)
+from backend.core.escalation import DEFAULT_OUTBOX_PATH, EscalationDispatcher, EscalationOutbox
+from backend.core.incident_stats import IncidentStats
+from backend.core.incident_store import DEFAULT_STORE_PATH, IncidentStore
+from backend.core.ingestion import QueueFullError
+from backend.core.metrics import HTTP_LATENCY, HTTP_REQUESTS, METRICS
+
+# Set to an empty string to run without an incident history
+INCIDENT_DB_PATH = os.environ.get("CAMPUS_INCIDENT_DB", DEFAULT_STORE_PATH)
+INGEST_WORKERS = int(os.environ.get("CAMPUS_INGEST_WORKERS", "4"))
+CONFIG_DIR = os.environ.get("CAMPUS_CONFIG_DIR", DEFAULT_CONFIG_DIR)
+# 0 serves every campus in this process; N pins campuses to N worker processes
+CAMPUS_SHARDS = int(os.environ.get("CAMPUS_SHARDS", "0"))
+# Set to an empty string to disable escalation notifications
+NOTIFY_OUTBOX_PATH = os.environ.get("CAMPUS_NOTIFY_OUTBOX", DEFAULT_OUTBOX_PATH)
+# Set to an empty string to run without the hash-chained audit log
+AUDIT_LOG_PATH = os.environ.get("CAMPUS_AUDIT_LOG", DEFAULT_AUDIT_LOG_PATH)
+# 1: a response is only sent once its audit entry is fsynced
+AUDIT_DURABLE = os.environ.get("CAMPUS_AUDIT_DURABLE", "0") == "1"
+# Reports per second: across the API, per client address and per
+# campus location. A global rate of 0 disables admission control.
+ADMIT_RATE = float(os.environ.get("CAMPUS_ADMIT_RATE", "200"))
+ADMIT_SOURCE_RATE = float(os.environ.get("CAMPUS_ADMIT_SOURCE_RATE", "5"))
+ADMIT_SOURCE_BURST = float(os.environ.get("CAMPUS_ADMIT_SOURCE_BURST", "50"))
+ADMIT_LOCATION_RATE = float(os.environ.get("CAMPUS_ADMIT_LOCATION_RATE", "5"))
+# Gateways with their own per-source limits, e.g. a sensor gateway or
+# a campus NAT: "10.0.0.5=50/500,10.0.0.6=20/100" (rate/burst)
+ADMIT_TRUSTED_SOURCES = os.environ.get("CAMPUS_ADMIT_TRUSTED_SOURCES", "")
+
+incident_store: Optional[IncidentStore] = None
+incident_stats: Optional[IncidentStats] = None
+audit_log: Optional[AuditLog] = None
+dispatcher: Optional[EscalationDispatcher] = None
+admission: Optional[AdmissionController] = None
+router: Optional[CampusRouter] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global incident_store, incident_stats, audit_log, dispatcher, admission, router
+
+    incident_stats = IncidentStats()
+    add_sink(incident_stats.record)
+
+    if INCIDENT_DB_PATH:
+        incident_store = IncidentStore(INCIDENT_DB_PATH)
+        add_sink(incident_store.record)
+
+    if AUDIT_LOG_PATH:
+        # Entries are group-committed off the request path unless
+        # CAMPUS_AUDIT_DURABLE is set; a full queue blocks reports
+        # rather than growing. Workers sharing the file take turns
+        # under a file lock.
+        audit_log = AuditLog(AUDIT_LOG_PATH, durable_records=AUDIT_DURABLE)
+        add_sink(audit_log.record)
+
+    if ADMIT_RATE > 0:
+        admission = AdmissionController(
+            rate=ADMIT_RATE,
+            source_rate=ADMIT_SOURCE_RATE,
+            source_burst=ADMIT_SOURCE_BURST,
+            location_rate=ADMIT_LOCATION_RATE,
+            trusted_sources=parse_trusted_sources(ADMIT_TRUSTED_SOURCES)
+        )
+
+    router = CampusRouter(
+        CampusDirectory(CONFIG_DIR),
+        shards=CAMPUS_SHARDS,
+        workers=INGEST_WORKERS,
+        admission=admission
+    )
+
+    if NOTIFY_OUTBOX_PATH:
+        # Campuses opt in with a "notifications" config section
+        dispatcher = EscalationDispatcher(
+            EscalationOutbox(NOTIFY_OUTBOX_PATH),
+            config_for=router.campus_config
+        )
+        dispatcher.start()
+        # Escalations are queued as soon as the response is planned,
+        # ahead of the audit
+        add_escalation_sink(dispatcher.record)
+
+    yield
+
+    router.shutdown()
+
+    if dispatcher is not None:
+        remove_escalation_sink(dispatcher.record)
+        dispatcher.close()
+        dispatcher.outbox.close()
+        dispatcher = None
+
+    router = None
+    admission = None
+
+    if audit_log is not None:
+        remove_sink(audit_log.record)
+        audit_log.close()
+        audit_log = None
+
+    if incident_store is not None:
+        remove_sink(incident_store.record)
+        incident_store.close()
+        incident_store = None
+
+    remove_sink(incident_stats.record)
+    incident_stats = None
 
-from backend.core.coordinator import run_pipeline
 
 app = FastAPI(
     title="Campus Safety AI API",
     description="API for Autonomous Campus Safety Intelligence System",
-    version="1.0"
+    version="1.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -19,12 +151,99 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    if not METRICS.enabled:
+        return await call_next(request)
+
+    started = perf_counter()
+    response = await call_next(request)
+
+    # Route templates keep label cardinality bounded
+    route = request.scope.get("route")
+    path = getattr(route, "path", "unmatched")
+    HTTP_LATENCY.observe(perf_counter() - started, request.method, path)
+    HTTP_REQUESTS.inc(request.method, path, str(response.status_code))
+    return response
+
+
 class IncidentRequest(BaseModel):
     incident_type: str
     description: str
     location: str
     user_role: str
     panic: bool
+    campus_id: str = DEFAULT_CAMPUS_ID
+
+
+class IncidentBatchRequest(BaseModel):
+    campus_id: str = DEFAULT_CAMPUS_ID
+    # Items are validated one by one so a bad record cannot fail the batch
+    incidents: List[Dict[str, Any]]
+
+
+def _incident_text(data: IncidentRequest) -> str:
+    text = f"{data.incident_type}. {data.description}"
+    if data.panic:
+        text = "EMERGENCY. " + text
+    return text
+
+
+def _decision_body(audit, explain: bool = True) -> dict:
+    # Explanations are rendered from a cached template only on request
+    return {
+        "risk_level": audit.risk_level,
+        "confidence": audit.confidence_level,
+        "decision": audit.final_decision,
+        "escalation_chain": audit.escalation_chain,
+        "explanation": audit.explain() if explain else None,
+        "duplicate_of": audit.duplicate_of,
+    }
+
+
+def _stage_body(stage: str, result) -> dict:
+    if stage == "intake":
+        return {
+            "incident_id": result.incident_id,
+            "timestamp": result.timestamp,
+            "location": result.location,
+            "incident_type": result.incident_type,
+            "source": result.source,
+            "confidence": result.confidence_level,
+        }
+    if stage == "risk":
+        return {
+            "risk_score": result.risk_score,
+            "risk_level": result.risk_level,
+            "reason": result.reason,
+            "zone": result.zone,
+        }
+    if stage == "response":
+        return {
+            "decision": result.recommended_action,
+            "priority": result.priority_level,
+            "escalation_chain": result.escalation_chain,
+            "duplicate_of": result.duplicate_of,
+        }
+    return {"config_version": result.config_version, **_decision_body(result)}
+
+
+def _client(request: Request) -> str:
+    # Per-source bucket key; behind a proxy this is the proxy's address,
+    # which then belongs in CAMPUS_ADMIT_TRUSTED_SOURCES
+    return request.client.host if request.client else "unknown"
+
+
+def _shed_response(exc: AdmissionRejected) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc), "reason": exc.reason},
+        headers={"Retry-After": str(max(1, int(exc.retry_after + 0.5)))}
+    )
+
+
+def _sse(event: str, body: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(body)}\n\n"
 
 
 @app.get("/")
@@ -35,27 +254,243 @@ def health_check():
     }
 
 
-@app.post("/api/report-incident")
-def report_incident(data: IncidentRequest):
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    if not METRICS.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(
+        METRICS.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
 
-    text = f"{data.incident_type}. {data.description}"
-    if data.panic:
-        text = "EMERGENCY. " + text
 
-    result = run_pipeline(
-        incident_text=text,
+@app.post("/api/report-incident")
+async def report_incident(data: IncidentRequest, request: Request, explain: bool = True):
+
+    payload = build_payload(
+        incident_text=_incident_text(data),
         location=data.location,
-        user_role=data.user_role
+        user_role=data.user_role,
+        panic=data.panic
     )
 
+    payload["campus_id"] = data.campus_id
+
+    # Queued on the campus's own queue; panic, critical keywords and
+    # zone tier decide the position and whether it may be shed
+    try:
+        future = await asyncio.to_thread(router.submit, data.campus_id, payload, _client(request))
+    except UnknownCampusError:
+        raise HTTPException(status_code=404, detail=f"Unknown campus: {data.campus_id}")
+    except AdmissionRejected as exc:
+        return _shed_response(exc)
+    except QueueFullError as exc:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(max(1, int(exc.retry_after + 0.5)))}
+        )
+
+    result = await asyncio.wrap_future(future)
+
     audit = result["final"]
 
     return {
         "campus": result["campus"],
-        "risk_level": audit.risk_level,
-        "confidence": audit.confidence_level,
-        "decision": audit.final_decision,
-        "escalation_chain": audit.escalation_chain,
-        "explanation": audit.explanation,
+        "config_version": result["config_version"],
+        **_decision_body(audit, explain),
         "emergency_contacts": result["emergency_contacts"]
     }
+
+
+@app.post("/api/report-incident/stream")
+async def report_incident_stream(data: IncidentRequest, request: Request):
+    """
+    Server-Sent Events: one event per agent stage as it completes,
+    so responders see the risk level before the audit is built.
+    """
+    payload = build_payload(
+        incident_text=_incident_text(data),
+        location=data.location,
+        user_role=data.user_role,
+        panic=data.panic
+    )
+    payload["campus_id"] = data.campus_id
+
+    try:
+        await asyncio.to_thread(router.admit, data.campus_id, payload, _client(request))
+    except UnknownCampusError:
+        raise HTTPException(status_code=404, detail=f"Unknown campus: {data.campus_id}")
+    except AdmissionRejected as exc:
+        return _shed_response(exc)
+
+    # Runs where the campus lives: in this process or in its shard. The
+    # pipeline does not depend on this client: if it disconnects, the
+    # report is still escalated, stored and audited.
+    stages = router.stream(data.campus_id, payload)
+
+    async def events():
+        info = {}
+        try:
+            while True:
+                step = await asyncio.to_thread(next, stages, None)
+                if step is None:
+                    break
+                stage, result = step
+                if stage == "campus":
+                    info = result
+                    yield _sse("campus", {
+                        "campus": info["campus"],
+                        "config_version": info["config_version"],
+                    })
+                else:
+                    yield _sse(stage, _stage_body(stage, result))
+        except Exception as exc:
+            yield _sse("error", {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        yield _sse("done", {"emergency_contacts": info.get("emergency_contacts")})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/api/report-incidents/batch")
+def report_incidents_batch(data: IncidentBatchRequest, request: Request, explain: bool = False):
+
+    indexes = []
+    payloads = []
+    invalid = {}
+    for index, raw in enumerate(data.incidents):
+        try:
+            item = IncidentRequest.model_validate(raw)
+        except ValidationError as exc:
+            invalid[index] = str(exc)
+            continue
+        payload = build_payload(
+            incident_text=_incident_text(item),
+            location=item.location,
+            user_role=item.user_role,
+            panic=item.panic
+        )
+        payload["campus_id"] = data.campus_id
+        indexes.append(index)
+        payloads.append(payload)
+
+    try:
+        # One source charge per batch; a shed item cannot fail the rest
+        rejected = router.admit_batch(data.campus_id, payloads, _client(request))
+        admitted = [(i, p) for i, p, exc in zip(indexes, payloads, rejected) if exc is None]
+        for index, exc in zip(indexes, rejected):
+            if exc is not None:
+                invalid[index] = str(exc)
+        info, processed = router.process_batch(data.campus_id, [p for _, p in admitted])
+    except UnknownCampusError:
+        raise HTTPException(status_code=404, detail=f"Unknown campus: {data.campus_id}")
+
+    results: List[dict] = [None] * len(data.incidents)
+    for index, error in invalid.items():
+        results[index] = {"index": index, "ok": False, "error": error}
+    for (index, _), item in zip(admitted, processed):
+        if item.ok:
+            results[index] = {"index": index, "ok": True, **_decision_body(item.result, explain)}
+        else:
+            results[index] = {"index": index, "ok": False, "error": item.error}
+
+    return {
+        "campus": info["campus"],
+        "config_version": info["config_version"],
+        "count": len(results),
+        "failed": sum(1 for r in results if not r["ok"]),
+        "results": results,
+        "emergency_contacts": info["emergency_contacts"]
+    }
+
+
+@app.get("/api/campuses")
+def list_campuses():
+    # memory_bytes is measured in the process (or shard) serving the campus
+    return {"shards": CAMPUS_SHARDS, "campuses": router.campuses()}
+
+
+@app.get("/api/admission")
+def admission_status():
+    if admission is None:
+        raise HTTPException(status_code=503, detail="Admission control is disabled")
+    return admission.stats()
+
+
+@app.get("/api/audit")
+def audit_status():
+    # `head` is what `python -m backend.verify_audit --expect-head` checks
+    if audit_log is None:
+        raise HTTPException(status_code=503, detail="Audit log is disabled")
+    return audit_log.stats()
+
+
+@app.get("/api/notifications")
+def notification_status():
+    if dispatcher is None:
+        raise HTTPException(status_code=503, detail="Escalation notifications are disabled")
+    return dispatcher.stats()
+
+
+@app.get("/api/stats")
+def incident_statistics(
+    window: str = Query("hour", description="hour (minute buckets) or day (hour buckets)"),
+    campus_id: Optional[str] = None,
+    zone: Optional[str] = None,
+    incident_type: Optional[str] = None,
+    risk_level: Optional[str] = None,
+    location: Optional[str] = Query(None, description="free-text location to estimate")
+):
+    # Served from in-memory rolling counters, cheap enough to poll
+    try:
+        stats = incident_stats.snapshot(
+            window,
+            campus_id=campus_id,
+            zone=zone,
+            incident_type=incident_type,
+            risk_level=risk_level
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    if location:
+        stats["location"] = {
+            "location": location,
+            "count": incident_stats.location_count(location, window),
+        }
+    return stats
+
+
+@app.get("/api/incidents")
+def list_incidents(
+    campus_id: Optional[str] = None,
+    location: Optional[str] = None,
+    incident_type: Optional[str] = None,
+    risk_level: Optional[str] = None,
+    since: Optional[str] = Query(None, description="ISO timestamp, inclusive"),
+    until: Optional[str] = Query(None, description="ISO timestamp, exclusive"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None
+):
+    if incident_store is None:
+        raise HTTPException(status_code=503, detail="Incident store is disabled")
+
+    try:
+        return incident_store.query(
+            campus_id=campus_id,
+            location=location,
+            incident_type=incident_type,
+            risk_level=risk_level,
+            since=since,
+            until=until,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as exc:
+        # Names the bad parameter: since, until or cursor
+        raise HTTPException(status_code=400, detail=str(exc))
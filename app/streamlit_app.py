@@ -1,8 +1,28 @@
 import streamlit as st
 from datetime import datetime
-import time
+import os
+import sys
+from time import perf_counter
 
-from core.coordinator import run_pipeline
+# `streamlit run app/streamlit_app.py` only puts app/ on sys.path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from backend import build_payload, get_coordinator  # noqa: E402
+from backend.core.coordinator import PIPELINE_STAGES  # noqa: E402
+
+
+@st.cache_resource
+def warm_coordinator():
+    # Streamlit reruns this script on every interaction; loading the
+    # campus once per process keeps config parsing off the submit path.
+    # Submits still go through get_coordinator() so config hot reloads
+    # are picked up.
+    return get_coordinator()
+
+
+warm_coordinator()
 
 # ================= PAGE CONFIG =================
 st.set_page_config(
@@ -154,23 +174,28 @@ with center:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.subheader("🧠 AI Agent Pipeline")
 
-        steps = ["Intake", "Risk", "Response", "Audit"]
+        # Progress is driven by the pipeline itself, one tick per agent
         progress = st.progress(0)
-        for i, step in enumerate(steps):
-            st.write(f"✔ {step} Agent")
-            progress.progress((i + 1) / len(steps))
-            time.sleep(0.3)
+        stage_log = st.empty()
+        finished = []
+        started = perf_counter()
 
-        st.markdown('</div>', unsafe_allow_html=True)
+        def on_stage(stage, _result):
+            finished.append(f"✔ {stage.title()} Agent ({(perf_counter() - started) * 1000:.1f} ms)")
+            stage_log.markdown("  \n".join(finished))
+            progress.progress(len(finished) / len(PIPELINE_STAGES))
 
-        result = run_pipeline(
+        coordinator = get_coordinator()
+        payload = build_payload(
             incident_text=text,
             location=location,
-            user_role=role
+            user_role=role,
+            panic=panic
         )
+        audit = coordinator.process_incident(payload, progress=on_stage)
+        contacts = coordinator.config_loader.get_emergency_contacts()
 
-        audit = result["final"]
-        contacts = result["emergency_contacts"]
+        st.markdown('</div>', unsafe_allow_html=True)
 
         risk_class = "low"
         if audit.risk_level == "High":
@@ -206,7 +231,7 @@ with right:
         st.markdown('</div>', unsafe_allow_html=True)
 
         with st.expander("🧾 Investigation Notes"):
-            st.write(audit.explanation)
+            st.write(audit.explain())
 
 # ================= FOOTER =================
 st.caption(
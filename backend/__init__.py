@@ -0,0 +1,40 @@
+"""
+Campus safety AI core: the one import surface for the API, the
+Streamlit console and scripts.
+
+    from backend import get_coordinator, run_pipeline
+
+Names resolve on first access, so `import backend` is free and each
+entry point only pays for the parts it uses.
+"""
+import importlib
+
+_EXPORTS = {
+    "CoordinatorAgent": "backend.core.coordinator",
+    "add_escalation_sink": "backend.core.coordinator",
+    "add_sink": "backend.core.coordinator",
+    "build_payload": "backend.core.coordinator",
+    "get_coordinator": "backend.core.coordinator",
+    "remove_escalation_sink": "backend.core.coordinator",
+    "remove_sink": "backend.core.coordinator",
+    "run_payload": "backend.core.coordinator",
+    "run_pipeline": "backend.core.coordinator",
+    "run_pipeline_async": "backend.core.coordinator",
+    "CampusConfigLoader": "backend.core.config_loader",
+    "ConfigValidationError": "backend.core.config_schema",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'backend' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,5 +1,18 @@
-from dataclasses import dataclass
-from typing import Any, List
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+
+@dataclass(frozen=True)
+class ExplanationTemplate:
+    """
+    Pre-rendered explanation text around the only per-incident part,
+    the location. Shared by every incident with the same decision.
+    """
+    head: str
+    tail: str
+
+    def render(self, location: str) -> str:
+        return f"{self.head}{location}{self.tail}"
 
 
 @dataclass
@@ -8,7 +21,21 @@ class AuditResult:
     risk_level: str
     confidence_level: str
     escalation_chain: List[str]
-    explanation: str
+    explanation: Optional[str] = None
+    config_version: str = ""
+    duplicate_of: Optional[str] = None
+    location: str = ""
+    explanation_template: Optional[ExplanationTemplate] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def explain(self) -> str:
+        """
+        Renders the explanation on first use; most callers never need it.
+        """
+        if self.explanation is None and self.explanation_template is not None:
+            self.explanation = self.explanation_template.render(self.location)
+        return self.explanation or ""
 
 
 class TrustAuditAgent:
@@ -27,27 +54,43 @@ class TrustAuditAgent:
         incident_result: Any,
         risk_result: Any,
         response_result: Any,
-        campus_config: dict
+        campus_config: dict,
+        template: Optional[ExplanationTemplate] = None
     ) -> AuditResult:
 
-        governance = campus_config.get("governance", {})
-
-        explanation = (
-            f"Incident '{incident_result.incident_type}' was reported at "
-            f"'{incident_result.location}'. "
-            f"The system assessed the risk as '{risk_result.risk_level}' based on "
-            f"campus-defined risk zones, operating hours, and input confidence. "
-            f"According to university safety policy, the following authorities "
-            f"are responsible for handling this incident: "
-            f"{', '.join(response_result.escalation_chain)}. "
-            f"Final responsibility and action remain with designated "
-            f"university officials and emergency responders."
-        )
+        if template is None:
+            template = self.explanation_template(
+                incident_result.incident_type,
+                risk_result.risk_level,
+                response_result.escalation_chain
+            )
 
         return AuditResult(
             final_decision=response_result.recommended_action,
             risk_level=risk_result.risk_level,
             confidence_level=incident_result.confidence_level,
             escalation_chain=response_result.escalation_chain,
-            explanation=explanation
+            duplicate_of=getattr(response_result, "duplicate_of", None),
+            location=incident_result.location,
+            explanation_template=template
+        )
+
+    def explanation_template(
+        self,
+        incident_type: str,
+        risk_level: str,
+        escalation_chain: List[str]
+    ) -> ExplanationTemplate:
+        return ExplanationTemplate(
+            head=f"Incident '{incident_type}' was reported at '",
+            tail=(
+                f"'. "
+                f"The system assessed the risk as '{risk_level}' based on "
+                f"campus-defined risk zones, operating hours, and input confidence. "
+                f"According to university safety policy, the following authorities "
+                f"are responsible for handling this incident: "
+                f"{', '.join(escalation_chain)}. "
+                f"Final responsibility and action remain with designated "
+                f"university officials and emergency responders."
+            )
         )
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, Any
-import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+import os
+
+from backend.core.keyword_matcher import KeywordFeatures, KeywordMatcher
 
 
 @dataclass
@@ -15,6 +17,7 @@ class IncidentResult:
     confidence_level: str
     anonymous: bool
     raw_payload: Dict[str, Any]
+    features: Optional[KeywordFeatures] = None
 
 
 class IncidentIntakeAgent:
@@ -31,7 +34,9 @@ class IncidentIntakeAgent:
     def handle_incident(
         self,
         payload: Dict[str, Any],
-        campus_config: dict
+        campus_config: dict,
+        matcher: Optional[KeywordMatcher] = None,
+        features: Optional[KeywordFeatures] = None
     ) -> IncidentResult:
 
         privacy = campus_config.get("privacy_rules", {})
@@ -39,10 +44,17 @@ class IncidentIntakeAgent:
 
         anonymous = payload.get("anonymous", False) and anonymous_allowed
 
-        incident_id = f"INC_{uuid.uuid4().hex[:8].upper()}"
-        timestamp = datetime.utcnow().isoformat()
+        # Same 8 random hex digits uuid4 gave, without importing uuid/platform
+        incident_id = f"INC_{os.urandom(4).hex().upper()}"
+        timestamp = self._incident_timestamp(payload.get("timestamp"))
+
+        # Single keyword pass, shared with the risk stage via `features`;
+        # skipped when the ingestion queue already scanned the text
+        if features is None:
+            matcher = matcher or KeywordMatcher.from_config(campus_config)
+            features = matcher.extract(payload.get("description", ""))
 
-        incident_type = self._classify_incident(payload)
+        incident_type = self._classify_incident(features)
         confidence = self._assign_confidence(payload.get("source", ""))
 
         source = "Anonymous" if anonymous else payload.get("source", "Unknown")
@@ -56,26 +68,18 @@ class IncidentIntakeAgent:
             description=payload.get("description", ""),
             confidence_level=confidence,
             anonymous=anonymous,
-            raw_payload=payload
+            raw_payload=payload,
+            features=features
         )
 
     # ---------------- INTERNAL HELPERS ----------------
 
-    def _classify_incident(self, payload: Dict[str, Any]) -> str:
-        text = payload.get("description", "").lower()
+    def _incident_timestamp(self, value: Any) -> str:
+        return incident_time(value).isoformat()
 
-        if any(w in text for w in ["fire", "smoke", "burn"]):
-            return "Fire"
-        if any(w in text for w in ["medical", "fainted", "injured"]):
-            return "Medical Emergency"
-        if any(w in text for w in ["follow", "harass", "stalk"]):
-            return "Harassment"
-        if any(w in text for w in ["theft", "stolen"]):
-            return "Theft"
-        if any(w in text for w in ["lab", "chemical"]):
-            return "Lab Hazard"
-
-        return "General Incident"
+    def _classify_incident(self, features: KeywordFeatures) -> str:
+        # Priority order comes from the campus keyword config
+        return features.incident_type
 
     def _assign_confidence(self, source: str) -> str:
         source = source.lower()
@@ -88,3 +92,20 @@ class IncidentIntakeAgent:
             return "Low"
 
         return "Low"
+
+
+def incident_time(value: Any) -> datetime:
+    """
+    When an incident happened, as naive UTC. Replayed sensor logs
+    carry their own event time; live reports are stamped on arrival.
+    """
+    if value:
+        try:
+            moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            moment = None
+        if moment is not None:
+            if moment.tzinfo is not None:
+                moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+            return moment
+    return datetime.utcnow()
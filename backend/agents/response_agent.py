@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, List, Optional
 
 
 @dataclass
@@ -7,6 +7,27 @@ class ResponseResult:
     recommended_action: str
     priority_level: str
     escalation_chain: List[str]
+    duplicate_of: Optional[str] = None
+
+
+def policy_key_for(incident_type: str) -> Optional[str]:
+    """
+    Maps an incident type onto its `incident_policies` key.
+    """
+    incident_type = incident_type.lower()
+
+    # Normalize mapping
+    if "fire" in incident_type:
+        return "fire"
+    if "harass" in incident_type:
+        return "harassment"
+    if "medical" in incident_type:
+        return "medical"
+    if "unauthorized" in incident_type or "theft" in incident_type:
+        return "theft"
+    if "lab" in incident_type:
+        return "lab_hazard"
+    return None
 
 
 class ResponsePlanningAgent:
@@ -29,23 +50,8 @@ class ResponsePlanningAgent:
         # -------------------------
         # Determine incident category
         # -------------------------
-        incident_type = incident_result.incident_type.lower()
-
         policy_map = campus_config.get("incident_policies", {})
-
-        # Normalize mapping
-        if "fire" in incident_type:
-            policy_key = "fire"
-        elif "harass" in incident_type:
-            policy_key = "harassment"
-        elif "medical" in incident_type:
-            policy_key = "medical"
-        elif "unauthorized" in incident_type or "theft" in incident_type:
-            policy_key = "theft"
-        elif "lab" in incident_type:
-            policy_key = "lab_hazard"
-        else:
-            policy_key = None
+        policy_key = policy_key_for(incident_result.incident_type)
 
         escalation_chain = policy_map.get(policy_key, [])
 
@@ -1,6 +1,21 @@
 from dataclasses import dataclass
-from typing import Any
-from datetime import datetime
+from typing import Any, Optional
+from datetime import datetime, timezone
+
+from backend.core.keyword_matcher import KeywordMatcher
+from backend.core.zone_activity import ZoneActivity
+from backend.core.zone_index import ZoneIndex
+
+
+# Scoring weights; the vectorized batch scorer shares these
+CRITICAL_SCORE = 9
+TIER_POINTS = {"high": 3, "medium": 2, "low": 1}
+NIGHT_POINTS = 2
+CONFIDENCE_POINTS = {"High": 2, "Medium": 1}
+# Minimum score for each level, highest first
+LEVEL_THRESHOLDS = (("High", 7), ("Medium", 4))
+# Every level, lowest first
+RISK_LEVELS = ("Low",) + tuple(level for level, _ in reversed(LEVEL_THRESHOLDS))
 
 
 @dataclass
@@ -8,6 +23,22 @@ class RiskResult:
     risk_score: int
     risk_level: str
     reason: str
+    zone: Optional[str] = None
+    zone_tier: str = "low"
+
+
+@dataclass(frozen=True)
+class RiskFeatures:
+    """
+    Normalized inputs the risk score depends on.
+    """
+    critical: bool
+    zone: Optional[str]
+    zone_tier: str
+    night: bool
+    confidence_level: str
+    # Extra points from recent incidents in the same zone
+    activity_boost: int = 0
 
 
 class RiskEvaluationAgent:
@@ -21,25 +52,70 @@ class RiskEvaluationAgent:
     def __init__(self, agent_name: str = "RiskEvaluationAgent"):
         self.agent_name = agent_name
 
-    def evaluate_risk(self, incident_result: Any, campus_config: dict) -> RiskResult:
-        description = incident_result.description.lower()
+    def evaluate_risk(
+        self,
+        incident_result: Any,
+        campus_config: dict,
+        matcher: Optional[KeywordMatcher] = None,
+        zone_index: Optional[ZoneIndex] = None,
+        activity: Optional[ZoneActivity] = None
+    ) -> RiskResult:
+        features = self.extract_features(
+            incident_result,
+            campus_config,
+            matcher=matcher,
+            zone_index=zone_index,
+            activity=activity
+        )
+        return self.score_features(features)
+
+    def extract_features(
+        self,
+        incident_result: Any,
+        campus_config: dict,
+        matcher: Optional[KeywordMatcher] = None,
+        zone_index: Optional[ZoneIndex] = None,
+        activity: Optional[ZoneActivity] = None
+    ) -> RiskFeatures:
+        """
+        When `activity` is given the incident is also recorded there,
+        and the zone's prior activity becomes `activity_boost`.
+        """
+        # Reuse the intake scan; only rescan for hand-built results
+        keywords = getattr(incident_result, "features", None)
+        if keywords is None:
+            matcher = matcher or KeywordMatcher.from_config(campus_config)
+            keywords = matcher.extract(incident_result.description)
+
+        zone_index = zone_index or ZoneIndex.from_config(campus_config)
+        moment = _incident_time(incident_result.timestamp)
+        incident_hour = moment.hour if moment is not None else None
+        zone = zone_index.resolve(incident_result.location, incident_hour)
+
+        boost = 0
+        if activity is not None:
+            boost = activity.observe(zone.zone, _epoch_seconds(moment))
+
+        return RiskFeatures(
+            critical=keywords.critical,
+            zone=zone.zone,
+            zone_tier=zone.tier,
+            night=zone_index.is_night(incident_hour),
+            confidence_level=incident_result.confidence_level,
+            activity_boost=boost
+        )
 
+    def score_features(self, features: RiskFeatures) -> RiskResult:
         # -------------------------------------------------
         # 🔴 SAFETY-FIRST OVERRIDE (GLOBAL)
         # -------------------------------------------------
-        critical_keywords = [
-            "fire", "smoke", "burn",
-            "fainted", "unconscious", "medical", "bleeding",
-            "ambulance", "help",
-            "following", "stalking", "harassment",
-            "attack", "assault"
-        ]
-
-        if any(word in description for word in critical_keywords):
+        if features.critical:
             return RiskResult(
-                risk_score=9,
+                risk_score=CRITICAL_SCORE,
                 risk_level="High",
-                reason="Critical safety keywords detected requiring immediate action"
+                reason="Critical safety keywords detected requiring immediate action",
+                zone=features.zone,
+                zone_tier=features.zone_tier
             )
 
         # -------------------------------------------------
@@ -48,53 +124,55 @@ class RiskEvaluationAgent:
         score = 0
         reasons = []
 
-        # 1️⃣ Risk zone sensitivity (CONFIG)
-        risk_zones = campus_config.get("risk_zones", {})
-        location = incident_result.location.lower()
-
-        if any(zone.lower() in location for zone in risk_zones.get("high", [])):
-            score += 3
-            reasons.append("Incident occurred in a high-risk campus zone")
-        elif any(zone.lower() in location for zone in risk_zones.get("medium", [])):
-            score += 2
-            reasons.append("Incident occurred in a medium-risk campus zone")
-        else:
-            score += 1
-            reasons.append("Incident occurred in a low-risk campus zone")
+        # 1️⃣ Risk zone sensitivity (CONFIG, precompiled at load)
+        tier = features.zone_tier if features.zone_tier in TIER_POINTS else "low"
+        score += TIER_POINTS[tier]
+        reasons.append(f"Incident occurred in a {tier}-risk campus zone")
 
         # 2️⃣ Time-based risk (CONFIG)
-        campus_hours = campus_config["campus"]["operating_hours"]
-        night_start = int(campus_hours["night_start"].split(":")[0])
-
-        try:
-            incident_hour = int(incident_result.timestamp[11:13])
-            if incident_hour >= night_start:
-                score += 2
-                reasons.append("Incident occurred during campus night hours")
-        except Exception:
-            pass
+        if features.night:
+            score += NIGHT_POINTS
+            reasons.append("Incident occurred during campus night hours")
 
         # 3️⃣ Input confidence (STANDARDIZED)
-        if incident_result.confidence_level == "High":
-            score += 2
-            reasons.append("High confidence incident source")
-        elif incident_result.confidence_level == "Medium":
-            score += 1
-            reasons.append("Medium confidence incident source")
+        if features.confidence_level in CONFIDENCE_POINTS:
+            score += CONFIDENCE_POINTS[features.confidence_level]
+            reasons.append(f"{features.confidence_level} confidence incident source")
+
+        # 4️⃣ Recent activity in the same zone (INCREMENTAL)
+        if features.activity_boost:
+            score += features.activity_boost
+            reasons.append("Repeated recent incidents reported in this zone")
 
         # -------------------------------------------------
         # 🔢 SCORE → RISK LEVEL (STANDARD)
         # -------------------------------------------------
-        if score >= 7:
-            risk_level = "High"
-        elif score >= 4:
-            risk_level = "Medium"
-        else:
-            risk_level = "Low"
+        risk_level = "Low"
+        for level, minimum in LEVEL_THRESHOLDS:
+            if score >= minimum:
+                risk_level = level
+                break
 
         return RiskResult(
             risk_score=score,
             risk_level=risk_level,
-            reason="; ".join(reasons)
+            reason="; ".join(reasons),
+            zone=features.zone,
+            zone_tier=features.zone_tier
         )
 
+
+def _incident_time(timestamp: str) -> Optional[datetime]:
+    # Intake timestamps are naive UTC
+    try:
+        return datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+
+
+def _epoch_seconds(moment: Optional[datetime]) -> float:
+    if moment is None:
+        return datetime.now(timezone.utc).timestamp()
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
@@ -0,0 +1,378 @@
+"""
+HTTP load test: starts the API locally (or targets --url), drives the
+report endpoints with a seeded, realistic incident mix and fails when
+latency, error rate or throughput cross the stored thresholds.
+
+    python -m backend.benchmarks.load --concurrency 32 --duration 30
+    python -m backend.benchmarks.load --mix report=80,stream=10,batch=10 --out load.json
+    python -m backend.benchmarks.load --url http://staging:8000 --thresholds ""
+
+Reports use the same schema as backend.benchmarks.run, so its
+--compare gate also works on them. Exit status is 1 when a threshold
+is crossed and 2 when the server cannot be started.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from time import perf_counter_ns
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from backend.benchmarks.run import build_report, percentile
+from backend.benchmarks.startup import REPO_ROOT, _child_env
+from backend.benchmarks.synthetic import SyntheticIncidentGenerator
+from backend.core.config_loader import CampusConfigLoader
+from backend.core.coordinator import DEFAULT_CAMPUS_CONFIG
+from backend.core.transports import HttpConnectionPool
+
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "load_thresholds.json")
+
+# Endpoint name -> path; the name keys the mix, results and thresholds
+ENDPOINTS = {
+    "report": "/api/report-incident",
+    "stream": "/api/report-incident/stream",
+    "batch": "/api/report-incidents/batch",
+}
+DEFAULT_MIX = "report=90,stream=5,batch=5"
+
+# The local API's stderr, in its data directory
+SERVER_LOG = "server.log"
+
+# Share of reports sent with the panic flag
+PANIC_RATIO = 0.02
+
+# Threshold -> (result field, divisor to the threshold's unit, bound)
+THRESHOLD_CHECKS = {
+    "max_p50_ms": ("p50_us", 1e3, "max"),
+    "max_p95_ms": ("p95_us", 1e3, "max"),
+    "max_p99_ms": ("p99_us", 1e3, "max"),
+    "max_error_rate": ("error_rate", 1.0, "max"),
+    "min_rps": ("ops_per_sec", 1.0, "min"),
+}
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}' in mix; expected {', '.join(ENDPOINTS)}")
+        mix[name] = int(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("The mix needs at least one endpoint with a positive weight")
+    return mix
+
+
+class RequestMix:
+    """
+    Seeded stream of (endpoint, body) pairs: synthetic incidents from
+    the campus config, spread over the endpoints by weight.
+    """
+
+    def __init__(self, campus_config: dict, mix: Dict[str, int], seed: int = 7, batch_size: int = 20):
+        self.random = random.Random(seed)
+        self.mix = mix
+        self.batch_size = batch_size
+        self._payloads = SyntheticIncidentGenerator(campus_config, seed=seed).iter_payloads(10 ** 9)
+
+    def __iter__(self) -> Iterator[Tuple[str, dict]]:
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        while True:
+            endpoint = self.random.choices(names, weights)[0]
+            if endpoint == "batch":
+                yield endpoint, {"incidents": [self._incident() for _ in range(self.batch_size)]}
+            else:
+                yield endpoint, self._incident()
+
+    def _incident(self) -> dict:
+        payload = next(self._payloads)
+        return {
+            "incident_type": "Report",
+            "description": payload["description"],
+            "location": payload["location"],
+            "user_role": payload["source"],
+            "panic": self.random.random() < PANIC_RATIO,
+        }
+
+
+def summarize_load(latencies_ns: List[int], errors: int, requests: int, elapsed_s: float) -> Dict[str, float]:
+    """
+    Latency over every answered request, errors over every request sent.
+    """
+    ordered = sorted(latencies_ns)
+    return {
+        "samples": requests,
+        "ops_per_sec": round(requests / elapsed_s, 1) if elapsed_s else 0.0,
+        "mean_us": round(sum(ordered) / len(ordered) / 1e3, 2) if ordered else 0.0,
+        "p50_us": round(percentile(ordered, 0.50) / 1e3, 2),
+        "p95_us": round(percentile(ordered, 0.95) / 1e3, 2),
+        "p99_us": round(percentile(ordered, 0.99) / 1e3, 2),
+        "error_rate": round(errors / requests, 4) if requests else 0.0,
+    }
+
+
+async def _drive(
+    base_url: str,
+    requests: Iterator[Tuple[str, dict]],
+    concurrency: int,
+    duration: Optional[float],
+    total: Optional[int]
+):
+    pool = HttpConnectionPool(max_connections=concurrency)
+    latencies: Dict[str, List[int]] = {name: [] for name in ENDPOINTS}
+    sent: Counter = Counter()
+    failed: Counter = Counter()
+    statuses: Counter = Counter()
+    deadline = time.monotonic() + duration if duration else None
+    issued = 0
+
+    async def worker():
+        nonlocal issued
+        while (total is None or issued < total) and (deadline is None or time.monotonic() < deadline):
+            issued += 1
+            endpoint, body = next(requests)
+            data = json.dumps(body).encode("utf-8")
+            sent[endpoint] += 1
+            started = perf_counter_ns()
+            try:
+                status, _ = await pool.request(
+                    "POST", base_url + ENDPOINTS[endpoint], data, {"Content-Type": "application/json"}
+                )
+            except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+                failed[endpoint] += 1
+                statuses[type(exc).__name__] += 1
+                continue
+            latencies[endpoint].append(perf_counter_ns() - started)
+            statuses[str(status)] += 1
+            if not 200 <= status < 300:
+                failed[endpoint] += 1
+
+    started = time.monotonic()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.monotonic() - started
+    await pool.close()
+    return latencies, sent, failed, statuses, elapsed
+
+
+def run_load(
+    base_url: str,
+    campus_config: dict,
+    concurrency: int = 16,
+    duration: Optional[float] = 10.0,
+    total: Optional[int] = None,
+    mix: Optional[Dict[str, int]] = None,
+    seed: int = 7,
+    batch_size: int = 20
+) -> Tuple[Dict[str, Dict[str, float]], Dict[str, int]]:
+    """
+    Closed-loop load: `concurrency` clients each send their next
+    request as soon as the last one is answered, until `duration`
+    seconds or `total` requests. Returns (results, status counts).
+    """
+    requests = iter(RequestMix(campus_config, mix or parse_mix(DEFAULT_MIX), seed, batch_size))
+    latencies, sent, failed, statuses, elapsed = asyncio.run(
+        _drive(base_url.rstrip("/"), requests, concurrency, duration, total)
+    )
+
+    results = {}
+    for name in ENDPOINTS:
+        if sent[name]:
+            results[f"load.{name}"] = summarize_load(latencies[name], failed[name], sent[name], elapsed)
+    results["load.all"] = summarize_load(
+        [ns for values in latencies.values() for ns in values],
+        sum(failed.values()),
+        sum(sent.values()),
+        elapsed
+    )
+    return results, dict(statuses)
+
+
+def check_thresholds(results: Dict[str, Dict[str, float]], thresholds: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    One message per crossed threshold. Keys are result names without
+    the "load." prefix ("all", "report", ...).
+    """
+    violations = []
+    for name, limits in thresholds.items():
+        figures = results.get(f"load.{name}")
+        if figures is None:
+            continue
+        for check, limit in limits.items():
+            if check not in THRESHOLD_CHECKS:
+                raise ValueError(f"Unknown load threshold '{check}' for '{name}'")
+            field, scale, bound = THRESHOLD_CHECKS[check]
+            value = figures[field] / scale
+            if (value > limit) if bound == "max" else (value < limit):
+                violations.append(f"{name}: {check} is {limit:g}, measured {value:g}")
+    return violations
+
+
+# ---------------- LOCAL SERVER ----------------
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_log_tail(data_dir: str, limit: int = 2000) -> str:
+    """
+    The end of the local API's stderr, kept in `data_dir`.
+    """
+    try:
+        with open(os.path.join(data_dir, SERVER_LOG), "rb") as f:
+            f.seek(max(0, f.seek(0, os.SEEK_END) - limit))
+            return f.read().decode("utf-8", "replace")
+    except OSError:
+        return ""
+
+
+def start_server(data_dir: str, workers: int = 1, admission: bool = False, timeout: float = 30.0):
+    """
+    Starts api.app under uvicorn with its data files in `data_dir`.
+    Returns (process, base_url); raises RuntimeError if it never answers.
+    """
+    port = _free_port()
+    env = _child_env()
+    # Real persistence, so fsync and SQLite costs are part of the figures
+    env["CAMPUS_INCIDENT_DB"] = os.path.join(data_dir, "incidents.db")
+    env["CAMPUS_NOTIFY_OUTBOX"] = os.path.join(data_dir, "notifications.db")
+    env["CAMPUS_AUDIT_LOG"] = os.path.join(data_dir, "audit.log")
+    if admission:
+        # Every request comes from this one address, so it is a gateway
+        # with its own budget; the global and location limits still apply
+        env["CAMPUS_ADMIT_TRUSTED_SOURCES"] = "127.0.0.1=100000/100000"
+    else:
+        # Capacity runs go past the global admission rate on purpose
+        env["CAMPUS_ADMIT_RATE"] = "0"
+
+    # A file, not a pipe: overload makes the server log a fallback
+    # warning per stage, and a full pipe nobody reads would stall it
+    with open(os.path.join(data_dir, SERVER_LOG), "wb") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "api.app:app", "--host", "127.0.0.1",
+             "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+            cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=log
+        )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"API exited during startup:\n{server_log_tail(data_dir)}")
+        try:
+            with urllib.request.urlopen(base_url + "/", timeout=1) as response:
+                if response.status == 200:
+                    return process, base_url
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+    stop_server(process)
+    raise RuntimeError(
+        f"API did not answer on {base_url} within {timeout:.0f}s:\n{server_log_tail(data_dir)}"
+    )
+
+
+def stop_server(process: subprocess.Popen):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Campus safety API load test")
+    parser.add_argument("--url", help="Target a running API instead of starting one")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of load")
+    parser.add_argument("--requests", type=int, help="Stop after this many requests instead")
+    parser.add_argument("--warmup", type=int, default=50, help="Requests sent before measuring")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Endpoint weights, e.g. report=90,batch=10")
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--config", default=DEFAULT_CAMPUS_CONFIG, help="Campus config the incidents are drawn from")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the local API")
+    parser.add_argument("--admission", action="store_true", help="Keep admission control on in the local API")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS, help="JSON thresholds file; empty to skip")
+    parser.add_argument("--out", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    campus_config = CampusConfigLoader(args.config).get_full_config()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        process = None
+        base_url = args.url
+        if base_url is None:
+            try:
+                process, base_url = start_server(data_dir, args.workers, args.admission)
+            except (OSError, RuntimeError) as exc:
+                print(f"could not start the API: {exc}", file=sys.stderr)
+                return 2
+        try:
+            if args.warmup:
+                run_load(base_url, campus_config, args.concurrency, None, args.warmup, mix, args.seed + 1)
+            duration = None if args.requests else args.duration
+            results, statuses = run_load(
+                base_url, campus_config, args.concurrency, duration, args.requests,
+                mix, args.seed, args.batch_size
+            )
+        except BaseException:
+            if process is not None:
+                print(f"API log:\n{server_log_tail(data_dir)}", file=sys.stderr)
+            raise
+        finally:
+            if process is not None:
+                stop_server(process)
+        if process is not None and any(
+            status.startswith("5") or not status.isdigit() for status in statuses
+        ):
+            print(f"API log:\n{server_log_tail(data_dir)}", file=sys.stderr)
+
+    for name, figures in results.items():
+        print(
+            f"{name:16} {figures['ops_per_sec']:>9,.1f} req/s  "
+            f"p50 {figures['p50_us'] / 1e3:>8.1f}ms  p95 {figures['p95_us'] / 1e3:>8.1f}ms  "
+            f"p99 {figures['p99_us'] / 1e3:>8.1f}ms  errors {figures['error_rate']:.2%}"
+        )
+    print(f"statuses: {statuses}")
+
+    violations = []
+    if args.thresholds:
+        with open(args.thresholds, encoding="utf-8") as f:
+            violations = check_thresholds(results, json.load(f))
+        for violation in violations:
+            print(f"THRESHOLD {violation}")
+
+    if args.out:
+        report = build_report(
+            results,
+            target=args.url or "local",
+            concurrency=args.concurrency,
+            duration_s=args.duration if not args.requests else None,
+            requests=args.requests,
+            mix=mix,
+            seed=args.seed,
+            statuses=statuses,
+            threshold_violations=violations
+        )
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(json.dumps(report, indent=2) + "\n")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
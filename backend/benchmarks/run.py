@@ -0,0 +1,248 @@
+"""
+Offline benchmark harness.
+
+    python -m backend.benchmarks.run --count 5000 --out bench.json
+    python -m backend.benchmarks.run --compare old.json new.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional
+
+from backend.benchmarks.synthetic import SyntheticIncidentGenerator
+from backend.core.batch_scoring import BatchRiskScorer
+from backend.core.config_loader import CampusConfigLoader
+from backend.core.coordinator import DEFAULT_CAMPUS_CONFIG, CoordinatorAgent
+from backend.core.correlation import IncidentCorrelator
+from backend.core.zone_activity import ZoneActivity
+
+SCHEMA_VERSION = 1
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples_ns: List[int], items_per_sample: int = 1) -> Dict[str, float]:
+    """
+    Latency figures are per call; throughput counts incidents, so a
+    batch call of 100 items contributes 100 to ops_per_sec.
+    """
+    ordered = sorted(samples_ns)
+    total_s = sum(ordered) / 1e9
+    return {
+        "samples": len(ordered),
+        "ops_per_sec": round(len(ordered) * items_per_sample / total_s, 1) if total_s else 0.0,
+        "mean_us": round(sum(ordered) / len(ordered) / 1e3, 2) if ordered else 0.0,
+        "p50_us": round(percentile(ordered, 0.50) / 1e3, 2),
+        "p99_us": round(percentile(ordered, 0.99) / 1e3, 2),
+    }
+
+
+def measure(calls: List[Callable[[], object]], warmup: int = 50) -> List[int]:
+    for call in calls[:warmup]:
+        call()
+    samples = []
+    for call in calls:
+        started = perf_counter_ns()
+        call()
+        samples.append(perf_counter_ns() - started)
+    return samples
+
+
+def run_benchmarks(
+    config_path: str = DEFAULT_CAMPUS_CONFIG,
+    count: int = 5000,
+    seed: int = 7,
+    batch_size: int = 100,
+    config_loads: int = 200
+) -> Dict[str, Dict[str, float]]:
+    coordinator = CoordinatorAgent(campus_config_path=config_path)
+    config = coordinator.campus_config
+    matcher = coordinator.keyword_matcher
+    zone_index = coordinator.zone_index
+
+    payloads = SyntheticIncidentGenerator(config, seed=seed).generate(count)
+    results: Dict[str, Dict[str, float]] = {}
+
+    results["config_load"] = summarize(measure(
+        [lambda: CampusConfigLoader(config_path)] * config_loads, warmup=5
+    ))
+
+    # Per-agent figures reuse upstream outputs so each stage is isolated
+    intake = coordinator.intake_agent
+    intakes = [intake.handle_incident(p, campus_config=config, matcher=matcher) for p in payloads]
+    results["agent.intake"] = summarize(measure([
+        (lambda p=p: intake.handle_incident(p, campus_config=config, matcher=matcher))
+        for p in payloads
+    ]))
+
+    risk = coordinator.risk_agent
+    risks = [
+        risk.evaluate_risk(i, campus_config=config, matcher=matcher, zone_index=zone_index)
+        for i in intakes
+    ]
+    results["agent.risk"] = summarize(measure([
+        (lambda i=i: risk.evaluate_risk(
+            i, campus_config=config, matcher=matcher, zone_index=zone_index
+        ))
+        for i in intakes
+    ]))
+
+    response = coordinator.response_agent
+    responses = [response.plan_response(i, r, campus_config=config) for i, r in zip(intakes, risks)]
+    results["agent.response"] = summarize(measure([
+        (lambda i=i, r=r: response.plan_response(i, r, campus_config=config))
+        for i, r in zip(intakes, risks)
+    ]))
+
+    audit = coordinator.audit_agent
+    results["agent.audit"] = summarize(measure([
+        (lambda i=i, r=r, s=s: audit.audit_decision(i, r, s, campus_config=config))
+        for i, r, s in zip(intakes, risks, responses)
+    ]))
+
+    try:
+        scorer = BatchRiskScorer(zone_index, matcher)
+    except ImportError:
+        scorer = None
+    if scorer is not None:
+        # Whole-list re-scoring, as a backtest would run it
+        results[f"scoring.batch[{len(intakes)}]"] = summarize(
+            measure([lambda: scorer.score_incidents(intakes)] * 20, warmup=2),
+            items_per_sample=len(intakes)
+        )
+
+    results["pipeline.process_incident"] = summarize(measure([
+        (lambda p=p: coordinator.process_incident(p)) for p in payloads
+    ]))
+
+    correlated = CoordinatorAgent(
+        config_loader=coordinator.config_loader,
+        correlator=IncidentCorrelator()
+    )
+    results["pipeline.process_incident+correlation"] = summarize(measure([
+        (lambda p=p: correlated.process_incident(p)) for p in payloads
+    ]))
+
+    active = CoordinatorAgent(
+        config_loader=coordinator.config_loader,
+        zone_activity=ZoneActivity()
+    )
+    results["pipeline.process_incident+zone_activity"] = summarize(measure([
+        (lambda p=p: active.process_incident(p)) for p in payloads
+    ]))
+
+    batches = [payloads[i:i + batch_size] for i in range(0, len(payloads), batch_size)]
+    results[f"pipeline.process_batch[{batch_size}]"] = summarize(
+        measure([(lambda b=b: coordinator.process_batch(b)) for b in batches], warmup=2),
+        items_per_sample=batch_size
+    )
+
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_report(results: Dict[str, Dict[str, float]], **meta) -> dict:
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            **meta,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> List[str]:
+    """
+    Returns the names of benchmarks whose p50 regressed beyond tolerance.
+    """
+    regressions = []
+    print(f"{'benchmark':45} {'p50 base':>10} {'p50 now':>10} {'delta':>8}")
+    for name, now in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or not base["p50_us"]:
+            print(f"{name:45} {'-':>10} {now['p50_us']:>10} {'new':>8}")
+            continue
+        delta = now["p50_us"] / base["p50_us"] - 1.0
+        flag = ""
+        if delta > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:45} {base['p50_us']:>10} {now['p50_us']:>10} {delta:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Campus safety pipeline benchmarks")
+    parser.add_argument("--config", default=DEFAULT_CAMPUS_CONFIG)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--out", help="write the JSON report here")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"))
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            current = json.load(f)
+        return 1 if compare(baseline, current, args.tolerance) else 0
+
+    started = time.perf_counter()
+    results = run_benchmarks(
+        config_path=args.config,
+        count=args.count,
+        seed=args.seed,
+        batch_size=args.batch_size
+    )
+    report = build_report(
+        results,
+        config=args.config,
+        count=args.count,
+        seed=args.seed,
+        duration_s=round(time.perf_counter() - started, 2)
+    )
+
+    for name, figures in results.items():
+        print(
+            f"{name:45} {figures['ops_per_sec']:>12,.0f} ops/s  "
+            f"p50 {figures['p50_us']:>9.1f}us  p99 {figures['p99_us']:>9.1f}us"
+        )
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    elif not sys.stdout.isatty():
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
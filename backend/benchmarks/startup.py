@@ -0,0 +1,135 @@
+"""
+Cold-start report: import time and time to first response in fresh
+interpreters, the figures an autoscaled worker pays before serving.
+
+    python -m backend.benchmarks.startup --runs 10 --out startup.json
+    python -m backend.benchmarks.run --compare old-startup.json startup.json
+
+Reports use the same schema as backend.benchmarks.run, so the same
+--compare gate works on them.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Tuple
+
+from backend.benchmarks.run import build_report, summarize
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Entry points a worker may start from; optional ones are skipped
+# when their framework is not installed
+ENTRY_POINTS = ("backend", "backend.core.coordinator", "backend.main", "api.app")
+
+_CHILD = """
+import json, sys
+from time import perf_counter_ns
+started = perf_counter_ns()
+import importlib
+importlib.import_module(sys.argv[1])
+imported = perf_counter_ns()
+from backend import run_pipeline
+run_pipeline("Smoke near the hostel corridor", "Boys Hostel A", "Student")
+answered = perf_counter_ns()
+print(json.dumps({"import_ns": imported - started, "first_request_ns": answered - imported}))
+"""
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    # The API would otherwise open the default incident, outbox and audit files
+    env.setdefault("CAMPUS_INCIDENT_DB", "")
+    env.setdefault("CAMPUS_NOTIFY_OUTBOX", "")
+    env.setdefault("CAMPUS_AUDIT_LOG", "")
+    return env
+
+
+def measure_entry_point(module: str, runs: int) -> Optional[Dict[str, List[int]]]:
+    """
+    Returns per-run samples (ns) or None when the module cannot be
+    imported here, e.g. FastAPI missing for api.app.
+    """
+    samples: Dict[str, List[int]] = {"import": [], "first_request": [], "process": []}
+    for _ in range(runs):
+        started = perf_counter_ns()
+        child = subprocess.run(
+            [sys.executable, "-c", _CHILD, module],
+            capture_output=True, text=True, cwd=REPO_ROOT, env=_child_env()
+        )
+        elapsed = perf_counter_ns() - started
+        if child.returncode != 0:
+            return None
+        figures = json.loads(child.stdout.strip().splitlines()[-1])
+        samples["import"].append(figures["import_ns"])
+        samples["first_request"].append(figures["first_request_ns"])
+        # Interpreter boot to first answer, as the autoscaler sees it
+        samples["process"].append(elapsed)
+    return samples
+
+
+def slowest_imports(module: str, top: int = 10) -> List[Tuple[str, int]]:
+    """
+    Cumulative import time per module from `python -X importtime`.
+    """
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=_child_env()
+    )
+    rows = []
+    for line in child.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(cumulative)))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+
+def run_startup(runs: int = 5) -> Tuple[Dict[str, Dict[str, float]], Dict[str, str]]:
+    results: Dict[str, Dict[str, float]] = {}
+    skipped: Dict[str, str] = {}
+    for module in ENTRY_POINTS:
+        samples = measure_entry_point(module, runs)
+        if samples is None:
+            skipped[module] = "not importable in this environment"
+            continue
+        for phase, values in samples.items():
+            results[f"startup.{phase}[{module}]"] = summarize(values)
+    return results, skipped
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Campus safety cold-start report")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument("--out", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    results, skipped = run_startup(args.runs)
+    imports = slowest_imports("backend.core.coordinator", args.top)
+    report = build_report(
+        results,
+        runs=args.runs,
+        skipped=skipped,
+        slowest_imports_us=dict(imports)
+    )
+
+    for name, figures in results.items():
+        print(f"{name:50} p50 {figures['p50_us'] / 1e3:>8.1f}ms  p99 {figures['p99_us'] / 1e3:>8.1f}ms")
+    for module, reason in skipped.items():
+        print(f"{'startup[' + module + ']':50} skipped: {reason}")
+    print("\nslowest imports under backend.core.coordinator (cumulative):")
+    for name, micros in imports:
+        print(f"  {name:45} {micros / 1e3:>8.1f}ms")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
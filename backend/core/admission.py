@@ -0,0 +1,303 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from backend.core.ingestion import (
+    PRIORITY_CRITICAL,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_MEDIUM,
+    PRIORITY_NAMES,
+)
+from backend.core.metrics import METRICS
+
+DUPLICATE = "duplicate"
+
+# Share of the global bucket each class may not dip into. Low-risk
+# and duplicate reports stop being admitted first as the bucket
+# drains; high priority gets the last tokens; critical never waits.
+SHED_FLOORS = {
+    DUPLICATE: 0.5,
+    PRIORITY_NAMES[PRIORITY_LOW]: 0.5,
+    PRIORITY_NAMES[PRIORITY_MEDIUM]: 0.25,
+    PRIORITY_NAMES[PRIORITY_HIGH]: 0.0,
+}
+
+ADMISSION_TOTAL = METRICS.counter(
+    "campus_admission_total",
+    "Reports admitted or shed at the API, by class and outcome",
+    ("traffic_class", "outcome")
+)
+ADMISSION_TOKENS = METRICS.gauge(
+    "campus_admission_global_tokens",
+    "Tokens left in the global admission bucket"
+)
+
+
+class AdmissionRejected(RuntimeError):
+    """
+    Raised when a report is shed. `reason` is source_limit,
+    location_limit or overload; `retry_after` is in seconds.
+    """
+
+    def __init__(self, traffic_class: str, reason: str, retry_after: float):
+        super().__init__(f"Report shed ({reason}) for {traffic_class} traffic")
+        self.traffic_class = traffic_class
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Refills `rate` tokens per second up to `burst`.
+    """
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def available(self, cost: float, floor: float = 0.0) -> bool:
+        return self.tokens - cost >= floor * self.burst
+
+    def take(self, cost: float):
+        # Critical reports are charged too, but never drive it negative
+        self.tokens = max(0.0, self.tokens - cost)
+
+    def wait(self, cost: float, floor: float = 0.0) -> float:
+        missing = cost + floor * self.burst - self.tokens
+        return max(0.0, missing / self.rate) if self.rate > 0 else float("inf")
+
+
+def parse_trusted_sources(spec: str) -> Dict[str, Tuple[float, float]]:
+    """
+    "10.0.0.5=50/500,10.0.0.6=20/100" -> {source: (rate, burst)}.
+    Raises ValueError on a malformed entry.
+    """
+    trusted = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        source, _, limits = entry.partition("=")
+        rate, _, burst = limits.partition("/")
+        try:
+            trusted[source.strip()] = (float(rate), float(burst))
+        except ValueError:
+            raise ValueError(f"Trusted source must look like 'address=rate/burst', got '{entry}'") from None
+    return trusted
+
+
+class _KeyedBuckets:
+    """
+    One bucket per key, least recently used keys dropped past
+    `max_keys`. A dropped key was idle longest, so its bucket had
+    refilled anyway. Keys in `limits` get their own rate and burst.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_keys: int,
+        limits: Optional[Dict[Any, Tuple[float, float]]] = None
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.limits = dict(limits or {})
+        self._buckets: "OrderedDict[Any, TokenBucket]" = OrderedDict()
+
+    def get(self, key: Any, now: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self.limits.get(key, (self.rate, self.burst))
+            bucket = self._buckets[key] = TokenBucket(rate, burst, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.refill(now)
+        return bucket
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class AdmissionController:
+    """
+    Admission Controller
+    --------------------
+    Token-bucket admission in front of the ingestion queues.
+
+    - Per-source, per-location and global buckets; a report must fit
+      all three
+    - Reports with the panic flag or a critical keyword are always
+      admitted (and still charged, so a source spamming panic reports
+      loses its budget for everything else)
+    - As the global bucket drains, duplicate and Low-priority reports
+      are shed first, then Medium, then High
+    - A duplicate is the same text from the same source about the same
+      location within `duplicate_window` seconds
+    - A source is a client address, so one bucket may cover everyone
+      behind a campus NAT; the default allows for that. Gateways listed
+      in `trusted_sources` get their own (rate, burst)
+    - admit_batch() charges the source once per batch; each item is
+      still charged to its location and the global bucket
+    """
+
+    def __init__(
+        self,
+        rate: float = 200.0,
+        burst: Optional[float] = None,
+        source_rate: float = 5.0,
+        source_burst: float = 50.0,
+        location_rate: float = 5.0,
+        location_burst: float = 30.0,
+        duplicate_window: float = 60.0,
+        max_keys: int = 10000,
+        trusted_sources: Optional[Dict[str, Tuple[float, float]]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.duplicate_window = duplicate_window
+        self.max_keys = max_keys
+        self.clock = clock
+
+        now = clock()
+        self._global = TokenBucket(rate, 2 * rate if burst is None else burst, now)
+        self._sources = _KeyedBuckets(source_rate, source_burst, max_keys, trusted_sources)
+        self._locations = _KeyedBuckets(location_rate, location_burst, max_keys)
+        self._recent: "OrderedDict[Tuple[str, ...], float]" = OrderedDict()
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def admit(
+        self,
+        source: str,
+        campus_id: str,
+        payload: Dict[str, Any],
+        priority: int
+    ) -> str:
+        """
+        Charges one report; returns its traffic class or raises
+        AdmissionRejected.
+        """
+        with self._lock:
+            now = self.clock()
+            self._global.refill(now)
+            return self._admit(source, campus_id, payload, priority, now, self._sources.get(source, now))
+
+    def admit_batch(
+        self,
+        source: str,
+        campus_id: str,
+        items: List[Tuple[Dict[str, Any], int]]
+    ) -> List[Union[str, AdmissionRejected]]:
+        """
+        Charges a batch of (payload, priority) from one source; returns
+        the traffic class or the AdmissionRejected of each item.
+        """
+        outcomes: List[Union[str, AdmissionRejected]] = []
+        with self._lock:
+            now = self.clock()
+            self._global.refill(now)
+            source_bucket = self._sources.get(source, now)
+            # One charge for the whole batch; when the source is out of
+            # budget only critical items get through
+            spent = not source_bucket.available(1.0)
+            for payload, priority in items:
+                try:
+                    outcomes.append(self._admit(
+                        source, campus_id, payload, priority, now,
+                        source_bucket if spent else None
+                    ))
+                except AdmissionRejected as exc:
+                    outcomes.append(exc)
+            if not spent:
+                source_bucket.take(1.0)
+        return outcomes
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._global.refill(self.clock())
+            counts: Dict[str, Dict[str, int]] = {}
+            for (traffic_class, outcome), count in sorted(self._counts.items()):
+                counts.setdefault(traffic_class, {})[outcome] = count
+            return {
+                "admitted": sum(c for (_, o), c in self._counts.items() if o == "admitted"),
+                "shed": sum(c for (_, o), c in self._counts.items() if o != "admitted"),
+                "by_class": counts,
+                "global_tokens": round(self._global.tokens, 2),
+                "global_burst": self._global.burst,
+                "tracked_sources": len(self._sources),
+                "tracked_locations": len(self._locations),
+            }
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _admit(
+        self,
+        source: str,
+        campus_id: str,
+        payload: Dict[str, Any],
+        priority: int,
+        now: float,
+        source_bucket: Optional[TokenBucket]
+    ) -> str:
+        location = " ".join(str(payload.get("location", "")).lower().split())
+        fingerprint = (
+            source,
+            campus_id,
+            location,
+            " ".join(str(payload.get("description", "")).lower().split()),
+        )
+
+        # Only admitted reports are remembered: a retry after a 429
+        # is the same report, not a duplicate of it
+        duplicate = self._seen(fingerprint, now)
+        if priority == PRIORITY_CRITICAL:
+            traffic_class = PRIORITY_NAMES[PRIORITY_CRITICAL]
+        elif duplicate:
+            traffic_class = DUPLICATE
+        else:
+            traffic_class = PRIORITY_NAMES[priority]
+
+        buckets = (
+            ("source_limit", source_bucket, 0.0),
+            ("location_limit", self._locations.get((campus_id, location), now), 0.0),
+            ("overload", self._global, SHED_FLOORS.get(traffic_class, 0.0)),
+        )
+
+        if traffic_class != PRIORITY_NAMES[PRIORITY_CRITICAL]:
+            for reason, bucket, floor in buckets:
+                if bucket is not None and not bucket.available(1.0, floor):
+                    self._count(traffic_class, reason)
+                    raise AdmissionRejected(traffic_class, reason, bucket.wait(1.0, floor))
+
+        for _, bucket, _ in buckets:
+            if bucket is not None:
+                bucket.take(1.0)
+        self._remember(fingerprint, now)
+        self._count(traffic_class, "admitted")
+        return traffic_class
+
+    def _seen(self, fingerprint: Tuple[str, ...], now: float) -> bool:
+        last = self._recent.get(fingerprint)
+        return last is not None and now - last < self.duplicate_window
+
+    def _remember(self, fingerprint: Tuple[str, ...], now: float):
+        self._recent.pop(fingerprint, None)
+        self._recent[fingerprint] = now
+        if len(self._recent) > self.max_keys:
+            self._recent.popitem(last=False)
+
+    def _count(self, traffic_class: str, outcome: str):
+        self._counts[(traffic_class, outcome)] += 1
+        if METRICS.enabled:
+            ADMISSION_TOTAL.inc(traffic_class, outcome)
+            ADMISSION_TOKENS.set(self._global.tokens)
@@ -0,0 +1,419 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.agents.audit_agent import TrustAuditAgent
+from backend.core.metrics import METRICS
+
+try:
+    import fcntl
+except ImportError:
+    # No cross-process lock: one writing process per log file
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AUDIT_LOG_PATH = "backend/data/audit.log"
+
+# `prev` of the first entry
+GENESIS = "0" * 64
+
+# Verifier refuses longer lines instead of buffering them
+MAX_LINE_BYTES = 1 << 20
+
+_TAIL_CHUNK = 64 * 1024
+
+AUDIT_COMMIT_BATCH = METRICS.histogram(
+    "campus_audit_commit_batch_size",
+    "Audit entries made durable by one fsync",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 1024)
+)
+AUDIT_COMMIT_LATENCY = METRICS.histogram(
+    "campus_audit_commit_seconds",
+    "Time to write and fsync one audit batch"
+)
+
+
+def audit_entry(record: Any) -> Dict[str, Any]:
+    """
+    What the log keeps about one decision: the inputs the agents
+    saw and what they decided. The explanation is not stored; it is
+    rendered from these fields by explain_entry().
+    """
+    intake, risk, response, audit = (
+        record.intake, record.risk, record.response, record.audit
+    )
+    return {
+        "incident_id": intake.incident_id,
+        "campus_id": str((intake.raw_payload or {}).get("campus_id") or ""),
+        "timestamp": intake.timestamp,
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="microseconds"),
+        "source": intake.source,
+        "anonymous": intake.anonymous,
+        "location": intake.location,
+        "incident_type": intake.incident_type,
+        "confidence": audit.confidence_level,
+        "risk_score": risk.risk_score,
+        "risk_level": risk.risk_level,
+        "risk_reason": risk.reason,
+        "zone": risk.zone,
+        "decision": audit.final_decision,
+        "priority": response.priority_level,
+        "escalation_chain": list(audit.escalation_chain),
+        "duplicate_of": audit.duplicate_of,
+        "config_version": audit.config_version,
+    }
+
+
+def explain_entry(entry: Dict[str, Any]) -> str:
+    """
+    The explanation given for a logged decision, as the audit agent
+    rendered it at the time.
+    """
+    return _EXPLAINER.explanation_template(
+        entry["incident_type"], entry["risk_level"], entry["escalation_chain"]
+    ).render(entry["location"])
+
+
+def entry_hash(seq: int, prev: str, entry: Dict[str, Any]) -> str:
+    return hashlib.sha256(_canonical(seq, prev, entry).encode("utf-8")).hexdigest()
+
+
+class AuditLog:
+    """
+    Audit Log
+    ---------
+    Append-only, hash-chained record of every audited decision.
+
+    - One JSON line per entry; `hash` covers the entry, its `seq` and
+      the previous entry's hash, so editing, dropping or reordering a
+      line breaks every link after it
+    - Group commit: concurrent appends queue behind the batch being
+      written and the next fsync covers all of them; append() returns
+      once its entry is on disk
+    - Several processes (e.g. uvicorn workers) may share one file:
+      each batch is chained and written under an exclusive file lock,
+      and the tail is re-read whenever another process has appended,
+      so sequence numbers are given out at write time
+    - The last complete line is the chain head; a torn line left by a
+      crash was never acknowledged and is cut off
+    - record() (the pipeline sink) only queues by default: when a
+      response is sent its entry is in memory, not yet on disk, and a
+      crash loses at most the queued entries. With `durable_records`
+      it waits for the fsync, so a sent response is always logged.
+      Either way the queue holds at most `max_pending` entries; past
+      that, appends block until the writer catches up
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_AUDIT_LOG_PATH,
+        fsync: bool = True,
+        max_batch: int = 4096,
+        max_pending: int = 65536,
+        durable_records: bool = False
+    ):
+        self.path = path
+        self.fsync = fsync
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.durable_records = durable_records
+        self.batches = 0
+        # Appends that had to wait for room in the queue
+        self.throttled = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._file = open(path, "ab")
+        with _locked(self._file):
+            self._seq, self._head = _recover_tail(path)
+            self._size = self._file.seek(0, os.SEEK_END)
+        # Appends are numbered per process; `_written` is the last one
+        # on disk. Each pending slot gets its seq once written.
+        self._queued = 0
+        self._written = 0
+        self._pending: List[List[Any]] = []
+        self._error: Optional[Exception] = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="audit-log-writer", daemon=True
+        )
+        self._writer.start()
+
+    # ---------------- WRITE PATH ----------------
+
+    def record(self, record: Any):
+        """
+        Pipeline sink: queues the decision, and waits for the fsync only
+        with `durable_records`. close() drains the queue.
+        """
+        self.append(audit_entry(record), wait=self.durable_records)
+
+    def append(self, entry: Dict[str, Any], wait: bool = True) -> Optional[int]:
+        """
+        Queues one entry, first waiting for room if `max_pending` are
+        already queued. With `wait`, blocks until the entry has been
+        fsynced and returns its sequence number; raises OSError if the
+        log can no longer be written.
+        """
+        with self._cond:
+            if len(self._pending) >= self.max_pending:
+                self.throttled += 1
+                while (
+                    len(self._pending) >= self.max_pending
+                    and self._error is None and not self._closed
+                ):
+                    self._cond.wait()
+            if self._error is not None:
+                raise OSError(f"Audit log {self.path} is not writable: {self._error}")
+            if self._closed:
+                raise RuntimeError("Audit log is closed")
+            self._queued += 1
+            ticket = self._queued
+            slot = [entry, None]
+            self._pending.append(slot)
+            self._cond.notify_all()
+
+            if not wait:
+                return None
+            while self._written < ticket and self._error is None:
+                self._cond.wait()
+            if self._written < ticket:
+                raise OSError(f"Audit log {self.path} is not writable: {self._error}")
+        return slot[1]
+
+    def head(self) -> Dict[str, Any]:
+        """
+        Sequence number and hash of the last durable entry this process
+        wrote or saw. Publishing it elsewhere lets the verifier also
+        detect a truncated log.
+        """
+        with self._cond:
+            return {"seq": self._seq, "hash": self._head}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "path": self.path,
+                "entries": self._seq,
+                "pending": len(self._pending),
+                "throttled": self.throttled,
+                "batches": self.batches,
+                "head": self._head,
+                "writable": self._error is None,
+            }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        self._file.close()
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                # Room for appends waiting on a full queue
+                self._cond.notify_all()
+
+            # Chained here, outside the condition: appends keep queueing
+            # while this batch is hashed, written and synced
+            started = perf_counter()
+            try:
+                with _locked(self._file):
+                    seq, head = self._seq, self._head
+                    size = self._file.seek(0, os.SEEK_END)
+                    if size != self._size:
+                        # Another process appended since our last batch
+                        seq, head = _recover_tail(self.path)
+                    lines = []
+                    for slot in batch:
+                        seq += 1
+                        line, head = _chain_line(seq, head, slot[0])
+                        lines.append(line)
+                        slot[1] = seq
+                    self._file.write(b"".join(lines))
+                    self._file.flush()
+                    if self.fsync:
+                        os.fsync(self._file.fileno())
+                    self._size = self._file.tell()
+            except (OSError, ValueError) as exc:
+                logger.error("Audit log write failed, refusing further entries: %s", exc)
+                with self._cond:
+                    self._error = exc
+                    self._pending.clear()
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self._seq = seq
+                self._head = head
+                self._written += len(batch)
+                self.batches += 1
+                self._cond.notify_all()
+
+            if METRICS.enabled:
+                AUDIT_COMMIT_BATCH.observe(len(batch))
+                AUDIT_COMMIT_LATENCY.observe(perf_counter() - started)
+
+
+def _canonical(seq: int, prev: str, entry: Dict[str, Any]) -> str:
+    return json.dumps(
+        {"seq": seq, "prev": prev, "entry": entry},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+
+
+@contextmanager
+def _locked(f) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _chain_line(seq: int, prev: str, entry: Dict[str, Any]) -> Tuple[bytes, str]:
+    body = _canonical(seq, prev, entry)
+    digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return f'{body[:-1]},"hash":"{digest}"}}\n'.encode("utf-8"), digest
+
+
+def _recover_tail(path: str) -> Tuple[int, str]:
+    """
+    (seq, hash) of the last complete line, reading only the end of
+    the file. Truncates a torn final line.
+    """
+    if not os.path.exists(path):
+        return 0, GENESIS
+
+    with open(path, "rb+") as f:
+        position = f.seek(0, os.SEEK_END)
+        buffer = b""
+        # The last complete line sits between the last two newlines
+        while position > 0 and buffer.count(b"\n") < 2:
+            step = min(_TAIL_CHUNK, position)
+            position -= step
+            f.seek(position)
+            buffer = f.read(step) + buffer
+
+        complete = buffer.rfind(b"\n") + 1
+        if complete < len(buffer):
+            logger.warning(
+                "Audit log %s ends in a torn line (%d bytes); truncating it",
+                path, len(buffer) - complete
+            )
+            f.truncate(position + complete)
+            buffer = buffer[:complete]
+
+    if not buffer:
+        return 0, GENESIS
+    last = buffer[buffer.rfind(b"\n", 0, len(buffer) - 1) + 1:]
+    try:
+        line = json.loads(last)
+        return int(line["seq"]), str(line["hash"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError(
+            f"Audit log {path} has a corrupt last entry; verify it before appending"
+        ) from exc
+
+
+_EXPLAINER = TrustAuditAgent()
+
+
+# ---------------- VERIFICATION ----------------
+
+def _read_lines(f, max_line: int) -> Iterator[Tuple[int, bytes]]:
+    offset = 0
+    while True:
+        raw = f.readline(max_line + 1)
+        if not raw:
+            return
+        yield offset, raw
+        offset += len(raw)
+
+
+def verify_log(
+    path: str,
+    expected_head: Optional[str] = None,
+    max_line: int = MAX_LINE_BYTES
+) -> Dict[str, Any]:
+    """
+    Streams the log once, in memory bounded by `max_line`, and reports
+    the first broken link: a line that does not parse, a sequence gap,
+    a `prev` that is not the previous hash, or a hash that does not
+    match the entry. With `expected_head`, a log that ends anywhere
+    else (e.g. truncated) is reported too.
+    """
+    seq = 0
+    head = GENESIS
+    line_number = 0
+    size = 0
+
+    with open(path, "rb") as f:
+        for offset, raw in _read_lines(f, max_line):
+            line_number += 1
+            size = offset + len(raw)
+            error = None
+            if not raw.endswith(b"\n"):
+                error = (
+                    f"line longer than {max_line} bytes" if len(raw) > max_line
+                    else "incomplete last line"
+                )
+            else:
+                try:
+                    line = json.loads(raw)
+                    stored = line.pop("hash")
+                    if set(line) != {"seq", "prev", "entry"}:
+                        error = f"unexpected fields {sorted(line)}"
+                    elif line["seq"] != seq + 1:
+                        error = f"expected seq {seq + 1}, found {line['seq']}"
+                    elif line["prev"] != head:
+                        error = "prev does not match the previous entry's hash"
+                    elif entry_hash(line["seq"], line["prev"], line["entry"]) != stored:
+                        error = "hash does not match the entry"
+                except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                    error = f"unreadable entry: {exc}"
+
+            if error is not None:
+                return {
+                    "ok": False,
+                    "entries": seq,
+                    "line": line_number,
+                    "offset": offset,
+                    "error": error,
+                    "head": head,
+                }
+            seq = line["seq"]
+            head = stored
+
+    result = {"ok": True, "entries": seq, "bytes": size, "head": head}
+    if expected_head is not None and expected_head != head:
+        result.update({
+            "ok": False,
+            "line": line_number + 1,
+            "offset": size,
+            "error": f"log ends at seq {seq} but the expected head was not reached",
+        })
+    return result
@@ -0,0 +1,221 @@
+"""
+Columnar risk scoring for replays and backtests.
+
+Encodes a batch of incidents as arrays (zone tier per location and
+hour, hour of day, confidence code, critical-keyword flag) and scores
+them with vectorized NumPy operations. Scores and levels are exactly
+those of RiskEvaluationAgent.score_features; the weights are shared.
+
+numpy is optional and only needed here.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from backend.agents.risk_agent import (
+    CONFIDENCE_POINTS,
+    CRITICAL_SCORE,
+    LEVEL_THRESHOLDS,
+    NIGHT_POINTS,
+    RISK_LEVELS,
+    TIER_POINTS,
+    _incident_time,
+)
+from backend.core.keyword_matcher import KeywordMatcher
+from backend.core.zone_index import TIER_ORDER, ZoneIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Hour code for missing or unparseable timestamps
+UNKNOWN_HOUR = 24
+
+
+@dataclass
+class ScoringColumns:
+    """
+    One batch in columnar form. `location` and `confidence` are codes
+    into the `locations` and `confidence_levels` tuples.
+    """
+    critical: Any
+    location: Any
+    hour: Any
+    confidence: Any
+    activity_boost: Any
+    locations: Tuple[str, ...]
+    confidence_levels: Tuple[Optional[str], ...]
+
+    def __len__(self) -> int:
+        return len(self.critical)
+
+
+@dataclass
+class BatchScores:
+    scores: Any
+    levels: Any
+    zone_tiers: Any
+
+    def risk_levels(self) -> List[str]:
+        return [RISK_LEVELS[code] for code in self.levels.tolist()]
+
+    def tiers(self) -> List[str]:
+        return [TIER_ORDER[code] for code in self.zone_tiers.tolist()]
+
+    def level_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.levels, minlength=len(RISK_LEVELS))
+        return dict(zip(RISK_LEVELS, counts.tolist()))
+
+
+class BatchRiskScorer:
+    """
+    Batch Risk Scorer
+    -----------------
+    Vectorized counterpart of RiskEvaluationAgent for bulk re-scoring.
+
+    - Each distinct location is resolved once per hour of day into a
+      (locations x 25) tier table; incidents then gather from it
+    - Keyword scans run once per distinct description
+    - Scoring and level thresholds are plain array arithmetic
+    """
+
+    def __init__(self, zone_index: ZoneIndex, matcher: Optional[KeywordMatcher] = None):
+        if np is None:
+            raise ImportError("BatchRiskScorer needs the optional 'numpy' package")
+        self.zone_index = zone_index
+        self.matcher = matcher
+
+        hours = list(range(24)) + [None]
+        self._night_points = np.array(
+            [NIGHT_POINTS if zone_index.is_night(hour) else 0 for hour in hours], dtype=np.int16
+        )
+        self._tier_points = np.array([TIER_POINTS[tier] for tier in TIER_ORDER], dtype=np.int16)
+        self._tier_rows: Dict[str, List[int]] = {}
+        self._tier_codes = {tier: code for code, tier in enumerate(TIER_ORDER)}
+        self._high = RISK_LEVELS.index("High")
+
+    @classmethod
+    def from_config(cls, campus_config: dict) -> "BatchRiskScorer":
+        return cls(ZoneIndex.from_config(campus_config), KeywordMatcher.from_config(campus_config))
+
+    # ---------------- ENCODING ----------------
+
+    def encode(
+        self,
+        locations: Sequence[str],
+        timestamps: Sequence[Optional[str]],
+        confidence_levels: Sequence[Optional[str]],
+        critical: Optional[Sequence[bool]] = None,
+        descriptions: Optional[Sequence[str]] = None,
+        activity_boost: Optional[Sequence[int]] = None
+    ) -> ScoringColumns:
+        """
+        Builds columns from parallel sequences. Critical flags are taken
+        from `critical` or else scanned from `descriptions`.
+        """
+        if critical is None:
+            if descriptions is None:
+                raise ValueError("Either critical flags or descriptions are required")
+            critical = self._critical_flags(descriptions)
+
+        location_codes, distinct_locations = _factorize(locations)
+        confidence_codes, distinct_confidence = _factorize(confidence_levels)
+        count = len(location_codes)
+
+        return ScoringColumns(
+            critical=np.asarray(critical, dtype=bool),
+            location=np.asarray(location_codes, dtype=np.int32),
+            hour=np.fromiter(map(_hour_code, timestamps), dtype=np.int8, count=count),
+            confidence=np.asarray(confidence_codes, dtype=np.int32),
+            activity_boost=(
+                np.zeros(count, dtype=np.int16) if activity_boost is None
+                else np.asarray(activity_boost, dtype=np.int16)
+            ),
+            locations=distinct_locations,
+            confidence_levels=distinct_confidence
+        )
+
+    def encode_incidents(self, incidents: Iterable[Any]) -> ScoringColumns:
+        """
+        Columns for intake results, reusing their keyword scan.
+        """
+        incidents = list(incidents)
+        critical = []
+        for incident in incidents:
+            features = getattr(incident, "features", None)
+            if features is None:
+                features = self._matcher().extract(incident.description)
+            critical.append(features.critical)
+
+        return self.encode(
+            [incident.location for incident in incidents],
+            [incident.timestamp for incident in incidents],
+            [incident.confidence_level for incident in incidents],
+            critical=critical
+        )
+
+    # ---------------- SCORING ----------------
+
+    def score(self, columns: ScoringColumns) -> BatchScores:
+        tier_table = np.array(
+            [self._tier_row(location) for location in columns.locations], dtype=np.int8
+        ).reshape(len(columns.locations), 25)
+        confidence_points = np.array(
+            [CONFIDENCE_POINTS.get(level, 0) for level in columns.confidence_levels], dtype=np.int16
+        )
+
+        tiers = tier_table[columns.location, columns.hour]
+        scores = (
+            self._tier_points[tiers]
+            + self._night_points[columns.hour]
+            + confidence_points[columns.confidence]
+            + columns.activity_boost
+        )
+        scores = np.where(columns.critical, np.int16(CRITICAL_SCORE), scores).astype(np.int16)
+
+        minimums = np.array([minimum for _, minimum in reversed(LEVEL_THRESHOLDS)])
+        levels = np.searchsorted(minimums, scores, side="right").astype(np.int8)
+        levels[columns.critical] = self._high
+
+        return BatchScores(scores=scores, levels=levels, zone_tiers=tiers)
+
+    def score_incidents(self, incidents: Iterable[Any]) -> BatchScores:
+        return self.score(self.encode_incidents(incidents))
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _tier_row(self, location: str) -> List[int]:
+        row = self._tier_rows.get(location)
+        if row is None:
+            resolve = self.zone_index.resolve
+            row = [self._tier_codes[resolve(location, hour).tier] for hour in range(24)]
+            row.append(self._tier_codes[resolve(location, None).tier])
+            self._tier_rows[location] = row
+        return row
+
+    def _critical_flags(self, descriptions: Sequence[str]) -> List[bool]:
+        extract = self._matcher().extract
+        seen: Dict[str, bool] = {}
+        flags = []
+        for text in descriptions:
+            flag = seen.get(text)
+            if flag is None:
+                flag = seen[text] = extract(text or "").critical
+            flags.append(flag)
+        return flags
+
+    def _matcher(self) -> KeywordMatcher:
+        if self.matcher is None:
+            raise ValueError("A keyword matcher is needed to scan descriptions")
+        return self.matcher
+
+
+def _factorize(values: Sequence[Any]) -> Tuple[List[int], Tuple[Any, ...]]:
+    codes: Dict[Any, int] = {}
+    encoded = [codes.setdefault(value, len(codes)) for value in values]
+    return encoded, tuple(codes)
+
+
+def _hour_code(timestamp: Optional[str]) -> int:
+    moment = _incident_time(timestamp)
+    return UNKNOWN_HOUR if moment is None else moment.hour
@@ -0,0 +1,646 @@
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+import types
+import zlib
+from concurrent.futures import Future
+from dataclasses import dataclass
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.core.admission import AdmissionController, AdmissionRejected
+from backend.core.config_loader import resolve_config_path
+from backend.core.coordinator import (
+    BatchItemResult,
+    EscalationRecord,
+    PipelineRecord,
+    add_escalation_sink,
+    add_sink,
+    get_coordinator,
+    publish_escalation,
+    publish_record,
+    run_payload,
+)
+from backend.core.ingestion import IngestionQueue, classify_priority
+from backend.core.keyword_matcher import KeywordFeatures
+from backend.core.metrics import METRICS
+from backend.core.registry import CampusRegistry
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+)
+
+DEFAULT_CONFIG_DIR = "backend/config"
+DEFAULT_CAMPUS_ID = "gla_university"
+
+CAMPUS_MEMORY = METRICS.gauge(
+    "campus_memory_bytes",
+    "Approximate memory held by one campus (config, indexes, caches)",
+    ("campus",)
+)
+
+
+class UnknownCampusError(KeyError):
+    pass
+
+
+def shard_for(campus_id: str, shards: int) -> int:
+    """
+    Stable campus -> shard assignment; identical in every process.
+    """
+    return zlib.crc32(campus_id.encode("utf-8")) % shards
+
+
+def deep_sizeof(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Recursive sys.getsizeof over containers and plain objects.
+    Types, modules and functions are shared and not counted.
+    """
+    seen = set() if _seen is None else _seen
+    stack = [obj]
+    total = 0
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SHARED_TYPES):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif not isinstance(item, (str, bytes, int, float, bool)):
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+
+    return total
+
+
+def campus_footprint(coordinator: Any) -> int:
+    """
+    Memory owned by one campus. Agents and sinks are shared
+    across campuses and are left out.
+    """
+    seen: set = set()
+    return sum(
+        deep_sizeof(part, seen)
+        for part in (
+            coordinator.campus_config,
+            coordinator.keyword_matcher,
+            coordinator.zone_index,
+            coordinator.decision_cache,
+            coordinator.correlator,
+            coordinator.zone_activity,
+        )
+    )
+
+
+def campus_info(coordinator: Any) -> dict:
+    """
+    What responses report about the campus that handled them.
+    """
+    return {
+        "campus": coordinator.config_loader.get_campus_name(),
+        "config_version": coordinator.config_version,
+        "emergency_contacts": coordinator.config_loader.get_emergency_contacts(),
+    }
+
+
+@dataclass(frozen=True)
+class CampusRules:
+    """
+    What the parent keeps of a sharded campus: its plain config for
+    the escalation dispatcher, and the keyword matcher and zone index
+    classify_priority() needs, so a report is classified without
+    queueing behind the shard's pipeline runs.
+    """
+    campus_config: dict
+    keyword_matcher: Any
+    zone_index: Any
+
+    @classmethod
+    def from_loader(cls, loader: Any) -> "CampusRules":
+        return cls(loader.get_full_config(), loader.get_keyword_matcher(), loader.get_zone_index())
+
+
+def _stream_stages(config_path: str, payload: dict) -> Iterator[Tuple[str, Any]]:
+    coordinator = get_coordinator(config_path)
+    yield "campus", campus_info(coordinator)
+    yield from coordinator.iter_stages(payload)
+
+
+def _stream_in_thread(config_path: str, payload: dict) -> Iterator[Tuple[str, Any]]:
+    # The pipeline runs to the end on its own thread: a client that
+    # stops reading must not stop its report short of escalation,
+    # storage and the audit log
+    events: SimpleQueue = SimpleQueue()
+
+    def run():
+        try:
+            for step in _stream_stages(config_path, payload):
+                events.put(step)
+        except BaseException as exc:
+            events.put((None, exc))
+        else:
+            events.put((None, None))
+
+    threading.Thread(target=run, name="campus-stream", daemon=True).start()
+    while True:
+        stage, result = events.get()
+        if stage is None:
+            if result is not None:
+                raise result
+            return
+        yield stage, result
+
+
+class CampusDirectory:
+    """
+    Campus Directory
+    ----------------
+    Maps campus ids to config files in one directory; the id is the
+    file stem ("gla_university.json" -> "gla_university").
+
+    - The directory is rescanned at most every `check_interval` seconds,
+      so new campuses are picked up without a restart
+    - Empty files are skipped; parsing and hot reload stay with the
+      campus registry
+    """
+
+    def __init__(self, config_dir: str = DEFAULT_CONFIG_DIR, check_interval: float = 1.0):
+        self.config_dir = resolve_config_path(config_dir)
+        self.check_interval = check_interval
+        self._paths: Dict[str, str] = {}
+        self._scanned_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def campus_ids(self) -> List[str]:
+        return sorted(self._scan())
+
+    def config_path(self, campus_id: str) -> str:
+        paths = self._scan()
+        if campus_id not in paths:
+            raise UnknownCampusError(campus_id)
+        return paths[campus_id]
+
+    def _scan(self) -> Dict[str, str]:
+        now = time.monotonic()
+        if self._scanned_at is not None and now - self._scanned_at < self.check_interval:
+            return self._paths
+
+        with self._lock:
+            paths = {}
+            try:
+                entries = list(os.scandir(self.config_dir))
+            except OSError as exc:
+                logger.error("Campus config directory %s unreadable: %s", self.config_dir, exc)
+                entries = []
+
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext != ".json" or not entry.is_file():
+                    continue
+                if entry.stat().st_size == 0:
+                    logger.warning("Skipping empty campus config %s", entry.path)
+                    continue
+                paths[stem] = entry.path
+
+            self._paths = paths
+            self._scanned_at = now
+            return paths
+
+
+# ---------------- SHARD WORKER PROCESSES ----------------
+
+_captured: List[PipelineRecord] = []
+# Stage events of streamed reports, read by the parent's router
+_events: Any = None
+# Event token of an escalation, sent as soon as the shard plans it
+_ESCALATION = -1
+# Event token of the metrics a shard observed during one task
+_METRICS = -2
+
+
+def _init_shard(events: Any = None):
+    global _events
+    _events = events
+    # Records are handed back to the parent, whose sinks own storage
+    add_sink(_captured.append)
+    if events is not None:
+        add_escalation_sink(_forward_escalation)
+
+
+def _forward_escalation(record: EscalationRecord):
+    _events.put((_ESCALATION, None, record))
+
+
+def _forward_metrics():
+    # Nobody scrapes a shard: its observations go to the parent's /metrics
+    if METRICS.enabled and _events is not None:
+        snapshot = METRICS.drain()
+        if snapshot:
+            _events.put((_METRICS, None, snapshot))
+
+
+def _take_captured() -> List[PipelineRecord]:
+    # One task at a time per shard process, so the capture list is private
+    records = list(_captured)
+    _captured.clear()
+    return records
+
+
+def _run_in_shard(
+    config_path: str,
+    payload: dict,
+    features: Optional[KeywordFeatures]
+) -> Tuple[dict, Optional[PipelineRecord]]:
+    _captured.clear()
+    try:
+        result = run_payload(payload, features=features, config_path=config_path)
+    finally:
+        _forward_metrics()
+    records = _take_captured()
+    return result, records[-1] if records else None
+
+
+def _batch_in_shard(
+    config_path: str,
+    payloads: List[dict]
+) -> Tuple[dict, List[BatchItemResult], List[PipelineRecord]]:
+    _captured.clear()
+    try:
+        coordinator = get_coordinator(config_path)
+        items = coordinator.process_batch(payloads)
+    finally:
+        _forward_metrics()
+    return campus_info(coordinator), items, _take_captured()
+
+
+def _stream_in_shard(config_path: str, payload: dict, token: int) -> Optional[PipelineRecord]:
+    _captured.clear()
+    try:
+        for stage, result in _stream_stages(config_path, payload):
+            _events.put((token, stage, result))
+    finally:
+        _forward_metrics()
+        # Ends the parent's stream, also when the pipeline raised
+        _events.put((token, None, None))
+    records = _take_captured()
+    return records[-1] if records else None
+
+
+def _shard_summaries(config_paths: Dict[str, str]) -> Dict[str, dict]:
+    summaries = {}
+    for campus_id, path in config_paths.items():
+        try:
+            coordinator = get_coordinator(path)
+        except (OSError, ValueError) as exc:
+            logger.error("Campus %s could not be loaded: %s", campus_id, exc)
+            summaries[campus_id] = {"error": str(exc)}
+            continue
+        summaries[campus_id] = {
+            "campus": coordinator.config_loader.get_campus_name(),
+            "config_version": coordinator.config_version,
+            "memory_bytes": campus_footprint(coordinator),
+        }
+    # Config loads happen here first
+    _forward_metrics()
+    return summaries
+
+
+def _publish_abandoned(future: Future):
+    # A streamed report whose client went away still reaches the sinks
+    if future.cancelled() or future.exception() is not None:
+        return
+    record = future.result()
+    if record is not None:
+        publish_record(record)
+
+
+class CampusRouter:
+    """
+    Campus Router
+    -------------
+    Routes incidents to the right campus and keeps campuses isolated.
+
+    - Every campus has its own ingestion queue, so one campus's burst
+      fills and rejects on its own queue only
+    - With `shards > 0` campuses are pinned to single-process shards;
+      a busy campus then only competes for CPU inside its own shard
+    - Everything that needs campus state (priority classification,
+      streamed and batch reports) runs where the campus lives, so a
+      sharded campus is never loaded in this process; only its plain
+      config is, for notification routing
+    - Shard results come back to this process, where the sinks run
+    - An optional AdmissionController sheds reports before they queue
+    """
+
+    def __init__(
+        self,
+        directory: Optional[CampusDirectory] = None,
+        shards: int = 0,
+        workers: int = 4,
+        capacity: Optional[Dict[int, int]] = None,
+        admission: Optional[AdmissionController] = None
+    ):
+        self.directory = directory or CampusDirectory()
+        self.shards = shards
+        self.workers = workers
+        self.capacity = capacity
+        self.admission = admission
+
+        self._queues: Dict[str, IngestionQueue] = {}
+        self._pools: List["ProcessPoolExecutor"] = []
+        self._lock = threading.Lock()
+        self._streams: Dict[int, SimpleQueue] = {}
+        self._tokens = itertools.count()
+        self._events: Any = None
+        self._reader: Optional[threading.Thread] = None
+        self._rules: Optional[CampusRegistry] = None
+
+        if shards > 0:
+            # Deferred: multiprocessing is only needed when sharding
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn: forking a process that already runs threads is unsafe
+            context = multiprocessing.get_context("spawn")
+            self._events = context.Queue()
+            self._pools = [
+                ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=context,
+                    initializer=_init_shard,
+                    initargs=(self._events,)
+                )
+                for _ in range(shards)
+            ]
+            self._reader = threading.Thread(
+                target=self._read_events, name="campus-stream-events", daemon=True
+            )
+            self._reader.start()
+            # Configs and classification rules, not whole coordinators
+            self._rules = CampusRegistry(factory=CampusRules.from_loader)
+
+    def coordinator(self, campus_id: str) -> Any:
+        """
+        The campus's coordinator in this process; with sharding, use
+        the routed methods instead.
+        """
+        return get_coordinator(self.directory.config_path(campus_id))
+
+    def campus_config(self, campus_id: str) -> dict:
+        path = self.directory.config_path(campus_id)
+        if self._rules is not None:
+            return self._rules.get(path).campus_config
+        return get_coordinator(path).campus_config
+
+    def shard_of(self, campus_id: str) -> Optional[int]:
+        return shard_for(campus_id, self.shards) if self.shards > 0 else None
+
+    def classify(self, campus_id: str, payloads: List[dict]) -> List[Tuple[int, KeywordFeatures]]:
+        """
+        Ingestion priority and keyword features of each payload, worked
+        out in this process even for a sharded campus, so a panic report
+        never waits behind the shard's work. Raises UnknownCampusError.
+        """
+        config_path = self.directory.config_path(campus_id)
+        rules = self._rules.get(config_path) if self._rules is not None else get_coordinator(config_path)
+        return [classify_priority(payload, rules) for payload in payloads]
+
+    def admit(
+        self,
+        campus_id: str,
+        payload: dict,
+        source: Optional[str] = None
+    ) -> Tuple[int, KeywordFeatures]:
+        """
+        Classifies one incident and charges it against the admission
+        buckets; raises UnknownCampusError or AdmissionRejected.
+        """
+        priority, features = self.classify(campus_id, [payload])[0]
+        if self.admission is not None:
+            self.admission.admit(source or payload.get("source", ""), campus_id, payload, priority)
+        return priority, features
+
+    def admit_batch(
+        self,
+        campus_id: str,
+        payloads: List[dict],
+        source: Optional[str] = None
+    ) -> List[Optional[AdmissionRejected]]:
+        """
+        Admits a batch with one classification round trip and one
+        charge to the source; returns the rejection of each shed item,
+        else None.
+        """
+        if self.admission is None:
+            self.directory.config_path(campus_id)
+            return [None] * len(payloads)
+
+        classified = self.classify(campus_id, payloads)
+        outcomes = self.admission.admit_batch(
+            source or "",
+            campus_id,
+            [(payload, priority) for payload, (priority, _) in zip(payloads, classified)]
+        )
+        return [exc if isinstance(exc, AdmissionRejected) else None for exc in outcomes]
+
+    def submit(self, campus_id: str, payload: dict, source: Optional[str] = None) -> Future:
+        """
+        Queues one incident; raises UnknownCampusError, AdmissionRejected
+        or QueueFullError. `source` keys the per-source admission bucket.
+        """
+        priority, features = self.admit(campus_id, payload, source)
+        return self._queue(campus_id).submit(payload, priority, features)
+
+    def process_batch(self, campus_id: str, payloads: List[dict]) -> Tuple[dict, List[BatchItemResult]]:
+        """
+        Runs a batch on the campus's coordinator; returns the campus
+        info and the per-item results.
+        """
+        config_path = self.directory.config_path(campus_id)
+        if not self._pools:
+            coordinator = get_coordinator(config_path)
+            return campus_info(coordinator), coordinator.process_batch(payloads)
+
+        info, items, records = self._shard(campus_id).submit(
+            _batch_in_shard, config_path, payloads
+        ).result()
+        for record in records:
+            publish_record(record)
+        return info, items
+
+    def stream(self, campus_id: str, payload: dict) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields ("campus", campus info) and then (stage, result) as each
+        stage of the report finishes. Raises UnknownCampusError. The
+        report is processed in full even if the caller stops reading.
+        """
+        config_path = self.directory.config_path(campus_id)
+        if not self._pools:
+            return _stream_in_thread(config_path, payload)
+        return self._stream_from_shard(campus_id, config_path, payload)
+
+    def campuses(self) -> List[dict]:
+        summaries = self._summaries(self.directory.campus_ids())
+
+        campuses = []
+        for campus_id, summary in sorted(summaries.items()):
+            if "error" in summary:
+                campuses.append({"campus_id": campus_id, "error": summary["error"]})
+                continue
+            if METRICS.enabled:
+                CAMPUS_MEMORY.set(summary["memory_bytes"], campus_id)
+            campuses.append({
+                "campus_id": campus_id,
+                "campus": summary["campus"],
+                "config_version": summary["config_version"],
+                "shard": self.shard_of(campus_id),
+                "memory_bytes": summary["memory_bytes"],
+            })
+        return campuses
+
+    def shutdown(self):
+        with self._lock:
+            queues, self._queues = list(self._queues.values()), {}
+        for queue in queues:
+            queue.shutdown()
+        for pool in self._pools:
+            pool.shutdown()
+        if self._reader is not None:
+            self._events.put((None, None, None))
+            self._reader.join()
+            self._reader = None
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _shard(self, campus_id: str) -> "ProcessPoolExecutor":
+        return self._pools[shard_for(campus_id, self.shards)]
+
+    def _queue(self, campus_id: str) -> IngestionQueue:
+        queue = self._queues.get(campus_id)
+        if queue is not None:
+            return queue
+
+        with self._lock:
+            queue = self._queues.get(campus_id)
+            if queue is None:
+                config_path = self.directory.config_path(campus_id)
+                queue = IngestionQueue(
+                    lambda payload, features: self._run(campus_id, config_path, payload, features),
+                    workers=self.workers,
+                    capacity=self.capacity
+                )
+                queue.start()
+                self._queues[campus_id] = queue
+        return queue
+
+    def _run(
+        self,
+        campus_id: str,
+        config_path: str,
+        payload: dict,
+        features: Optional[KeywordFeatures]
+    ) -> dict:
+        if not self._pools:
+            return run_payload(payload, features=features, config_path=config_path)
+
+        result, record = self._shard(campus_id).submit(
+            _run_in_shard, config_path, payload, features
+        ).result()
+        if record is not None:
+            publish_record(record)
+        return result
+
+    def _stream_from_shard(
+        self,
+        campus_id: str,
+        config_path: str,
+        payload: dict
+    ) -> Iterator[Tuple[str, Any]]:
+        token = next(self._tokens)
+        events: SimpleQueue = SimpleQueue()
+        self._streams[token] = events
+        future = self._shard(campus_id).submit(_stream_in_shard, config_path, payload, token)
+
+        def failed(done: Future):
+            # A dead shard never sends the end-of-stream event
+            if done.cancelled() or done.exception() is not None:
+                events.put((None, None))
+
+        future.add_done_callback(failed)
+
+        published = False
+        try:
+            while True:
+                stage, result = events.get()
+                if stage is None:
+                    break
+                yield stage, result
+            record = future.result()
+            published = True
+            if record is not None:
+                publish_record(record)
+        finally:
+            self._streams.pop(token, None)
+            if not published:
+                future.add_done_callback(_publish_abandoned)
+
+    def _read_events(self):
+        while True:
+            token, stage, result = self._events.get()
+            if token is None:
+                return
+            if token == _ESCALATION:
+                publish_escalation(result)
+                continue
+            if token == _METRICS:
+                METRICS.merge(result)
+                continue
+            events = self._streams.get(token)
+            if events is not None:
+                events.put((stage, result))
+
+    def _summaries(self, campus_ids: List[str]) -> Dict[str, dict]:
+        paths = {}
+        for campus_id in campus_ids:
+            try:
+                paths[campus_id] = self.directory.config_path(campus_id)
+            except UnknownCampusError:
+                continue
+
+        if not self._pools:
+            return _shard_summaries(paths)
+
+        # Loaded and measured where the campus lives: each shard
+        # reports its own
+        by_shard: Dict[int, Dict[str, str]] = {}
+        for campus_id, path in paths.items():
+            by_shard.setdefault(shard_for(campus_id, self.shards), {})[campus_id] = path
+        futures = [
+            self._pools[shard].submit(_shard_summaries, shard_paths)
+            for shard, shard_paths in by_shard.items()
+        ]
+        summaries: Dict[str, dict] = {}
+        for future in futures:
+            summaries.update(future.result())
+        return summaries
@@ -1,5 +1,86 @@
+import hashlib
 import json
+import logging
 import os
+import pickle
+import tempfile
+from time import perf_counter
+from typing import List, Optional
+
+from backend.core.config_schema import validate_config
+from backend.core.keyword_matcher import KeywordMatcher
+from backend.core.metrics import CONFIG_LOAD_SECONDS, METRICS
+from backend.core.zone_index import ZoneIndex
+
+logger = logging.getLogger(__name__)
+
+
+# Relative config paths are resolved against the working directory first and
+# then against the backend package, so "config/gla_university.json" works
+# from both the repo root and backend/.
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_config_path(config_path: str) -> str:
+    """
+    Returns an absolute path for a campus configuration file.
+    """
+    if os.path.isabs(config_path) or os.path.exists(config_path):
+        return os.path.abspath(config_path)
+
+    candidate = os.path.join(BACKEND_ROOT, config_path)
+    if os.path.exists(candidate):
+        return candidate
+
+    # Strip a leading "backend/" when called from inside backend/
+    head, _, tail = config_path.replace("\\", "/").partition("/")
+    if head == "backend" and tail:
+        candidate = os.path.join(BACKEND_ROOT, tail)
+        if os.path.exists(candidate):
+            return candidate
+
+    return os.path.abspath(config_path)
+
+
+# Bump whenever the pickled layout (or a compiled class) changes
+SNAPSHOT_FORMAT = 1
+
+# Code a snapshot depends on: the schema decides what loads and the
+# matcher and zone index are pickled compiled. Their source is hashed
+# into the snapshot key, so an upgrade never serves a snapshot built
+# by older code.
+SNAPSHOT_CODE_FILES = tuple(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    for name in ("config_schema.py", "keyword_matcher.py", "zone_index.py", "config_loader.py")
+)
+
+# Snapshots live in a ".snapshots" directory next to each config. They
+# are loaded with pickle, so the config directory must only be writable
+# by the deployment. Set CAMPUS_CONFIG_SNAPSHOTS=0 to disable them.
+SNAPSHOTS_ENABLED = os.environ.get("CAMPUS_CONFIG_SNAPSHOTS", "1") != "0"
+SNAPSHOT_DIRNAME = ".snapshots"
+
+
+_code_version: Optional[str] = None
+
+
+def snapshot_code_version() -> Optional[str]:
+    """
+    Hash of SNAPSHOT_CODE_FILES, or None when one cannot be read
+    (snapshots are then not used).
+    """
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(str(SNAPSHOT_FORMAT).encode())
+        for path in SNAPSHOT_CODE_FILES:
+            try:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            except OSError as exc:
+                logger.warning("Config snapshots disabled, cannot fingerprint %s: %s", path, exc)
+                return None
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
 
 
 class CampusConfigLoader:
@@ -8,11 +89,36 @@ class CampusConfigLoader:
     ---------------------------
     Loads university-specific configuration files
     and exposes them to the AI core in a safe manner.
+
+    - The full schema is validated at load (ConfigValidationError);
+      cross-reference gaps are kept as `warnings`
+    - The validated config and its compiled keyword matcher and zone
+      index are written to a snapshot; later loads of an unchanged
+      file are one stat plus one read, with no JSON parse or validation
     """
 
-    def __init__(self, config_path: str):
-        self.config_path = config_path
-        self._config = self._load_config()
+    def __init__(self, config_path: str, snapshot_dir: Optional[str] = None):
+        started = perf_counter()
+
+        self.config_path = resolve_config_path(config_path)
+        if snapshot_dir is None and SNAPSHOTS_ENABLED:
+            snapshot_dir = os.path.join(os.path.dirname(self.config_path), SNAPSHOT_DIRNAME)
+        self.snapshot_dir = snapshot_dir
+        self.mtime_ns = 0
+        self.version = ""
+        self.warnings: List[str] = []
+        self.from_snapshot = False
+
+        if not self._load_snapshot():
+            self._config = self._load_config()
+            self._keyword_matcher = KeywordMatcher.from_config(self._config)
+            self._zone_index = ZoneIndex.from_config(self._config)
+            for warning in self.warnings:
+                logger.warning("%s: %s", self.config_path, warning)
+            self._write_snapshot()
+
+        if METRICS.enabled:
+            CONFIG_LOAD_SECONDS.observe(perf_counter() - started)
 
     def _load_config(self) -> dict:
         if not os.path.exists(self.config_path):
@@ -20,33 +126,103 @@ class CampusConfigLoader:
                 f"Campus configuration file not found: {self.config_path}"
             )
 
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        with open(self.config_path, "rb") as f:
+            self.mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            raw = f.read()
 
-        self._basic_validation(config)
+        # Content hash doubles as the config version reported on results
+        self.version = hashlib.sha256(raw).hexdigest()[:12]
+        config = json.loads(raw.decode("utf-8"))
+
+        self.warnings = validate_config(config, self.config_path)
         return config
 
-    def _basic_validation(self, config: dict):
-        """
-        Minimal validation to ensure required top-level keys exist.
-        """
-        required_keys = [
-            "campus",
-            "infrastructure",
-            "risk_zones",
-            "emergency_contacts",
-            "incident_policies",
-            "user_roles",
-            "privacy_rules",
-            "governance"
-        ]
-
-        for key in required_keys:
-            if key not in config:
-                raise ValueError(f"Missing required config section: {key}")
+    # ---------------- SNAPSHOTS ----------------
+
+    def snapshot_path(self) -> Optional[str]:
+        if not self.snapshot_dir:
+            return None
+        stem = os.path.splitext(os.path.basename(self.config_path))[0]
+        return os.path.join(self.snapshot_dir, f"{stem}.snapshot")
+
+    def _load_snapshot(self) -> bool:
+        path = self.snapshot_path()
+        code = snapshot_code_version()
+        if path is None or code is None:
+            return False
+
+        try:
+            stat = os.stat(self.config_path)
+            with open(path, "rb") as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as exc:
+            logger.warning("Ignoring unreadable config snapshot %s: %s", path, exc)
+            return False
+
+        # Stale unless it was built from exactly this file state, by
+        # exactly this code
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("format") != SNAPSHOT_FORMAT
+            or snapshot.get("code") != code
+            or snapshot.get("config_path") != self.config_path
+            or snapshot.get("mtime_ns") != stat.st_mtime_ns
+            or snapshot.get("size") != stat.st_size
+        ):
+            return False
+
+        self.mtime_ns = snapshot["mtime_ns"]
+        self.version = snapshot["version"]
+        self.warnings = snapshot["warnings"]
+        self._config = snapshot["config"]
+        self._keyword_matcher = snapshot["keyword_matcher"]
+        self._zone_index = snapshot["zone_index"]
+        self.from_snapshot = True
+        return True
+
+    def _write_snapshot(self):
+        path = self.snapshot_path()
+        code = snapshot_code_version()
+        if path is None or code is None:
+            return
+
+        snapshot = {
+            "format": SNAPSHOT_FORMAT,
+            "code": code,
+            "config_path": self.config_path,
+            "mtime_ns": self.mtime_ns,
+            "size": os.stat(self.config_path).st_size,
+            "version": self.version,
+            "warnings": self.warnings,
+            "config": self._config,
+            "keyword_matcher": self._keyword_matcher,
+            "zone_index": self._zone_index,
+        }
+
+        # Write-then-rename so a concurrent reader never sees half a file
+        tmp_path = None
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.snapshot_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            # A snapshot is an optimization; serving never depends on it
+            logger.warning("Could not write config snapshot %s: %s", path, exc)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     # ---------------- PUBLIC ACCESS METHODS ----------------
 
+    def get_config_version(self) -> str:
+        return self.version
+
+    def get_validation_warnings(self) -> List[str]:
+        return list(self.warnings)
+
     def get_campus_name(self) -> str:
         return self._config["campus"]["name"]
 
@@ -68,9 +244,38 @@ class CampusConfigLoader:
     def get_governance(self) -> dict:
         return self._config["governance"]
 
+    def get_pipeline(self) -> dict:
+        # Optional section: custom stages, stage timeouts, fast path
+        return self._config.get("pipeline", {})
+
+    def get_keyword_matcher(self) -> KeywordMatcher:
+        return self._keyword_matcher
+
+    def get_zone_index(self) -> ZoneIndex:
+        return self._zone_index
+
     def get_full_config(self) -> dict:
         """
         Use this only if absolutely needed.
         Prefer specific getters.
         """
         return self._config
+
+
+if __name__ == "__main__":
+    # Validates campus configs and precompiles their snapshots:
+    #   python -m backend.core.config_loader backend/config/*.json
+    import sys
+
+    failed = False
+    for path in sys.argv[1:]:
+        try:
+            loader = CampusConfigLoader(path)
+        except (OSError, ValueError) as exc:
+            failed = True
+            print(f"FAIL {path}: {exc}")
+            continue
+        print(f"OK   {path} ({loader.get_config_version()}) -> {loader.snapshot_path()}")
+        for warning in loader.get_validation_warnings():
+            print(f"     warning: {warning}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,348 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from backend.agents.response_agent import policy_key_for
+from backend.core.keyword_matcher import DEFAULT_INCIDENT_KEYWORDS
+from backend.core.stage_graph import CORE_STAGES, RESERVED_NAMES, Stage, graph_edges, topological_order
+from backend.core.zone_index import _QUALIFIED, TIER_ORDER, parse_hour, parse_qualifier
+
+REQUIRED_SECTIONS = (
+    "campus",
+    "infrastructure",
+    "risk_zones",
+    "emergency_contacts",
+    "incident_policies",
+    "user_roles",
+    "privacy_rules",
+    "governance",
+)
+
+# Options each notification transport type requires
+NOTIFICATION_TRANSPORTS = {
+    "webhook": ("url",),
+    "sms": ("url", "sender"),
+    "smtp": ("host",),
+}
+
+_STAGE_CALLABLE = re.compile(r"^[A-Za-z_][\w.]*:[A-Za-z_][\w.]*$")
+
+_CLOCK_TIME = re.compile(r"^([01]?\d|2[0-3]):[0-5]\d$")
+
+
+class ConfigValidationError(ValueError):
+    """
+    Raised with every problem found in a campus config, not just the first.
+    """
+
+    def __init__(self, config_path: str, errors: List[str]):
+        self.config_path = config_path
+        self.errors = errors
+        super().__init__(
+            f"Invalid campus config {config_path}:\n  - " + "\n  - ".join(errors)
+        )
+
+
+def validate_config(config: Any, config_path: str = "<config>") -> List[str]:
+    """
+    Checks the full campus config schema at load time.
+
+    Structural problems raise ConfigValidationError; cross-reference
+    gaps (a risk zone missing from `infrastructure`, an incident type
+    without a policy) are returned as warnings, since they degrade
+    results without breaking the pipeline.
+    """
+    errors: List[str] = []
+
+    if not isinstance(config, dict):
+        raise ConfigValidationError(config_path, ["top level: expected a JSON object"])
+
+    for section in REQUIRED_SECTIONS:
+        if section not in config:
+            errors.append(f"Missing required config section: {section}")
+        elif not isinstance(config[section], dict):
+            errors.append(f"{section}: expected an object")
+    if errors:
+        raise ConfigValidationError(config_path, errors)
+
+    _check_campus(config["campus"], errors)
+    _check_string_lists(config["infrastructure"], "infrastructure", errors)
+    _check_risk_zones(config, errors)
+    _check_contacts(config["emergency_contacts"], "emergency_contacts", errors)
+    _check_string_lists(config["incident_policies"], "incident_policies", errors)
+    _check_flags(config["user_roles"], errors)
+    _check_bool_map(config["privacy_rules"], "privacy_rules", errors)
+    for key, value in config["governance"].items():
+        if not _is_text(value):
+            errors.append(f"governance.{key}: expected a non-empty string")
+    if "keywords" in config:
+        _check_keywords(config["keywords"], errors)
+    if "notifications" in config:
+        _check_notifications(config["notifications"], errors)
+    if "pipeline" in config:
+        _check_pipeline(config["pipeline"], errors)
+
+    if errors:
+        raise ConfigValidationError(config_path, errors)
+
+    return _cross_check(config)
+
+
+# ---------------- SECTION CHECKS ----------------
+
+def _is_text(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def _check_campus(campus: dict, errors: List[str]):
+    if not _is_text(campus.get("name")):
+        errors.append("campus.name: expected a non-empty string")
+
+    hours = campus.get("operating_hours")
+    if not isinstance(hours, dict):
+        errors.append("campus.operating_hours: expected an object")
+        return
+    for key in ("day_start", "night_start"):
+        value = hours.get(key)
+        if not isinstance(value, str) or not _CLOCK_TIME.match(value):
+            errors.append(f"campus.operating_hours.{key}: expected 24h 'HH:MM', got {value!r}")
+
+
+def _check_string_lists(section: dict, name: str, errors: List[str]):
+    for key, values in section.items():
+        if not isinstance(values, list):
+            errors.append(f"{name}.{key}: expected a list of strings")
+            continue
+        for index, value in enumerate(values):
+            if not _is_text(value):
+                errors.append(f"{name}.{key}[{index}]: expected a non-empty string")
+
+
+def _check_risk_zones(config: dict, errors: List[str]):
+    zones = config["risk_zones"]
+    for tier in zones:
+        if tier not in TIER_ORDER:
+            errors.append(f"risk_zones.{tier}: unknown tier, expected one of {', '.join(TIER_ORDER)}")
+    _check_string_lists(zones, "risk_zones", errors)
+
+    # Qualifiers need valid hours to be interpreted at all
+    hours = config["campus"].get("operating_hours") or {}
+    try:
+        day_start = parse_hour(hours.get("day_start", "06:00"))
+        night_start = parse_hour(hours["night_start"])
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return
+
+    for tier, entries in zones.items():
+        if not isinstance(entries, list):
+            continue
+        for index, entry in enumerate(entries):
+            match = _QUALIFIED.match(entry) if isinstance(entry, str) else None
+            if match is None:
+                continue
+            try:
+                parse_qualifier(match.group("qualifier"), day_start, night_start)
+            except ValueError as exc:
+                errors.append(f"risk_zones.{tier}[{index}]: {exc}")
+
+
+def _check_contacts(contacts: dict, path: str, errors: List[str]):
+    for key, value in contacts.items():
+        if isinstance(value, dict):
+            _check_contacts(value, f"{path}.{key}", errors)
+        elif not _is_text(value):
+            errors.append(f"{path}.{key}: expected a phone number string or an object")
+
+
+def _check_bool_map(section: dict, path: str, errors: List[str]):
+    for key, value in section.items():
+        if not isinstance(value, bool):
+            errors.append(f"{path}.{key}: expected true or false, got {value!r}")
+
+
+def _check_flags(roles: dict, errors: List[str]):
+    for role, flags in roles.items():
+        if not isinstance(flags, dict):
+            errors.append(f"user_roles.{role}: expected an object")
+            continue
+        _check_bool_map(flags, f"user_roles.{role}", errors)
+
+
+def _check_keywords(section: Any, errors: List[str]):
+    if not isinstance(section, dict):
+        errors.append("keywords: expected an object")
+        return
+
+    types = section.get("incident_types")
+    if types is not None:
+        if isinstance(types, dict):
+            _check_string_lists(types, "keywords.incident_types", errors)
+        else:
+            errors.append("keywords.incident_types: expected an object")
+
+    critical = section.get("critical")
+    if critical is not None:
+        if isinstance(critical, list):
+            _check_string_lists({"critical": critical}, "keywords", errors)
+        else:
+            errors.append("keywords.critical: expected a list of strings")
+
+
+def _check_notifications(section: Any, errors: List[str]):
+    if not isinstance(section, dict):
+        errors.append("notifications: expected an object")
+        return
+
+    transports = section.get("transports", {})
+    if not isinstance(transports, dict):
+        errors.append("notifications.transports: expected an object")
+        transports = {}
+    for name, spec in transports.items():
+        path = f"notifications.transports.{name}"
+        if not isinstance(spec, dict):
+            errors.append(f"{path}: expected an object")
+            continue
+        required = NOTIFICATION_TRANSPORTS.get(spec.get("type"))
+        if required is None:
+            errors.append(
+                f"{path}.type: expected one of {', '.join(NOTIFICATION_TRANSPORTS)}"
+            )
+            continue
+        for option in required:
+            if not _is_text(spec.get(option)):
+                errors.append(f"{path}.{option}: expected a non-empty string")
+
+    routes = section.get("routes", {})
+    if not isinstance(routes, dict):
+        errors.append("notifications.routes: expected an object")
+        routes = {}
+    _check_string_lists(routes, "notifications.routes", errors)
+    for authority, entries in routes.items():
+        for entry in entries if isinstance(entries, list) else []:
+            name = entry.partition(":")[0] if isinstance(entry, str) else None
+            if name is not None and name not in transports:
+                errors.append(f"notifications.routes.{authority}: unknown transport '{name}'")
+
+    deadlines = section.get("deadline_seconds", {})
+    if not isinstance(deadlines, dict):
+        errors.append("notifications.deadline_seconds: expected an object")
+        deadlines = {}
+    for level, seconds in deadlines.items():
+        if isinstance(seconds, bool) or not isinstance(seconds, (int, float)) or seconds <= 0:
+            errors.append(f"notifications.deadline_seconds.{level}: expected a positive number")
+
+
+def _is_timeout(value: Any) -> bool:
+    return not isinstance(value, bool) and isinstance(value, (int, float)) and value > 0
+
+
+def _check_pipeline(section: Any, errors: List[str]):
+    if not isinstance(section, dict):
+        errors.append("pipeline: expected an object")
+        return
+
+    if not isinstance(section.get("fast_path", True), bool):
+        errors.append("pipeline.fast_path: expected true or false")
+
+    stages = section.get("stages", [])
+    if not isinstance(stages, list):
+        errors.append("pipeline.stages: expected a list")
+        stages = []
+
+    # Callables are imported when the coordinator is built, not here
+    custom = []
+    for index, spec in enumerate(stages):
+        path = f"pipeline.stages[{index}]"
+        if not isinstance(spec, dict):
+            errors.append(f"{path}: expected an object")
+            continue
+        name = spec.get("name")
+        if not _is_text(name) or name in CORE_STAGES or name in RESERVED_NAMES:
+            errors.append(f"{path}.name: expected a new stage name")
+            continue
+        if not isinstance(spec.get("callable"), str) or not _STAGE_CALLABLE.match(spec["callable"]):
+            errors.append(f"{path}.callable: expected 'module:function'")
+        for key in ("after", "before"):
+            edges = spec.get(key, [])
+            if not isinstance(edges, list) or not all(_is_text(edge) for edge in edges):
+                errors.append(f"{path}.{key}: expected a list of stage names")
+                spec = {**spec, key: []}
+        if "timeout" in spec and not _is_timeout(spec["timeout"]):
+            errors.append(f"{path}.timeout: expected a positive number of seconds")
+        if not isinstance(spec.get("optional", True), bool):
+            errors.append(f"{path}.optional: expected true or false")
+        custom.append(Stage(
+            name=name,
+            run=None,
+            after=tuple(spec.get("after", ["intake"])),
+            before=tuple(spec.get("before", []))
+        ))
+
+    names = [stage.name for stage in custom]
+    if len(set(names)) != len(names):
+        errors.append("pipeline.stages: stage names must be unique")
+    else:
+        core = [Stage(name=name, run=None, after=after) for name, after in CORE_STAGES.items()]
+        try:
+            topological_order(graph_edges(core + custom, terminal="audit"))
+        except ValueError as exc:
+            errors.append(f"pipeline.stages: {exc}")
+
+    timeouts = section.get("timeouts", {})
+    if not isinstance(timeouts, dict):
+        errors.append("pipeline.timeouts: expected an object")
+        timeouts = {}
+    for name, seconds in timeouts.items():
+        if name not in CORE_STAGES:
+            errors.append(
+                f"pipeline.timeouts.{name}: expected one of {', '.join(CORE_STAGES)} "
+                f"(custom stages set their own timeout)"
+            )
+        elif not _is_timeout(seconds):
+            errors.append(f"pipeline.timeouts.{name}: expected a positive number of seconds")
+
+
+# ---------------- CROSS CHECKS ----------------
+
+def _zone_name(entry: str) -> str:
+    match = _QUALIFIED.match(entry)
+    name = match.group("name") if match else entry
+    return " ".join(name.lower().split())
+
+
+def _cross_check(config: dict) -> List[str]:
+    warnings: List[str] = []
+
+    known = {
+        " ".join(place.lower().split())
+        for places in config["infrastructure"].values()
+        for place in places
+    }
+
+    seen: Dict[str, str] = {}
+    for tier in TIER_ORDER:
+        for entry in config["risk_zones"].get(tier, []):
+            name = _zone_name(entry)
+            if name not in known:
+                warnings.append(f"risk_zones.{tier}: '{entry}' is not listed in infrastructure")
+            qualified = name != " ".join(entry.lower().split())
+            previous: Optional[str] = seen.get(name)
+            if previous is not None and not qualified and previous != tier:
+                warnings.append(
+                    f"risk_zones.{tier}: '{entry}' is also a {previous}-risk zone; the higher tier wins"
+                )
+            if not qualified:
+                seen.setdefault(name, tier)
+
+    keywords = config.get("keywords") or {}
+    incident_types = keywords.get("incident_types") or DEFAULT_INCIDENT_KEYWORDS
+    policies = config["incident_policies"]
+    for incident_type in incident_types:
+        key = policy_key_for(incident_type)
+        if key is None:
+            warnings.append(f"keywords: incident type '{incident_type}' maps to no incident policy")
+        elif not policies.get(key):
+            warnings.append(
+                f"incident_policies.{key}: missing, '{incident_type}' incidents get no escalation chain"
+            )
+
+    return warnings
@@ -1,64 +1,600 @@
-from backend.agents.intake_agent import IncidentIntakeAgent
-from backend.agents.risk_agent import RiskEvaluationAgent
-from backend.agents.response_agent import ResponsePlanningAgent
-from backend.agents.audit_agent import TrustAuditAgent
+import logging
+from dataclasses import dataclass, field, replace
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from backend.agents.intake_agent import IncidentIntakeAgent, IncidentResult
+from backend.agents.risk_agent import CRITICAL_SCORE, RiskEvaluationAgent, RiskResult
+from backend.agents.response_agent import ResponsePlanningAgent, ResponseResult, policy_key_for
+from backend.agents.audit_agent import AuditResult, ExplanationTemplate, TrustAuditAgent
 
 from backend.core.config_loader import CampusConfigLoader
+from backend.core.correlation import CorrelationMatch, IncidentCorrelator
+from backend.core.decision_cache import CachedDecision, DecisionCache, decision_key
+from backend.core.keyword_matcher import KeywordFeatures
+from backend.core.metrics import INCIDENTS_TOTAL, METRICS, STAGE_LATENCY, TIME_TO_ESCALATION
+from backend.core.registry import CampusRegistry
+from backend.core.stage_graph import CORE_STAGE_TIMEOUT, CORE_STAGES, Stage, StageGraph, stages_from_config
+from backend.core.zone_activity import ZoneActivity
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_CAMPUS_CONFIG = "backend/config/gla_university.json"
 
 
+@dataclass
+class PipelineRecord:
+    """
+    Everything the pipeline produced for one incident; handed to sinks.
+    """
+    intake: IncidentResult
+    risk: RiskResult
+    response: ResponseResult
+    audit: AuditResult
+    # Results of custom pipeline stages, by stage name
+    enrichment: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class EscalationRecord:
+    """
+    The decision to escalate, handed to escalation sinks as soon as
+    the response is planned, before the audit runs.
+    """
+    intake: IncidentResult
+    risk: RiskResult
+    response: ResponseResult
+
+
+Sink = Callable[[PipelineRecord], None]
+EscalationSink = Callable[[EscalationRecord], None]
+
+# Stages in the order iter_stages yields them
+PIPELINE_STAGES = ("intake", "risk", "response", "audit")
+
+# progress(stage, result) is called as each stage finishes
+ProgressCallback = Callable[[str, Any], None]
+
+
+@dataclass
+class BatchItemResult:
+    index: int
+    result: Optional[AuditResult] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class CoordinatorAgent:
     """
     Orchestrates the full multi-agent campus safety pipeline.
+
+    The pipeline is a StageGraph: the built-in stages plus custom ones
+    from the config's "pipeline" section or `stages`, each with an
+    optional timeout and fallback. Critical-keyword reports take the
+    fast path: their escalation is emitted before enrichment runs.
+    Escalation sinks get each response as soon as it is planned;
+    sinks get the full record once the audit is done.
     """
 
-    def __init__(self, campus_config_path: str = DEFAULT_CAMPUS_CONFIG):
-        self.config_loader = CampusConfigLoader(campus_config_path)
+    def __init__(
+        self,
+        campus_config_path: str = DEFAULT_CAMPUS_CONFIG,
+        config_loader: Optional[CampusConfigLoader] = None,
+        sinks: Optional[List[Sink]] = None,
+        escalation_sinks: Optional[List[EscalationSink]] = None,
+        correlator: Optional[IncidentCorrelator] = None,
+        decision_cache: Optional[DecisionCache] = None,
+        zone_activity: Optional[ZoneActivity] = None,
+        stages: Optional[List[Stage]] = None
+    ):
+        self.config_loader = config_loader or CampusConfigLoader(campus_config_path)
         self.campus_config = self.config_loader.get_full_config()
+        self.config_version = self.config_loader.get_config_version()
+        self.keyword_matcher = self.config_loader.get_keyword_matcher()
+        self.zone_index = self.config_loader.get_zone_index()
+
+        # Shared by reference so sinks survive config hot reloads
+        self.sinks: List[Sink] = sinks if sinks is not None else []
+        self.escalation_sinks: List[EscalationSink] = (
+            escalation_sinks if escalation_sinks is not None else []
+        )
+        self.correlator = correlator
+        self.decision_cache = decision_cache if decision_cache is not None else DecisionCache()
+        # None scores every incident on its own
+        self.zone_activity = zone_activity
 
         self.intake_agent = IncidentIntakeAgent()
         self.risk_agent = RiskEvaluationAgent()
         self.response_agent = ResponsePlanningAgent()
         self.audit_agent = TrustAuditAgent()
 
-    def process_incident(self, payload: dict):
-        intake_result = self.intake_agent.handle_incident(
-            payload, campus_config=self.campus_config
+        pipeline = self.config_loader.get_pipeline()
+        self.fast_path = pipeline.get("fast_path", True)
+        self.graph = self._build_graph(
+            pipeline.get("timeouts", {}),
+            stages_from_config(pipeline) + list(stages or [])
         )
 
-        risk_result = self.risk_agent.evaluate_risk(
-            intake_result, campus_config=self.campus_config
+    def process_incident(
+        self,
+        payload: dict,
+        features: Optional[KeywordFeatures] = None,
+        progress: Optional[ProgressCallback] = None
+    ):
+        result = None
+        for stage, result in self.iter_stages(payload, features=features):
+            if progress is not None:
+                progress(stage, result)
+        # The last stage is the audit
+        return result
+
+    def iter_stages(
+        self,
+        payload: dict,
+        features: Optional[KeywordFeatures] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Runs the pipeline and yields (stage, result) as each agent
+        finishes: intake, risk, response, audit. `features` is an
+        earlier keyword scan of the same description, if one exists.
+        """
+        started = perf_counter()
+        results: Dict[str, Any] = {"payload": payload, "features": features}
+
+        for stage, result in self.graph.run(
+            results, fast_path=_critical_hit if self.fast_path else None
+        ):
+            if stage == "response":
+                if METRICS.enabled:
+                    TIME_TO_ESCALATION.observe(perf_counter() - started, results["risk"].risk_level)
+                self._escalate(EscalationRecord(results["intake"], results["risk"], result))
+            if stage == "audit":
+                self._publish(PipelineRecord(
+                    results["intake"], results["risk"], results["response"], result,
+                    enrichment={
+                        name: value for name, value in results.items()
+                        if name in self.graph.stages and name not in CORE_STAGES
+                    }
+                ))
+            if stage in PIPELINE_STAGES:
+                yield stage, result
+
+    # ---------------- ASYNC ENTRY POINTS ----------------
+
+    async def process_incident_async(self, payload: dict) -> AuditResult:
+        """
+        Runs the pipeline in a worker thread so the event loop stays free.
+        """
+        return await _to_thread(self.process_incident, payload)
+
+    async def astream_incident(self, payload: dict) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Async variant of iter_stages: every stage runs off the event
+        loop and is yielded as soon as it completes.
+        """
+        stages = self.iter_stages(payload)
+        while True:
+            step = await _to_thread(next, stages, None)
+            if step is None:
+                return
+            yield step
+
+    def process_batch(self, payloads: Iterable[dict]) -> List[BatchItemResult]:
+        """
+        Runs a batch stage by stage against one config snapshot.
+
+        Results keep input order; a failing item only marks its own
+        slot with an error and drops out of the later stages. Custom
+        stages and stage timeouts only apply to single incidents.
+        """
+        payloads = list(payloads)
+        items = [BatchItemResult(index=i) for i in range(len(payloads))]
+
+        intakes = self._run_stage(items, "intake", lambda i: self.intake_agent.handle_incident(
+            payloads[i], campus_config=self.campus_config, matcher=self.keyword_matcher
+        ))
+        # Correlate in input order so the first report of a storm is primary
+        matches = self._run_stage(items, "correlation", lambda i: self._correlate(intakes[i]))
+        assessed = self._run_stage(items, "risk", lambda i: self._assess(intakes[i]))
+        plans = self._run_stage(items, "response", lambda i: self._plan(
+            intakes[i], *assessed[i]
+        ))
+
+        risks = {i: risk for i, (risk, _, _) in assessed.items()}
+        # In input order, so a storm's first report sets the level
+        # later ones are compared against
+        responses = {
+            i: self._attach_to_open_incident(response, matches[i], intakes[i], risks[i])
+            for i, (response, _) in plans.items()
+        }
+        for i, response in responses.items():
+            self._escalate(EscalationRecord(intakes[i], risks[i], response))
+        audits = self._run_stage(items, "audit", lambda i: self.audit_agent.audit_decision(
+            intakes[i], risks[i], responses[i],
+            campus_config=self.campus_config,
+            template=plans[i][1]
+        ))
+
+        for i, audit_result in audits.items():
+            audit_result.config_version = self.config_version
+            items[i].result = audit_result
+            self._publish(PipelineRecord(intakes[i], risks[i], responses[i], audit_result))
+
+        return items
+
+    # ---------------- PIPELINE STAGES ----------------
+
+    def _build_graph(self, timeouts: Dict[str, float], custom: List[Stage]) -> StageGraph:
+        # Once anything runs on the pool the core stages get deadlines
+        # too; with no timeouts at all they stay on the caller's thread
+        pooled = bool(timeouts) or any(stage.timeout is not None for stage in custom)
+        default_timeout = CORE_STAGE_TIMEOUT if pooled else None
+        runs = {
+            "intake": self._run_intake,
+            "correlation": lambda results: self._correlate(results["intake"]),
+            "risk": self._run_risk,
+            "response": self._run_response,
+            "audit": self._run_audit,
+        }
+        fallbacks = {
+            "intake": None,
+            "correlation": lambda results: None,
+            "risk": self._fallback_risk,
+            "response": self._fallback_response,
+            "audit": self._fallback_audit,
+        }
+        core = [
+            Stage(
+                name=name,
+                run=runs[name],
+                after=after,
+                timeout=timeouts.get(name, default_timeout),
+                fallback=fallbacks[name]
+            )
+            for name, after in CORE_STAGES.items()
+        ]
+        return StageGraph(core + custom, fast_target="response", terminal="audit")
+
+    def _run_intake(self, results: Dict[str, Any]) -> IncidentResult:
+        return self.intake_agent.handle_incident(
+            results["payload"],
+            campus_config=self.campus_config,
+            matcher=self.keyword_matcher,
+            features=results["features"]
         )
 
-        response_result = self.response_agent.plan_response(
-            intake_result, risk_result, campus_config=self.campus_config
+    def _run_risk(self, results: Dict[str, Any]) -> RiskResult:
+        risk_result, cached, key = self._assess(results["intake"])
+        # Kept for the response stage; tied to this exact result so a
+        # timed-out assessment finishing late is never picked up
+        results["risk_decision"] = (risk_result, cached, key)
+        return risk_result
+
+    def _run_response(self, results: Dict[str, Any]) -> ResponseResult:
+        risk_result = results["risk"]
+        decision = results.get("risk_decision")
+        cached, key = decision[1:] if decision and decision[0] is risk_result else (None, None)
+
+        response_result, template = self._plan(results["intake"], risk_result, cached, key)
+        response_result = self._attach_to_open_incident(
+            response_result, results.get("correlation"), results["intake"], risk_result
         )
+        results["response_template"] = (response_result, template)
+        return response_result
+
+    def _run_audit(self, results: Dict[str, Any]) -> AuditResult:
+        response_result = results["response"]
+        planned = results.get("response_template")
+        template = planned[1] if planned and planned[0] is response_result else None
 
         audit_result = self.audit_agent.audit_decision(
+            results["intake"],
+            results["risk"],
+            response_result,
+            campus_config=self.campus_config,
+            template=template
+        )
+        audit_result.config_version = self.config_version
+        return audit_result
+
+    def _fallback_risk(self, results: Dict[str, Any]) -> RiskResult:
+        # Safety first: an unassessed incident is treated as High
+        return RiskResult(
+            risk_score=CRITICAL_SCORE,
+            risk_level="High",
+            reason="Risk assessment did not complete in time; treated as High pending review"
+        )
+
+    def _fallback_response(self, results: Dict[str, Any]) -> ResponseResult:
+        intake_result = results["intake"]
+        policies = self.campus_config.get("incident_policies", {})
+        return self._attach_to_open_incident(
+            ResponseResult(
+                recommended_action=(
+                    "Immediate escalation as per campus safety policy "
+                    "(response planning did not complete in time)"
+                ),
+                priority_level="Immediate",
+                escalation_chain=list(policies.get(policy_key_for(intake_result.incident_type), []))
+            ),
+            results.get("correlation"),
             intake_result,
-            risk_result,
+            results["risk"]
+        )
+
+    def _fallback_audit(self, results: Dict[str, Any]) -> AuditResult:
+        response_result = results["response"]
+        return AuditResult(
+            final_decision=response_result.recommended_action,
+            risk_level=results["risk"].risk_level,
+            confidence_level=results["intake"].confidence_level,
+            escalation_chain=response_result.escalation_chain,
+            explanation="The decision explanation could not be generated in time.",
+            config_version=self.config_version,
+            duplicate_of=response_result.duplicate_of,
+            location=results["intake"].location
+        )
+
+    def _assess(
+        self,
+        intake_result: IncidentResult
+    ) -> Tuple[RiskResult, Optional[CachedDecision], tuple]:
+        features = self.risk_agent.extract_features(
+            intake_result,
+            campus_config=self.campus_config,
+            matcher=self.keyword_matcher,
+            zone_index=self.zone_index,
+            activity=self.zone_activity
+        )
+        key = decision_key(self.config_version, intake_result.incident_type, features)
+
+        cached = self.decision_cache.get(key)
+        if cached is not None:
+            return cached.risk_for(features), cached, key
+        return self.risk_agent.score_features(features), None, key
+
+    def _plan(
+        self,
+        intake_result: IncidentResult,
+        risk_result: RiskResult,
+        cached: Optional[CachedDecision],
+        key: tuple
+    ) -> Tuple[ResponseResult, ExplanationTemplate]:
+        if cached is not None:
+            return cached.response, cached.template
+
+        response_result = self.response_agent.plan_response(
+            intake_result, risk_result, campus_config=self.campus_config
+        )
+        template = self.audit_agent.explanation_template(
+            intake_result.incident_type,
+            risk_result.risk_level,
+            response_result.escalation_chain
+        )
+        if key is not None:
+            self.decision_cache.put(key, CachedDecision(risk_result, response_result, template))
+        return response_result, template
+
+    def _correlate(self, intake_result: IncidentResult) -> Optional[CorrelationMatch]:
+        if self.correlator is None:
+            return None
+        return self.correlator.observe(intake_result)
+
+    def _attach_to_open_incident(
+        self,
+        response_result: ResponseResult,
+        match: Optional[CorrelationMatch],
+        intake_result: IncidentResult,
+        risk_result: RiskResult
+    ) -> ResponseResult:
+        if self.correlator is None:
+            return response_result
+        match = self.correlator.settle(intake_result.incident_id, risk_result.risk_level, match)
+        if match is None:
+            return response_result
+        if match.upgrade:
+            # Riskier than anything escalated for the open incident so
+            # far: escalate this report in full
+            return replace(
+                response_result,
+                recommended_action=(
+                    f"{response_result.recommended_action}; raises open incident "
+                    f"{match.primary_id} from {match.risk_level or 'unassessed'} "
+                    f"to {risk_result.risk_level} (report #{match.report_count})"
+                )
+            )
+        # Same chain for context, but no second escalation
+        return replace(
             response_result,
-            campus_config=self.campus_config
+            recommended_action=(
+                f"Linked to open incident {match.primary_id} "
+                f"(report #{match.report_count}); escalation already in progress"
+            ),
+            duplicate_of=match.primary_id
         )
 
-        return audit_result
+    def _publish(self, record: PipelineRecord):
+        _notify(self.sinks, record)
 
+    def _escalate(self, record: EscalationRecord):
+        _call_sinks(self.escalation_sinks, record)
 
-def run_pipeline(incident_text: str, location: str, user_role: str):
-    coordinator = CoordinatorAgent()
+    @staticmethod
+    def _run_stage(items: List[BatchItemResult], name: str, stage) -> dict:
+        outputs = {}
+        timed = METRICS.enabled
+        for item in items:
+            if not item.ok:
+                continue
+            started = perf_counter() if timed else 0.0
+            try:
+                outputs[item.index] = stage(item.index)
+            except Exception as exc:
+                item.error = f"{type(exc).__name__}: {exc}"
+            if timed:
+                STAGE_LATENCY.observe(perf_counter() - started, name)
+        return outputs
+
+
+def _critical_hit(results: Dict[str, Any]) -> bool:
+    # The same keyword hits that make the risk agent score High
+    intake_result = results.get("intake")
+    features = getattr(intake_result, "features", None)
+    return features is not None and features.critical
+
+
+async def _to_thread(fn, *args):
+    # asyncio is imported on first use: it is ~90ms of cold start and
+    # the sync entry points (NDJSON stream, shard workers) never need it
+    import asyncio
+
+    return await asyncio.to_thread(fn, *args)
+
+
+# Process-wide sinks, shared by every coordinator the registry builds
+_sinks: List[Sink] = []
+_escalation_sinks: List[EscalationSink] = []
+
+# Per-campus state, carried across config hot reloads
+_correlators: Dict[str, IncidentCorrelator] = {}
+_decision_caches: Dict[str, DecisionCache] = {}
+_zone_activity: Dict[str, ZoneActivity] = {}
+
+
+def _build_coordinator(loader: CampusConfigLoader) -> "CoordinatorAgent":
+    decision_cache = _decision_caches.setdefault(loader.config_path, DecisionCache())
+    # Decisions from an older config version must never be served
+    decision_cache.invalidate(loader.get_config_version())
+
+    return CoordinatorAgent(
+        config_loader=loader,
+        sinks=_sinks,
+        escalation_sinks=_escalation_sinks,
+        correlator=_correlators.setdefault(loader.config_path, IncidentCorrelator()),
+        decision_cache=decision_cache,
+        zone_activity=_zone_activity.setdefault(loader.config_path, ZoneActivity())
+    )
+
+
+# Process-wide registry: configs are parsed once and hot-reloaded on change
+_registry = CampusRegistry(factory=_build_coordinator)
+
+
+def _notify(sinks: List[Sink], record: PipelineRecord):
+    if METRICS.enabled:
+        INCIDENTS_TOTAL.inc(record.risk.risk_level, record.intake.incident_type)
+    _call_sinks(sinks, record)
+
+
+def _call_sinks(sinks: List[Callable[[Any], None]], record: Any):
+    for sink in sinks:
+        try:
+            sink(record)
+        except Exception:
+            # Sinks are observers; they must never fail a report
+            logger.exception("Pipeline sink %r failed", sink)
+
+
+def publish_record(record: PipelineRecord):
+    """
+    Hands a record produced in another process to this process's sinks.
+    """
+    _notify(_sinks, record)
+
+
+def publish_escalation(record: EscalationRecord):
+    """
+    Hands an escalation produced in another process to this process's
+    escalation sinks.
+    """
+    _call_sinks(_escalation_sinks, record)
+
+
+def get_registry() -> CampusRegistry:
+    return _registry
 
-    payload = {
+
+def add_sink(sink: Sink):
+    if sink not in _sinks:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: Sink):
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def add_escalation_sink(sink: EscalationSink):
+    if sink not in _escalation_sinks:
+        _escalation_sinks.append(sink)
+
+
+def remove_escalation_sink(sink: EscalationSink):
+    if sink in _escalation_sinks:
+        _escalation_sinks.remove(sink)
+
+
+def get_coordinator(config_path: str = DEFAULT_CAMPUS_CONFIG) -> CoordinatorAgent:
+    return _registry.get(config_path)
+
+
+def build_payload(
+    incident_text: str,
+    location: str,
+    user_role: str,
+    anonymous: bool = False,
+    panic: bool = False
+) -> dict:
+    return {
         "source": user_role,
         "description": incident_text,
         "location": location,
-        "anonymous": False,
+        "anonymous": anonymous,
+        "panic": panic,
     }
 
-    audit_result = coordinator.process_incident(payload)
 
+def _pipeline_result(coordinator: CoordinatorAgent, audit_result: AuditResult) -> dict:
     return {
         "final": audit_result,
         "campus": coordinator.config_loader.get_campus_name(),
+        "config_version": coordinator.config_version,
         "emergency_contacts": coordinator.config_loader.get_emergency_contacts(),
     }
+
+
+def run_payload(
+    payload: dict,
+    features: Optional[KeywordFeatures] = None,
+    config_path: str = DEFAULT_CAMPUS_CONFIG
+) -> dict:
+    """
+    Handler for the ingestion queue: resolves the coordinator at run
+    time so queued incidents pick up a config reload.
+    """
+    coordinator = get_coordinator(config_path)
+    audit_result = coordinator.process_incident(payload, features=features)
+    return _pipeline_result(coordinator, audit_result)
+
+
+def run_pipeline(incident_text: str, location: str, user_role: str):
+    coordinator = get_coordinator()
+
+    payload = build_payload(incident_text, location, user_role)
+
+    audit_result = coordinator.process_incident(payload)
+
+    return _pipeline_result(coordinator, audit_result)
+
+
+async def run_pipeline_async(incident_text: str, location: str, user_role: str):
+    coordinator = await _to_thread(get_coordinator)
+
+    payload = build_payload(incident_text, location, user_role)
+
+    audit_result = await coordinator.process_incident_async(payload)
+
+    return _pipeline_result(coordinator, audit_result)
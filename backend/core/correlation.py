@@ -0,0 +1,277 @@
+import hashlib
+import re
+import struct
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.agents.risk_agent import RISK_LEVELS
+
+_TOKEN = re.compile(r"\w+")
+_MAX_HASH = (1 << 32) - 1
+_SIGNATURE_CACHE_SIZE = 4096
+_RISK_RANK = {level: rank for rank, level in enumerate(RISK_LEVELS)}
+
+# Incident types whose storm reports match on type alone: many people
+# report one fire in their own words. Two thefts at the library are
+# two incidents unless their descriptions match.
+STORM_TYPES = ("Fire", "Medical Emergency", "Lab Hazard")
+
+
+@dataclass(frozen=True)
+class CorrelationMatch:
+    primary_id: str
+    report_count: int
+    similarity: float
+    # Set by settle(): the open incident's risk level before this
+    # report, and whether this report raised it
+    risk_level: Optional[str] = None
+    upgrade: bool = False
+
+
+@dataclass
+class _OpenIncident:
+    primary_id: str
+    location_key: str
+    incident_type: str
+    signature: Tuple[int, ...]
+    first_seen: float
+    last_seen: float
+    report_count: int = 1
+    bucket_keys: List[tuple] = field(default_factory=list)
+    # Highest level any of its reports was escalated at; None until
+    # the first report has been assessed
+    risk_level: Optional[str] = None
+    upgrades: int = 0
+
+
+class IncidentCorrelator:
+    """
+    Incident Correlator
+    -------------------
+    Collapses report storms: a new report that matches an open incident
+    at the same location inside a sliding time window is attached to it
+    instead of triggering a fresh escalation.
+
+    - Descriptions are word-shingled and MinHashed; LSH band buckets
+      keyed by location give O(bands) candidate lookup
+    - Same location + same incident type also matches for
+      `storm_types`, since storm reports of one fire rarely share
+      wording; other types need similar descriptions
+    - A report only matches an incident seen within `window_seconds`
+      of its own timestamp, so replayed reports arriving out of order
+      are judged by event time, and opened at most `max_age_seconds`
+      before it, so a busy location does not keep one incident open
+      forever
+    - settle() keeps a matched report attached only if the incident
+      already escalated at its risk level or higher; a riskier report
+      escalates on its own and raises the incident's level
+    - Open incidents are capped and expire after `window_seconds`,
+      so memory stays bounded
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        similarity_threshold: float = 0.4,
+        num_perm: int = 32,
+        bands: int = 8,
+        max_open: int = 4096,
+        match_on_type: bool = True,
+        storm_types: Iterable[str] = STORM_TYPES,
+        max_age_seconds: float = 1800.0,
+        seed: int = 7
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.window_seconds = window_seconds
+        self.similarity_threshold = similarity_threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_open = max_open
+        self.match_on_type = match_on_type
+        self.storm_types = frozenset(storm_types)
+        self.max_age_seconds = max_age_seconds
+
+        # One seeded SHAKE-128 digest per shingle yields all num_perm
+        # hash values at once; the per-position minimum runs in C
+        self._salt = seed.to_bytes(8, "little")
+        self._unpack = struct.Struct(f"<{num_perm}I").unpack
+        self._digest_size = 4 * num_perm
+
+        # Sensor gateways repeat templated text; signatures are memoized
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._open: "OrderedDict[str, _OpenIncident]" = OrderedDict()
+        self._buckets: Dict[tuple, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, incident_result: Any) -> Optional[CorrelationMatch]:
+        """
+        Returns the open incident this report belongs to, or registers
+        the report as a new open incident and returns None.
+        """
+        now = _event_time(incident_result.timestamp)
+        location_key = " ".join(_TOKEN.findall(incident_result.location.lower()))
+        signature = self._signature(incident_result.description)
+        band_keys = self._band_keys(location_key, signature)
+        same_type = self.match_on_type and incident_result.incident_type in self.storm_types
+        type_key = (location_key, "type", incident_result.incident_type)
+
+        with self._lock:
+            self._expire(now)
+
+            candidates: Set[str] = set()
+            for key in band_keys:
+                candidates |= self._buckets.get(key, set())
+            if same_type:
+                candidates |= self._buckets.get(type_key, set())
+
+            best, best_similarity = None, -1.0
+            for primary_id in candidates:
+                incident = self._open[primary_id]
+                if incident.incident_type != incident_result.incident_type:
+                    continue
+                if abs(now - incident.last_seen) > self.window_seconds:
+                    continue
+                if now - incident.first_seen > self.max_age_seconds:
+                    continue
+                similarity = self._similarity(signature, incident.signature)
+                if similarity < self.similarity_threshold and not same_type:
+                    continue
+                if similarity > best_similarity:
+                    best, best_similarity = incident, similarity
+
+            if best is not None:
+                best.report_count += 1
+                best.last_seen = max(best.last_seen, now)
+                self._open.move_to_end(best.primary_id)
+                return CorrelationMatch(
+                    primary_id=best.primary_id,
+                    report_count=best.report_count,
+                    similarity=best_similarity
+                )
+
+            incident = _OpenIncident(
+                primary_id=incident_result.incident_id,
+                location_key=location_key,
+                incident_type=incident_result.incident_type,
+                signature=signature,
+                first_seen=now,
+                last_seen=now,
+                bucket_keys=band_keys + [type_key] if same_type else band_keys
+            )
+            self._open[incident.primary_id] = incident
+            for key in incident.bucket_keys:
+                self._buckets.setdefault(key, set()).add(incident.primary_id)
+
+            while len(self._open) > self.max_open:
+                self._evict(next(iter(self._open)))
+
+            return None
+
+    def settle(
+        self,
+        incident_id: str,
+        risk_level: str,
+        match: Optional[CorrelationMatch] = None
+    ) -> Optional[CorrelationMatch]:
+        """
+        Records the risk level a report was assessed at. Returns `match`
+        with the incident's previous level filled in, or None when the
+        report opened its incident or the incident has since expired.
+        A returned match with `upgrade` set must be escalated: no report
+        of that incident was escalated at this level yet.
+        """
+        rank = _RISK_RANK.get(risk_level, len(_RISK_RANK))
+        with self._lock:
+            if match is None:
+                incident = self._open.get(incident_id)
+                if incident is not None:
+                    self._raise_level(incident, risk_level, rank)
+                return None
+
+            incident = self._open.get(match.primary_id)
+            if incident is None:
+                return None
+            previous = incident.risk_level
+            # An incident still being assessed has escalated nothing yet
+            upgrade = previous is None or rank > _RISK_RANK.get(previous, len(_RISK_RANK))
+            if upgrade:
+                self._raise_level(incident, risk_level, rank)
+                incident.upgrades += 1
+            return replace(match, risk_level=previous, upgrade=upgrade)
+
+    def open_count(self) -> int:
+        return len(self._open)
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _signature(self, text: str) -> Tuple[int, ...]:
+        text = text.lower()
+        signature = self._signatures.get(text)
+        if signature is not None:
+            return signature
+
+        tokens = _TOKEN.findall(text)
+        shingles = set(tokens)
+        shingles.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        if not shingles:
+            return tuple([_MAX_HASH] * self.num_perm)
+
+        salt, unpack, size = self._salt, self._unpack, self._digest_size
+        rows = [
+            unpack(hashlib.shake_128(salt + s.encode("utf-8")).digest(size))
+            for s in shingles
+        ]
+        signature = tuple(map(min, zip(*rows)))
+
+        # Crude bound: start over rather than track recency per lookup
+        if len(self._signatures) >= _SIGNATURE_CACHE_SIZE:
+            self._signatures.clear()
+        self._signatures[text] = signature
+        return signature
+
+    def _band_keys(self, location_key: str, signature: Tuple[int, ...]) -> List[tuple]:
+        return [
+            (location_key, band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _similarity(self, left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        return sum(1 for x, y in zip(left, right) if x == y) / self.num_perm
+
+    @staticmethod
+    def _raise_level(incident: _OpenIncident, risk_level: str, rank: int):
+        if incident.risk_level is None or rank > _RISK_RANK.get(incident.risk_level, len(_RISK_RANK)):
+            incident.risk_level = risk_level
+
+    def _expire(self, now: float):
+        # Memory bound only; observe() checks each candidate's age
+        horizon = now - self.window_seconds
+        while self._open:
+            primary_id, incident = next(iter(self._open.items()))
+            if incident.last_seen >= horizon:
+                break
+            self._evict(primary_id)
+
+    def _evict(self, primary_id: str):
+        incident = self._open.pop(primary_id)
+        for key in incident.bucket_keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.discard(primary_id)
+            if not bucket:
+                del self._buckets[key]
+
+
+def _event_time(timestamp: str) -> float:
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
@@ -1,11 +1,16 @@
-from crewai import Agent, Task, Crew
-
-
 def build_crewai_pipeline():
     """
     CrewAI-inspired pipeline wrapper
     (Conceptual alignment, not execution replacement)
+
+    crewai is heavy and optional, so it is only imported here.
     """
+    try:
+        from crewai import Agent, Task, Crew
+    except ImportError as exc:
+        raise ImportError(
+            "build_crewai_pipeline needs the optional 'crewai' package"
+        ) from exc
 
     planner = Agent(
         role="Planner",
@@ -0,0 +1,108 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional
+
+from backend.agents.audit_agent import ExplanationTemplate
+from backend.agents.response_agent import ResponseResult
+from backend.agents.risk_agent import RiskFeatures, RiskResult
+from backend.core.metrics import METRICS
+
+DECISION_CACHE_LOOKUPS = METRICS.counter(
+    "campus_decision_cache_lookups_total",
+    "Decision cache lookups",
+    ("result",)
+)
+
+
+@dataclass(frozen=True)
+class CachedDecision:
+    risk: RiskResult
+    response: ResponseResult
+    template: ExplanationTemplate
+
+    def risk_for(self, features: RiskFeatures) -> RiskResult:
+        # Zone name varies inside a tier; everything else is shared.
+        # Direct construction: dataclasses.replace is several times slower.
+        return RiskResult(
+            risk_score=self.risk.risk_score,
+            risk_level=self.risk.risk_level,
+            reason=self.risk.reason,
+            zone=features.zone,
+            zone_tier=features.zone_tier
+        )
+
+
+def decision_key(config_version: str, incident_type: str, features: RiskFeatures) -> tuple:
+    """
+    Normalized features the risk, response and audit outcome depend on.
+    The keyword override ignores zone, time and confidence entirely.
+    """
+    if features.critical:
+        return (config_version, incident_type, True)
+    return (
+        config_version,
+        incident_type,
+        False,
+        features.zone_tier,
+        features.night,
+        features.confidence_level,
+        features.activity_boost,
+    )
+
+
+class DecisionCache:
+    """
+    Decision Cache
+    --------------
+    Bounded LRU of pipeline decisions keyed on normalized incident
+    features. Keys carry the config version; `invalidate` drops
+    entries from older versions when a campus config is reloaded.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, CachedDecision]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedDecision]:
+        with self._lock:
+            decision = self._entries.get(key)
+            if decision is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+        if METRICS.enabled:
+            DECISION_CACHE_LOOKUPS.inc("miss" if decision is None else "hit")
+        return decision
+
+    def put(self, key: Hashable, decision: CachedDecision):
+        with self._lock:
+            self._entries[key] = decision
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, config_version: Optional[str] = None):
+        """
+        Drops every entry not built from `config_version` (all if None).
+        """
+        with self._lock:
+            if config_version is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] != config_version]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
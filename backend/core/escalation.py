@@ -0,0 +1,493 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.core.campus_router import DEFAULT_CAMPUS_ID
+from backend.core.metrics import METRICS
+from backend.core.transports import PermanentDeliveryError, build_transport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTBOX_PATH = "backend/data/notifications.db"
+
+# Seconds after the report by which a notification must be delivered
+DEFAULT_DEADLINES = {"High": 120.0, "Medium": 900.0, "Low": 3600.0}
+
+# Matched by authorities with no route of their own
+DEFAULT_ROUTE = "*"
+
+NOTIFICATIONS_TOTAL = METRICS.counter(
+    "campus_notifications_total",
+    "Escalation notifications by transport and outcome",
+    ("transport", "outcome")
+)
+NOTIFICATION_LATENCY = METRICS.histogram(
+    "campus_notification_delivery_seconds",
+    "Time from report to delivered notification",
+    ("transport",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id TEXT PRIMARY KEY,
+    campus_id TEXT NOT NULL,
+    transport TEXT NOT NULL,
+    body TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    deadline REAL NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt);
+"""
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    id: str
+    campus_id: str
+    transport: str
+    body: str
+    attempts: int
+    deadline: float
+    created: float
+
+
+class EscalationOutbox:
+    """
+    Escalation Outbox
+    -----------------
+    SQLite table of notifications still to be delivered.
+
+    - Rows are committed before dispatch, so a crash never loses an
+      escalation; rows caught mid-send are re-queued on the next start
+      (delivery is at least once)
+    - Status moves pending -> sending -> sent | failed | expired
+    - One connection behind a lock; every call is a short transaction
+    """
+
+    def __init__(self, db_path: str = DEFAULT_OUTBOX_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def add(self, rows: List[Tuple[str, str, str, str, float, float]]):
+        """
+        Queues (id, campus_id, transport, body, deadline, now) rows.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO outbox "
+                "(id, campus_id, transport, body, status, next_attempt, deadline, created, updated) "
+                "VALUES (?1, ?2, ?3, ?4, 'pending', ?6, ?5, ?6, ?6)",
+                rows
+            )
+            self._conn.execute("COMMIT")
+
+    def claim(self, now: float, limit: int) -> List[OutboxEntry]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT id, campus_id, transport, body, attempts, deadline, created FROM outbox "
+                "WHERE status = 'pending' AND next_attempt <= ? ORDER BY next_attempt LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE outbox SET status = 'sending', updated = ? WHERE id = ?",
+                [(now, row[0]) for row in rows]
+            )
+            self._conn.execute("COMMIT")
+        return [OutboxEntry(*row) for row in rows]
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'"
+            ).fetchone()
+        return row[0]
+
+    def sent(self, entry_id: str, attempts: int, now: float):
+        self._update(entry_id, "sent", attempts, now, None)
+
+    def retry(self, entry_id: str, attempts: int, next_attempt: float, error: str, now: float):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'pending', attempts = ?, next_attempt = ?, "
+                "last_error = ?, updated = ? WHERE id = ?",
+                (attempts, next_attempt, error, now, entry_id)
+            )
+
+    def give_up(self, entry_id: str, status: str, attempts: int, error: str, now: float):
+        self._update(entry_id, status, attempts, now, error)
+
+    def recover(self) -> int:
+        """
+        Re-queues rows left in 'sending' by a stopped process.
+        """
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE outbox SET status = 'pending' WHERE status = 'sending'"
+            ).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        return dict(rows)
+
+    def entries(self, status: Optional[str] = None) -> List[dict]:
+        sql = "SELECT id, transport, body, status, attempts, last_error FROM outbox"
+        params: Tuple = ()
+        if status is not None:
+            sql += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY created, id", params).fetchall()
+        return [
+            {"id": row[0], "transport": row[1], "notification": json.loads(row[2]),
+             "status": row[3], "attempts": row[4], "last_error": row[5]}
+            for row in rows
+        ]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _update(self, entry_id: str, status: str, attempts: int, now: float, error: Optional[str]):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ?, updated = ? WHERE id = ?",
+                (status, attempts, error, now, entry_id)
+            )
+
+
+@dataclass(frozen=True)
+class Route:
+    transport: str
+    recipient: Optional[str] = None
+
+
+class NotificationRouting:
+    """
+    Compiled "notifications" section of a campus config:
+
+        "notifications": {
+          "transports": {
+            "desk": {"type": "webhook", "url": "http://security-desk.local/hooks"},
+            "sms": {"type": "sms", "url": "http://sms-gateway.local/send", "sender": "CAMPUS"}
+          },
+          "routes": {
+            "*": ["desk"],
+            "Campus Security": ["sms:campus_security", "desk"]
+          },
+          "deadline_seconds": {"High": 120}
+        }
+
+    A route is "transport" or "transport:recipient"; the recipient is an
+    emergency_contacts key (dotted for nested ones) or a literal address.
+    Without one, the authority's own contact key is tried
+    ("Campus Security" -> campus_security).
+    """
+
+    def __init__(self, section: dict, contacts: Optional[dict] = None):
+        self.transports: Dict[str, dict] = dict(section.get("transports", {}))
+        self.deadlines = {**DEFAULT_DEADLINES, **section.get("deadline_seconds", {})}
+        self._contacts = contacts or {}
+        self._routes = {
+            authority: [self._route(entry, authority) for entry in entries]
+            for authority, entries in section.get("routes", {}).items()
+        }
+
+    @classmethod
+    def from_config(cls, campus_config: dict) -> Optional["NotificationRouting"]:
+        section = campus_config.get("notifications")
+        if not section:
+            return None
+        return cls(section, campus_config.get("emergency_contacts"))
+
+    def routes_for(self, authority: str) -> List[Route]:
+        routes = self._routes.get(authority)
+        if routes is None:
+            routes = [
+                Route(route.transport, route.recipient or self._contact(authority))
+                for route in self._routes.get(DEFAULT_ROUTE, [])
+            ]
+        return routes
+
+    def deadline_for(self, risk_level: str) -> float:
+        return float(self.deadlines.get(risk_level, DEFAULT_DEADLINES["Low"]))
+
+    def _route(self, entry: str, authority: str) -> Route:
+        transport, _, recipient = entry.partition(":")
+        if recipient:
+            return Route(transport, self._contact(recipient) or recipient)
+        return Route(transport, self._contact(authority))
+
+    def _contact(self, key: str) -> Optional[str]:
+        value: Any = self._contacts
+        for part in key.lower().replace(" ", "_").split("."):
+            if not isinstance(value, dict) or part not in value:
+                return None
+            value = value[part]
+        return value if isinstance(value, str) else None
+
+
+class EscalationDispatcher:
+    """
+    Escalation Dispatcher
+    ---------------------
+    Escalation sink that notifies every authority in the escalation
+    chain as soon as the response is planned.
+
+    - record() only writes the notifications to the durable outbox and
+      wakes the dispatcher, so reports never wait on a gateway
+    - A background event loop sends due notifications concurrently
+      (at most `concurrency` in flight) over pooled transports
+    - Failed sends are retried with jittered exponential backoff until
+      the per-risk-level deadline; permanent failures stop at once
+    - Reports linked to an open incident (duplicate_of) are not sent
+      again: the first report already escalated
+    """
+
+    def __init__(
+        self,
+        outbox: EscalationOutbox,
+        config_for: Callable[[str], dict],
+        concurrency: int = 16,
+        attempt_timeout: float = 10.0,
+        max_attempts: int = 8,
+        backoff: float = 0.5,
+        max_backoff: float = 60.0,
+        poll_interval: float = 1.0,
+        default_campus: str = DEFAULT_CAMPUS_ID,
+        clock: Callable[[], float] = time.time
+    ):
+        self.outbox = outbox
+        self.config_for = config_for
+        self.concurrency = concurrency
+        self.attempt_timeout = attempt_timeout
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+        self.default_campus = default_campus
+        self.clock = clock
+
+        self._routing: Dict[str, Tuple[dict, Optional[NotificationRouting]]] = {}
+        self._transports: Dict[str, Any] = {}
+        self._inflight = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._drain_timeout = 5.0
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------------- LIFECYCLE ----------------
+
+    def start(self):
+        recovered = self.outbox.recover()
+        if recovered:
+            logger.warning("Re-queued %d notifications interrupted mid-send", recovered)
+        self._thread = threading.Thread(target=self._thread_main, name="escalation-dispatcher", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def close(self, timeout: float = 5.0):
+        """
+        Stops dispatching; in-flight sends get `timeout` seconds to
+        finish and anything left stays in the outbox for the next start.
+        """
+        if self._thread is None:
+            return
+        self._drain_timeout = timeout
+        self._stopping = True
+        self._wakeup()
+        self._thread.join(timeout + 1.0)
+        self._thread = None
+
+    # ---------------- SINK ----------------
+
+    def record(self, record: Any):
+        """
+        Escalation sink: queues one notification per authority and route.
+        """
+        response = record.response
+        if response.duplicate_of:
+            if METRICS.enabled:
+                NOTIFICATIONS_TOTAL.inc("-", "duplicate")
+            return
+
+        campus_id = str((record.intake.raw_payload or {}).get("campus_id") or self.default_campus)
+        routing = self._routing_for(campus_id)
+        if routing is None:
+            return
+
+        intake = record.intake
+        now = self.clock()
+        deadline = now + routing.deadline_for(record.risk.risk_level)
+        rows = []
+        for step, authority in enumerate(response.escalation_chain, start=1):
+            for route in routing.routes_for(authority):
+                notification_id = f"{intake.incident_id}:{step}:{route.transport}"
+                notification = {
+                    "notification_id": notification_id,
+                    "incident_id": intake.incident_id,
+                    "campus_id": campus_id,
+                    "authority": authority,
+                    "step": step,
+                    "recipient": route.recipient,
+                    "risk_level": record.risk.risk_level,
+                    "incident_type": intake.incident_type,
+                    "location": intake.location,
+                    "priority": response.priority_level,
+                    "action": response.recommended_action,
+                    "reported_at": intake.timestamp,
+                }
+                rows.append((
+                    notification_id, campus_id, route.transport,
+                    json.dumps(notification), deadline, now
+                ))
+        if not rows:
+            return
+
+        self.outbox.add(rows)
+        if METRICS.enabled:
+            for row in rows:
+                NOTIFICATIONS_TOTAL.inc(row[2], "queued")
+        self._wakeup()
+
+    def stats(self) -> dict:
+        return {"in_flight": self._inflight, "outbox": self.outbox.counts()}
+
+    # ---------------- DISPATCH LOOP ----------------
+
+    def _thread_main(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._ready.set()
+        tasks: set = set()
+
+        while not self._stopping:
+            self._wake.clear()
+            free = self.concurrency - len(tasks)
+            if free > 0:
+                for entry in self.outbox.claim(self.clock(), free):
+                    task = asyncio.create_task(self._deliver(entry))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            self._inflight = len(tasks)
+
+            delay = self.poll_interval
+            if len(tasks) < self.concurrency:
+                due = self.outbox.next_due()
+                if due is not None:
+                    delay = min(delay, max(0.0, due - self.clock()))
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+        if tasks:
+            await asyncio.wait(set(tasks), timeout=self._drain_timeout)
+        for transport in self._transports.values():
+            try:
+                await transport.close()
+            except Exception:
+                logger.exception("Closing transport %r failed", transport)
+        self._transports.clear()
+
+    async def _deliver(self, entry: OutboxEntry):
+        attempts = entry.attempts + 1
+        try:
+            transport = self._transport_for(entry.campus_id, entry.transport)
+            timeout = min(self.attempt_timeout, entry.deadline - self.clock())
+            if timeout <= 0:
+                raise asyncio.TimeoutError("deadline passed before sending")
+            await asyncio.wait_for(transport.send(json.loads(entry.body)), timeout)
+        except Exception as exc:
+            self._failed(entry, attempts, exc)
+        else:
+            now = self.clock()
+            self.outbox.sent(entry.id, attempts, now)
+            if METRICS.enabled:
+                NOTIFICATIONS_TOTAL.inc(entry.transport, "sent")
+                NOTIFICATION_LATENCY.observe(now - entry.created, entry.transport)
+        finally:
+            self._wake.set()
+
+    def _failed(self, entry: OutboxEntry, attempts: int, exc: Exception):
+        now = self.clock()
+        error = f"{type(exc).__name__}: {exc}"
+        # Timeouts, connection errors and unexpected failures are retried
+        transient = getattr(exc, "transient", True)
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+
+        if transient and attempts < self.max_attempts and now + delay < entry.deadline:
+            self.outbox.retry(entry.id, attempts, now + delay, error, now)
+            outcome = "retry"
+        else:
+            outcome = "failed" if not transient else "expired"
+            self.outbox.give_up(entry.id, outcome, attempts, error, now)
+            logger.error(
+                "Notification %s via %s %s after %d attempt(s): %s",
+                entry.id, entry.transport, outcome, attempts, error
+            )
+        if METRICS.enabled:
+            NOTIFICATIONS_TOTAL.inc(entry.transport, outcome)
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _wakeup(self):
+        if self._loop is not None and self._wake is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                # Loop already closed; the outbox keeps the rows
+                pass
+
+    def _routing_for(self, campus_id: str) -> Optional[NotificationRouting]:
+        try:
+            config = self.config_for(campus_id)
+        except (KeyError, OSError, ValueError) as exc:
+            logger.error("No campus config for notifications of %s: %s", campus_id, exc)
+            return None
+        cached = self._routing.get(campus_id)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        # Rebuilt whenever a hot reload hands out a new config object
+        routing = NotificationRouting.from_config(config)
+        self._routing[campus_id] = (config, routing)
+        return routing
+
+    def _transport_for(self, campus_id: str, name: str):
+        routing = self._routing_for(campus_id)
+        spec = routing.transports.get(name) if routing is not None else None
+        if spec is None:
+            raise PermanentDeliveryError(f"Transport '{name}' is no longer configured for {campus_id}")
+        # Keyed by spec, so pools survive reloads that leave a transport unchanged
+        key = json.dumps(spec, sort_keys=True)
+        transport = self._transports.get(key)
+        if transport is None:
+            transport = self._transports[key] = build_transport(spec)
+        return transport
@@ -0,0 +1,298 @@
+import hashlib
+import struct
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# name -> (bucket seconds, buckets kept)
+WINDOWS: Dict[str, Tuple[int, int]] = {
+    "hour": (60, 60),
+    "day": (3600, 24),
+}
+
+UNZONED = "(unzoned)"
+
+StatsKey = Tuple[str, str, str, str]
+
+
+class RollingCounter:
+    """
+    Ring of fixed-width time buckets. Each slot remembers which bucket
+    epoch it holds, so stale slots are recycled lazily on write and
+    ignored on read: add() is O(1) and nothing ever needs sweeping.
+    """
+
+    __slots__ = ("width", "size", "counts", "epochs")
+
+    def __init__(self, width: int, size: int):
+        self.width = width
+        self.size = size
+        self.counts = [0] * size
+        self.epochs = [-1] * size
+
+    def add(self, timestamp: float, amount: int = 1):
+        epoch = int(timestamp // self.width)
+        slot = epoch % self.size
+        held = self.epochs[slot]
+        if held != epoch:
+            if held > epoch:
+                # Older than anything the ring still covers
+                return
+            self.epochs[slot] = epoch
+            self.counts[slot] = 0
+        self.counts[slot] += amount
+
+    def series(self, now: float) -> List[int]:
+        """
+        Counts per bucket, oldest first, ending with the current bucket.
+        """
+        current = int(now // self.width)
+        counts, epochs, size = self.counts, self.epochs, self.size
+        return [
+            counts[epoch % size] if epochs[epoch % size] == epoch else 0
+            for epoch in range(current - size + 1, current + 1)
+        ]
+
+
+class CountMinSketch:
+    """
+    Fixed-size frequency sketch for unbounded key sets (free-text
+    locations). Estimates never undercount; overcount is bounded by
+    total / width with probability 1 - 2^-depth.
+    """
+
+    __slots__ = ("width", "depth", "rows", "_unpack")
+
+    def __init__(self, width: int = 512, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.rows = [array("I", bytes(4 * width)) for _ in range(depth)]
+        self._unpack = struct.Struct(f"<{depth}I").unpack
+
+    def indexes(self, key: str) -> Tuple[int, ...]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * self.depth).digest()
+        return tuple(h % self.width for h in self._unpack(digest))
+
+    def add(self, indexes: Tuple[int, ...], amount: int = 1):
+        for row, index in zip(self.rows, indexes):
+            row[index] += amount
+
+    def estimate(self, indexes: Tuple[int, ...]) -> int:
+        return min(row[index] for row, index in zip(self.rows, indexes))
+
+    def clear(self):
+        for row in self.rows:
+            row[:] = array("I", bytes(4 * self.width))
+
+
+class RollingSketch:
+    """
+    Ring of count-min sketches, one per time bucket, for "how often was
+    this free-text location reported in the last hour/day" queries.
+    """
+
+    def __init__(self, width: int = 512, depth: int = 4, bucket_seconds: int = 900, buckets: int = 96):
+        self.bucket_seconds = bucket_seconds
+        self.size = buckets
+        self.sketches = [CountMinSketch(width, depth) for _ in range(buckets)]
+        self.epochs = [-1] * buckets
+
+    def add(self, key: str, timestamp: float):
+        epoch = int(timestamp // self.bucket_seconds)
+        slot = epoch % self.size
+        held = self.epochs[slot]
+        if held != epoch:
+            if held > epoch:
+                return
+            self.epochs[slot] = epoch
+            self.sketches[slot].clear()
+        sketch = self.sketches[slot]
+        sketch.add(sketch.indexes(key))
+
+    def estimate(self, key: str, now: float, window_seconds: float) -> int:
+        current = int(now // self.bucket_seconds)
+        spanned = min(self.size, max(1, int(-(-window_seconds // self.bucket_seconds))))
+        indexes = self.sketches[0].indexes(key)
+        total = 0
+        for epoch in range(current - spanned + 1, current + 1):
+            slot = epoch % self.size
+            if self.epochs[slot] == epoch:
+                total += self.sketches[slot].estimate(indexes)
+        return total
+
+
+def _normalize(location: str) -> str:
+    return " ".join(location.lower().split())
+
+
+def _event_time(timestamp: str, now: float) -> float:
+    # Intake timestamps are naive UTC; future times are clamped to now
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return now
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return min(moment.timestamp(), now)
+
+
+class IncidentStats:
+    """
+    Incident Stats
+    --------------
+    Rolling incident counts for dashboards, fed as a pipeline sink.
+
+    - One ring of minute buckets (last hour) and one of hour buckets
+      (last day) per (campus, zone, incident type, risk level)
+    - Zones are the canonical names from the zone index, so the key
+      space is bounded by the campus config; `max_keys` caps it anyway
+    - Free-text locations go into a rolling count-min sketch, plus a
+      small Space-Saving table of the most reported ones
+    - record() is O(1) (O(top_locations) when a new location displaces
+      one); snapshot() is O(keys x buckets)
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 10_000,
+        location_sketch: bool = True,
+        top_locations: int = 20,
+        clock=time.time
+    ):
+        self.max_keys = max_keys
+        self.top_locations = top_locations
+        self.clock = clock
+        self.dropped = 0
+
+        self._counters: Dict[StatsKey, Dict[str, RollingCounter]] = {}
+        self._sketch = RollingSketch() if location_sketch else None
+        self._top: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: Any):
+        """
+        Pipeline sink: counts one processed incident.
+        """
+        now = self.clock()
+        intake = record.intake
+        timestamp = _event_time(intake.timestamp, now)
+        key = (
+            str((intake.raw_payload or {}).get("campus_id") or ""),
+            record.risk.zone or UNZONED,
+            intake.incident_type,
+            record.risk.risk_level,
+        )
+
+        with self._lock:
+            counters = self._counters.get(key)
+            if counters is None:
+                if len(self._counters) >= self.max_keys:
+                    self.dropped += 1
+                    return
+                counters = {
+                    name: RollingCounter(width, size)
+                    for name, (width, size) in WINDOWS.items()
+                }
+                self._counters[key] = counters
+            for counter in counters.values():
+                counter.add(timestamp)
+
+            if self._sketch is not None and intake.location:
+                normalized = _normalize(intake.location)
+                self._sketch.add(normalized, timestamp)
+                self._remember(normalized, intake.location)
+
+    def location_count(self, location: str, window: str = "hour") -> int:
+        if self._sketch is None:
+            return 0
+        width, size = WINDOWS[window]
+        with self._lock:
+            return self._sketch.estimate(_normalize(location), self.clock(), width * size)
+
+    def snapshot(
+        self,
+        window: str = "hour",
+        campus_id: Optional[str] = None,
+        zone: Optional[str] = None,
+        incident_type: Optional[str] = None,
+        risk_level: Optional[str] = None
+    ) -> dict:
+        if window not in WINDOWS:
+            raise ValueError(f"Unknown window '{window}', expected one of {', '.join(WINDOWS)}")
+        width, size = WINDOWS[window]
+        now = self.clock()
+
+        with self._lock:
+            matching = [
+                (key, counters[window].series(now))
+                for key, counters in self._counters.items()
+                if (campus_id is None or key[0] == campus_id)
+                and (zone is None or key[1] == zone)
+                and (incident_type is None or key[2] == incident_type)
+                and (risk_level is None or key[3] == risk_level)
+            ]
+            top = self._top_locations(now, width * size)
+
+        series = [0] * size
+        by_zone: Dict[str, int] = {}
+        by_type: Dict[str, int] = {}
+        by_risk: Dict[str, int] = {}
+        rows = []
+        for (campus, zone_name, type_name, risk_name), counts in matching:
+            count = sum(counts)
+            if not count:
+                continue
+            series = [a + b for a, b in zip(series, counts)]
+            by_zone[zone_name] = by_zone.get(zone_name, 0) + count
+            by_type[type_name] = by_type.get(type_name, 0) + count
+            by_risk[risk_name] = by_risk.get(risk_name, 0) + count
+            rows.append({
+                "campus_id": campus,
+                "zone": zone_name,
+                "incident_type": type_name,
+                "risk_level": risk_name,
+                "count": count,
+            })
+
+        rows.sort(key=lambda row: row["count"], reverse=True)
+        return {
+            "window": window,
+            "bucket_seconds": width,
+            "generated_at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+            "total": sum(series),
+            "series": series,
+            "by_zone": by_zone,
+            "by_incident_type": by_type,
+            "by_risk_level": by_risk,
+            "rows": rows,
+            "top_locations": top,
+        }
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _remember(self, normalized: str, location: str):
+        # Space-Saving candidate table: heavy hitters always survive;
+        # windowed counts for them come from the sketch at read time
+        entry = self._top.get(normalized)
+        if entry is not None:
+            entry[1] += 1
+            return
+        if len(self._top) < self.top_locations * 4:
+            self._top[normalized] = [location, 1]
+            return
+        weakest = min(self._top, key=lambda k: self._top[k][1])
+        floor = self._top.pop(weakest)[1]
+        self._top[normalized] = [location, floor + 1]
+
+    def _top_locations(self, now: float, window_seconds: float) -> List[dict]:
+        if self._sketch is None:
+            return []
+        ranked = [
+            {"location": label, "count": self._sketch.estimate(key, now, window_seconds)}
+            for key, (label, _) in self._top.items()
+        ]
+        ranked = [entry for entry in ranked if entry["count"]]
+        ranked.sort(key=lambda entry: entry["count"], reverse=True)
+        return ranked[:self.top_locations]
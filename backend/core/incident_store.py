@@ -0,0 +1,269 @@
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = "backend/data/incidents.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    incident_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    location TEXT NOT NULL,
+    incident_type TEXT NOT NULL,
+    source TEXT,
+    confidence_level TEXT,
+    risk_score INTEGER,
+    risk_level TEXT NOT NULL,
+    zone TEXT,
+    decision TEXT,
+    priority TEXT,
+    escalation_chain TEXT,
+    config_version TEXT,
+    campus_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_incidents_time ON incidents (timestamp, seq);
+CREATE INDEX IF NOT EXISTS idx_incidents_location ON incidents (location, timestamp, seq);
+CREATE INDEX IF NOT EXISTS idx_incidents_type ON incidents (incident_type, timestamp, seq);
+CREATE INDEX IF NOT EXISTS idx_incidents_risk ON incidents (risk_level, timestamp, seq);
+"""
+
+# Stores created before campus_id existed gain the column on open;
+# their older rows keep NULL and only match unfiltered queries
+_MIGRATIONS = (
+    ("campus_id", "ALTER TABLE incidents ADD COLUMN campus_id TEXT"),
+)
+
+_CAMPUS_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_incidents_campus ON incidents (campus_id, timestamp, seq)"
+)
+
+_COLUMNS = (
+    "incident_id", "timestamp", "location", "incident_type", "source",
+    "confidence_level", "risk_score", "risk_level", "zone", "decision",
+    "priority", "escalation_chain", "config_version", "campus_id"
+)
+
+_INSERT = (
+    f"INSERT INTO incidents ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)})"
+)
+
+_STOP = object()
+
+
+class IncidentStore:
+    """
+    Incident Store
+    --------------
+    Append-only SQLite history of processed incidents.
+
+    - WAL mode: readers never block the writer
+    - record() only enqueues; a background writer commits rows in
+      batches, so the report path pays no disk latency
+    - Secondary indexes on campus_id, location, incident_type,
+      risk_level and timestamp back keyset-paginated queries
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_STORE_PATH,
+        batch_size: int = 512,
+        max_pending: int = 100_000
+    ):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.dropped = 0
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(incidents)")}
+        for column, statement in _MIGRATIONS:
+            if column not in existing:
+                conn.execute(statement)
+        conn.execute(_CAMPUS_INDEX)
+        conn.commit()
+        conn.close()
+
+        self._pending: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._local = threading.local()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="incident-store-writer", daemon=True
+        )
+        self._writer.start()
+
+    # ---------------- WRITE PATH ----------------
+
+    def record(self, record: Any):
+        """
+        Pipeline sink: queues one processed incident for persistence.
+        """
+        intake, risk, response, audit = (
+            record.intake, record.risk, record.response, record.audit
+        )
+        row = (
+            intake.incident_id,
+            intake.timestamp,
+            intake.location,
+            intake.incident_type,
+            intake.source,
+            intake.confidence_level,
+            risk.risk_score,
+            risk.risk_level,
+            risk.zone,
+            audit.final_decision,
+            response.priority_level,
+            json.dumps(audit.escalation_chain),
+            audit.config_version,
+            str((intake.raw_payload or {}).get("campus_id") or ""),
+        )
+        try:
+            self._pending.put_nowait(row)
+        except queue.Full:
+            # Never stall a report on the history store
+            self.dropped += 1
+
+    def flush(self):
+        """
+        Blocks until every queued row has been committed.
+        """
+        self._pending.join()
+
+    def close(self):
+        self._pending.put(_STOP)
+        self._writer.join()
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            item = self._pending.get()
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(row is _STOP for row in batch)
+            rows = [row for row in batch if row is not _STOP]
+            try:
+                if rows:
+                    with conn:
+                        conn.executemany(_INSERT, rows)
+            except sqlite3.Error as exc:
+                logger.error("Failed to persist %d incidents: %s", len(rows), exc)
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+            if stop:
+                conn.close()
+                return
+
+    # ---------------- READ PATH ----------------
+
+    def query(
+        self,
+        campus_id: Optional[str] = None,
+        location: Optional[str] = None,
+        incident_type: Optional[str] = None,
+        risk_level: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Newest-first page of incidents. `cursor` is the opaque
+        next_cursor of the previous page. Raises ValueError naming the
+        parameter when `since`, `until` or `cursor` is malformed.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        for column, value in (
+            ("campus_id", campus_id),
+            ("location", location),
+            ("incident_type", incident_type),
+            ("risk_level", risk_level),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_stored_timestamp("since", since))
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(_stored_timestamp("until", until))
+
+        if cursor:
+            cursor_ts, _, cursor_seq = cursor.rpartition("|")
+            if not cursor_ts or not cursor_seq.isdigit():
+                raise ValueError("Invalid cursor")
+            clauses.append("(timestamp, seq) < (?, ?)")
+            params.extend([cursor_ts, int(cursor_seq)])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT seq, {', '.join(_COLUMNS)} FROM incidents {where} "
+            f"ORDER BY timestamp DESC, seq DESC LIMIT ?"
+        )
+        params.append(limit + 1)
+
+        rows = self._reader().execute(sql, params).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        items = []
+        for row in rows:
+            item = dict(zip(_COLUMNS, row[1:]))
+            item["escalation_chain"] = json.loads(item["escalation_chain"] or "[]")
+            items.append(item)
+
+        next_cursor = None
+        if has_more and rows:
+            next_cursor = f"{rows[-1][2]}|{rows[-1][0]}"
+
+        return {"items": items, "next_cursor": next_cursor}
+
+    def count(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM incidents").fetchone()[0]
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        # One read connection per thread; WAL lets them run beside the writer
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+
+def _stored_timestamp(name: str, value: str) -> str:
+    # Rows hold naive UTC ISO strings, compared as text
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid '{name}' timestamp, expected ISO 8601: {value!r}") from None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.isoformat()
@@ -0,0 +1,204 @@
+import heapq
+import itertools
+import logging
+import threading
+from concurrent.futures import Future
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from backend.agents.intake_agent import incident_time
+from backend.core.keyword_matcher import KeywordFeatures
+from backend.core.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_CRITICAL = 0
+PRIORITY_HIGH = 1
+PRIORITY_MEDIUM = 2
+PRIORITY_LOW = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_CRITICAL: "critical",
+    PRIORITY_HIGH: "high",
+    PRIORITY_MEDIUM: "medium",
+    PRIORITY_LOW: "low",
+}
+
+# Every class has its own capacity, so a flood of low-priority noise
+# can never take the slots a critical report needs
+DEFAULT_CAPACITY = {
+    PRIORITY_CRITICAL: 1024,
+    PRIORITY_HIGH: 1024,
+    PRIORITY_MEDIUM: 512,
+    PRIORITY_LOW: 256,
+}
+
+QUEUE_WAIT = METRICS.histogram(
+    "campus_ingest_queue_wait_seconds",
+    "Time incidents spend queued before a worker picks them up",
+    ("priority",)
+)
+QUEUE_DEPTH = METRICS.gauge(
+    "campus_ingest_queue_depth",
+    "Incidents currently queued",
+    ("priority",)
+)
+QUEUE_REJECTED = METRICS.counter(
+    "campus_ingest_rejected_total",
+    "Incidents rejected because their priority class was full",
+    ("priority",)
+)
+
+
+class QueueFullError(RuntimeError):
+    """
+    Raised by submit() when the incident's priority class is full.
+    `retry_after` is a rough hint in seconds for backpressure headers.
+    """
+
+    def __init__(self, priority: int, retry_after: float):
+        super().__init__(
+            f"Ingestion queue full for {PRIORITY_NAMES.get(priority, priority)} priority"
+        )
+        self.priority = priority
+        self.retry_after = retry_after
+
+
+def classify_priority(payload: Dict[str, Any], coordinator: Any) -> Tuple[int, KeywordFeatures]:
+    """
+    Cheap pre-classification before the full pipeline runs: panic flag,
+    critical keywords and zone tier. The keyword features are returned
+    so intake does not scan the description a second time.
+    """
+    features = coordinator.keyword_matcher.extract(payload.get("description", ""))
+    if payload.get("panic") or features.critical:
+        return PRIORITY_CRITICAL, features
+
+    # Same clock the risk agent uses, so replayed night reports queue
+    # as night reports
+    hour = incident_time(payload.get("timestamp")).hour
+    tier = coordinator.zone_index.resolve(payload.get("location", ""), hour).tier
+    if tier == "high":
+        return PRIORITY_HIGH, features
+    if tier == "medium":
+        return PRIORITY_MEDIUM, features
+    return PRIORITY_LOW, features
+
+
+class IngestionQueue:
+    """
+    Ingestion Queue
+    ---------------
+    Priority queue and worker pool in front of the coordinator.
+
+    - Workers always take the most urgent incident first (FIFO within
+      a priority class)
+    - Each class is bounded; a full class rejects with QueueFullError
+      instead of growing without limit
+    - Queue wait, depth and rejections are exported as metrics
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any], Optional[KeywordFeatures]], Any],
+        workers: int = 4,
+        capacity: Optional[Dict[int, int]] = None
+    ):
+        self.handler = handler
+        self.workers = workers
+        self.capacity = dict(DEFAULT_CAPACITY if capacity is None else capacity)
+
+        self._heap: list = []
+        self._depth = {priority: 0 for priority in self.capacity}
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._running = False
+        self._service_time = 0.001
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"ingest-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def shutdown(self, wait: bool = True):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+    def submit(
+        self,
+        payload: Dict[str, Any],
+        priority: int = PRIORITY_LOW,
+        features: Optional[KeywordFeatures] = None
+    ) -> Future:
+        future: Future = Future()
+
+        with self._cond:
+            if self._depth.get(priority, 0) >= self.capacity.get(priority, 0):
+                if METRICS.enabled:
+                    QUEUE_REJECTED.inc(PRIORITY_NAMES[priority])
+                raise QueueFullError(priority, self._retry_after(priority))
+
+            heapq.heappush(
+                self._heap,
+                (priority, next(self._sequence), perf_counter(), payload, features, future)
+            )
+            self._depth[priority] += 1
+            if METRICS.enabled:
+                QUEUE_DEPTH.set(self._depth[priority], PRIORITY_NAMES[priority])
+            self._cond.notify()
+
+        return future
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "depth": {PRIORITY_NAMES[p]: d for p, d in self._depth.items()},
+                "capacity": {PRIORITY_NAMES[p]: c for p, c in self.capacity.items()},
+            }
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _retry_after(self, priority: int) -> float:
+        # Work queued at this priority or above must drain first
+        ahead = sum(d for p, d in self._depth.items() if p <= priority)
+        return round(max(1.0, ahead * self._service_time / max(1, self.workers)), 1)
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while self._running and not self._heap:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                priority, _, enqueued, payload, features, future = heapq.heappop(self._heap)
+                self._depth[priority] -= 1
+                if METRICS.enabled:
+                    QUEUE_DEPTH.set(self._depth[priority], PRIORITY_NAMES[priority])
+
+            started = perf_counter()
+            if METRICS.enabled:
+                QUEUE_WAIT.observe(started - enqueued, PRIORITY_NAMES[priority])
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.handler(payload, features))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+            # Smoothed service time feeds the Retry-After estimate
+            self._service_time = 0.9 * self._service_time + 0.1 * (perf_counter() - started)
@@ -0,0 +1,165 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+# Ordered by classification priority: the first type with a hit wins.
+# A trailing "*" marks a stem ("burn*" matches "burning", "burnt").
+DEFAULT_INCIDENT_KEYWORDS: Dict[str, List[str]] = {
+    "Fire": ["fire", "fires", "smoke*", "burn*"],
+    "Medical Emergency": ["medical", "fainted", "injured"],
+    "Harassment": ["follow*", "harass*", "stalk*"],
+    "Theft": ["theft", "stolen"],
+    "Lab Hazard": ["lab", "labs", "laboratory", "chemical*"],
+}
+
+DEFAULT_CRITICAL_KEYWORDS: List[str] = [
+    "fire", "fires", "smoke*", "burn*",
+    "fainted", "unconscious", "medical", "bleeding",
+    "ambulance", "help",
+    "following", "stalking", "harassment",
+    "attack*", "assault*"
+]
+
+GENERAL_INCIDENT = "General Incident"
+CRITICAL_LABEL = "critical"
+
+# Matched surface forms are a small vocabulary; cap the label cache anyway
+_LABEL_CACHE_LIMIT = 4096
+
+
+@dataclass(frozen=True)
+class KeywordFeatures:
+    incident_type: str
+    type_hits: FrozenSet[str]
+    critical_hits: Tuple[str, ...]
+
+    @property
+    def critical(self) -> bool:
+        return bool(self.critical_hits)
+
+
+class KeywordMatcher:
+    """
+    Keyword Matcher
+    ---------------
+    Compiles every campus keyword set into a single pattern so a
+    description is lowercased and scanned exactly once.
+
+    - Matches respect word boundaries ("help" does not hit "helpdesk")
+    - Stems ("stalk*") match any word starting with the stem
+    - One scan feeds both incident classification and the
+      critical-keyword override
+    """
+
+    def __init__(
+        self,
+        incident_keywords: Optional[Dict[str, Iterable[str]]] = None,
+        critical_keywords: Optional[Iterable[str]] = None
+    ):
+        if incident_keywords is None:
+            incident_keywords = DEFAULT_INCIDENT_KEYWORDS
+        if critical_keywords is None:
+            critical_keywords = DEFAULT_CRITICAL_KEYWORDS
+
+        self.type_order: Tuple[str, ...] = tuple(incident_keywords)
+
+        self._exact: Dict[str, set] = {}
+        self._stems: Dict[str, set] = {}
+
+        for incident_type, words in incident_keywords.items():
+            for word in words:
+                self._add(word, incident_type)
+        for word in critical_keywords:
+            self._add(word, CRITICAL_LABEL)
+
+        self._pattern = self._compile()
+        self._label_cache: Dict[str, FrozenSet[str]] = {}
+
+    @classmethod
+    def from_config(cls, campus_config: dict) -> "KeywordMatcher":
+        """
+        Builds a matcher from the optional "keywords" config section:
+
+            "keywords": {
+                "incident_types": {"Fire": ["fire", "smoke*"], ...},
+                "critical": ["fire", "help", ...]
+            }
+        """
+        section = campus_config.get("keywords")
+        if not section:
+            return DEFAULT_MATCHER
+
+        return cls(
+            incident_keywords=section.get("incident_types"),
+            critical_keywords=section.get("critical")
+        )
+
+    def extract(self, text: str) -> KeywordFeatures:
+        type_hits = set()
+        critical_hits = []
+
+        for match in self._pattern.finditer(text.lower()):
+            labels = self._labels_for(match.group(0))
+            for label in labels:
+                if label == CRITICAL_LABEL:
+                    critical_hits.append(match.group(0))
+                else:
+                    type_hits.add(label)
+
+        incident_type = GENERAL_INCIDENT
+        for candidate in self.type_order:
+            if candidate in type_hits:
+                incident_type = candidate
+                break
+
+        return KeywordFeatures(
+            incident_type=incident_type,
+            type_hits=frozenset(type_hits),
+            critical_hits=tuple(critical_hits)
+        )
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _add(self, word: str, label: str):
+        word = " ".join(word.lower().split())
+        if not word:
+            return
+        if word.endswith("*"):
+            self._stems.setdefault(word[:-1], set()).add(label)
+        else:
+            self._exact.setdefault(word, set()).add(label)
+
+    def _compile(self) -> "re.Pattern":
+        alternatives = []
+        for word in self._exact:
+            alternatives.append((len(word), re.escape(word).replace(r"\ ", r"\s+") + r"(?!\w)"))
+        for stem in self._stems:
+            alternatives.append((len(stem), re.escape(stem).replace(r"\ ", r"\s+") + r"\w*"))
+
+        if not alternatives:
+            return re.compile(r"(?!x)x")
+
+        # Longest literals first so multi-word phrases beat their prefixes
+        alternatives.sort(key=lambda item: -item[0])
+        body = "|".join(pattern for _, pattern in alternatives)
+        return re.compile(r"(?<!\w)(?:" + body + ")")
+
+    def _labels_for(self, surface: str) -> FrozenSet[str]:
+        labels = self._label_cache.get(surface)
+        if labels is not None:
+            return labels
+
+        normalized = " ".join(surface.split())
+        found = set(self._exact.get(normalized, ()))
+        for stem, stem_labels in self._stems.items():
+            if normalized.startswith(stem):
+                found |= stem_labels
+
+        labels = frozenset(found)
+        if len(self._label_cache) < _LABEL_CACHE_LIMIT:
+            self._label_cache[surface] = labels
+        return labels
+
+
+DEFAULT_MATCHER = KeywordMatcher()
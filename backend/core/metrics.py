@@ -0,0 +1,255 @@
+import bisect
+import os
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def drain(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[Tuple[str, ...], float]):
+        with self._lock:
+            for labels, value in values.items():
+                self._values[labels] = self._values.get(labels, 0.0) + value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    metric_type = "gauge"
+
+    def set(self, value: float, *labelvalues: str):
+        with self._lock:
+            self._values[labelvalues] = float(value)
+
+    def merge(self, values: Dict[Tuple[str, ...], float]):
+        # The latest reading wins
+        with self._lock:
+            self._values.update(values)
+
+
+class Histogram:
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = [0] * (len(self.buckets) + 1) + [0.0]
+                self._series[labelvalues] = series
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._series.get(labelvalues)
+        return int(sum(series[:-1])) if series else 0
+
+    def drain(self) -> Dict[Tuple[str, ...], List[float]]:
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+    def merge(self, series: Dict[Tuple[str, ...], List[float]]):
+        with self._lock:
+            for labels, observed in series.items():
+                current = self._series.get(labels)
+                if current is None:
+                    self._series[labels] = list(observed)
+                else:
+                    for index, value in enumerate(observed):
+                        current[index] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+
+        lines = []
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = _format_labels(self.labelnames, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            le = _format_labels(self.labelnames, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+            plain = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{plain} {repr(series[-1])}")
+            lines.append(f"{self.name}_count{plain} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Metrics Registry
+    ----------------
+    Minimal in-process Prometheus instrumentation (no client library).
+
+    Call sites check `enabled` before timing anything, so a disabled
+    registry costs one attribute read per instrumented step.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: Dict[str, object] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def drain(self) -> Dict[str, dict]:
+        """
+        Takes every observation made since the last drain, by metric
+        name. A process that is not scraped itself (a campus shard)
+        drains its registry and hands the result to one that is.
+        """
+        snapshot = {}
+        for name, metric in self._metrics.items():
+            values = metric.drain()
+            if values:
+                snapshot[name] = values
+        return snapshot
+
+    def merge(self, snapshot: Dict[str, dict]):
+        """
+        Adds another process's drained observations to this registry.
+        Metrics it does not have are ignored.
+        """
+        for name, values in snapshot.items():
+            metric = self._metrics.get(name)
+            if metric is not None:
+                metric.merge(values)
+
+    def _register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+
+METRICS = MetricsRegistry(
+    enabled=os.environ.get("CAMPUS_METRICS_ENABLED", "1").lower() not in ("0", "false", "no")
+)
+
+STAGE_LATENCY = METRICS.histogram(
+    "campus_stage_latency_seconds",
+    "Latency of each pipeline stage",
+    ("stage",)
+)
+STAGE_FALLBACKS = METRICS.counter(
+    "campus_stage_fallbacks_total",
+    "Pipeline stages that failed or timed out and used their fallback",
+    ("stage", "reason")
+)
+TIME_TO_ESCALATION = METRICS.histogram(
+    "campus_time_to_escalation_seconds",
+    "Time from intake start until the escalation plan is ready",
+    ("risk_level",)
+)
+INCIDENTS_TOTAL = METRICS.counter(
+    "campus_incidents_total",
+    "Processed incidents by outcome",
+    ("risk_level", "incident_type")
+)
+CONFIG_LOAD_SECONDS = METRICS.histogram(
+    "campus_config_load_seconds",
+    "Cost of loading and compiling a campus config",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+CONFIG_RELOADS = METRICS.counter(
+    "campus_config_reloads_total",
+    "Campus configs (re)built by the registry"
+)
+HTTP_REQUESTS = METRICS.counter(
+    "campus_http_requests_total",
+    "HTTP requests handled",
+    ("method", "path", "status")
+)
+HTTP_LATENCY = METRICS.histogram(
+    "campus_http_request_seconds",
+    "HTTP handler latency",
+    ("method", "path")
+)
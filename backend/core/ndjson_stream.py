@@ -0,0 +1,197 @@
+import json
+import queue
+import threading
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from backend.core.coordinator import DEFAULT_CAMPUS_CONFIG, get_coordinator
+
+# Marks the end of a stage's output on the hand-off queues
+_DONE = object()
+
+ParsedLine = Tuple[int, Optional[dict], Optional[str]]
+
+
+@dataclass
+class StreamStats:
+    lines: int = 0
+    processed: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    parse_seconds: float = 0.0
+    pipeline_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.lines / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "incidents_per_sec": round(self.rate, 1)}
+
+    def summary(self) -> str:
+        return (
+            f"{self.lines} incidents ({self.failed} failed) in {self.elapsed:.3f}s, "
+            f"{self.rate:.0f} incidents/s "
+            f"[parse {self.parse_seconds:.3f}s, pipeline {self.pipeline_seconds:.3f}s, "
+            f"write {self.write_seconds:.3f}s]"
+        )
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[ParsedLine]:
+    """
+    Yields (line_number, payload, error) per non-blank line.
+    A bad line becomes an error record; it never stops the stream.
+    """
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+        except ValueError as exc:
+            yield number, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(payload, dict):
+            yield number, None, "Expected a JSON object"
+            continue
+        yield number, payload, None
+
+
+def _next_batch(lines: "queue.Queue", batch_size: int, max_delay: float) -> Optional[List[ParsedLine]]:
+    # Blocks for the first line only; the rest are whatever arrives
+    # before the batch fills or the input goes quiet
+    first = lines.get()
+    if first is _DONE:
+        return None
+    batch = [first]
+    while len(batch) < batch_size:
+        try:
+            line = lines.get(timeout=max_delay) if max_delay > 0 else lines.get_nowait()
+        except queue.Empty:
+            break
+        if line is _DONE:
+            # Ends the stream after this batch
+            lines.put(_DONE)
+            break
+        batch.append(line)
+    return batch
+
+
+def _result_record(number: int, audit: Any, explain: bool) -> dict:
+    record = {
+        "line": number,
+        "ok": True,
+        "location": audit.location,
+        "risk_level": audit.risk_level,
+        "confidence": audit.confidence_level,
+        "decision": audit.final_decision,
+        "escalation_chain": audit.escalation_chain,
+        "duplicate_of": audit.duplicate_of,
+        "config_version": audit.config_version,
+    }
+    if explain:
+        record["explanation"] = audit.explain()
+    return record
+
+
+def stream_ndjson(
+    source: Iterable[str],
+    sink: TextIO,
+    config_path: str = DEFAULT_CAMPUS_CONFIG,
+    batch_size: int = 64,
+    queue_size: int = 8,
+    explain: bool = False,
+    max_delay: float = 0.002
+) -> StreamStats:
+    """
+    Runs NDJSON incidents from `source` through the pipeline and
+    writes one NDJSON result per input line, in input order.
+
+    Parsing, the pipeline and serialization run in three threads joined
+    by bounded queues, so at most about 2 * queue_size batches are held
+    in memory whatever the input size. A batch is cut short once no
+    more input has arrived for `max_delay` seconds, so a report on a
+    quiet live pipe is not held back waiting for a full batch.
+    """
+    stats = StreamStats()
+    parsed: "queue.Queue" = queue.Queue(maxsize=batch_size * queue_size)
+    rendered: "queue.Queue" = queue.Queue(maxsize=queue_size)
+    failures: List[BaseException] = []
+
+    def read():
+        try:
+            lines = read_ndjson(source)
+            while True:
+                started = perf_counter()
+                line = next(lines, _DONE)
+                stats.parse_seconds += perf_counter() - started
+                if line is _DONE:
+                    break
+                parsed.put(line)
+        except BaseException as exc:
+            failures.append(exc)
+        finally:
+            parsed.put(_DONE)
+
+    def write():
+        while True:
+            batch = rendered.get()
+            if batch is _DONE:
+                return
+            if failures:
+                # Keep draining so the pipeline thread never blocks
+                continue
+            started = perf_counter()
+            try:
+                sink.write("".join(json.dumps(record) + "\n" for record in batch))
+                sink.flush()
+            except BaseException as exc:
+                failures.append(exc)
+            stats.write_seconds += perf_counter() - started
+
+    started = perf_counter()
+    reader = threading.Thread(target=read, name="ndjson-reader", daemon=True)
+    writer = threading.Thread(target=write, name="ndjson-writer", daemon=True)
+    reader.start()
+    writer.start()
+
+    try:
+        while True:
+            batch = _next_batch(parsed, batch_size, max_delay)
+            if batch is None:
+                break
+            if failures:
+                continue
+
+            stage_started = perf_counter()
+            # Resolved per batch so a long-running stream picks up config reloads
+            coordinator = get_coordinator(config_path)
+            valid = [(number, payload) for number, payload, error in batch if error is None]
+            results = iter(coordinator.process_batch([payload for _, payload in valid]))
+
+            records = []
+            for number, payload, error in batch:
+                if error is None:
+                    item = next(results)
+                    if item.ok:
+                        records.append(_result_record(number, item.result, explain))
+                        stats.processed += 1
+                        continue
+                    error = item.error
+                records.append({"line": number, "ok": False, "error": error})
+                stats.failed += 1
+
+            stats.lines += len(batch)
+            stats.pipeline_seconds += perf_counter() - stage_started
+            rendered.put(records)
+    finally:
+        rendered.put(_DONE)
+        writer.join()
+        reader.join(timeout=1.0)
+
+    stats.elapsed = perf_counter() - started
+    if failures:
+        raise failures[0]
+    return stats
@@ -0,0 +1,305 @@
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from backend.agents.risk_agent import RISK_LEVELS
+from backend.core.config_loader import CampusConfigLoader
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.incident_stats import UNZONED
+from backend.core.ndjson_stream import read_ndjson
+
+_RANK = {level: rank for rank, level in enumerate(RISK_LEVELS)}
+
+# (risk level, escalation chain, zone) for one incident under one config
+Outcome = Tuple[str, Tuple[str, ...], str]
+
+
+@dataclass
+class CandidateDiff:
+    """
+    How one candidate config's decisions differ from the baseline's.
+    """
+    levels: Counter = field(default_factory=Counter)
+    transitions: Counter = field(default_factory=Counter)
+    chains: Counter = field(default_factory=Counter)
+    zones: Counter = field(default_factory=Counter)
+    raised: Counter = field(default_factory=Counter)
+    lowered: Counter = field(default_factory=Counter)
+    changed: int = 0
+    examples: List[dict] = field(default_factory=list)
+
+    def merge(self, other: "CandidateDiff", line_offset: int, max_examples: int):
+        for name in ("levels", "transitions", "chains", "zones", "raised", "lowered"):
+            getattr(self, name).update(getattr(other, name))
+        self.changed += other.changed
+        for example in other.examples[:max(0, max_examples - len(self.examples))]:
+            self.examples.append({**example, "line": example["line"] + line_offset})
+
+
+@dataclass
+class SimulationPart:
+    """
+    Result of one worker task over one slice of the history.
+    """
+    lines: int = 0
+    incidents: int = 0
+    failed: int = 0
+    baseline_levels: Counter = field(default_factory=Counter)
+    baseline_zones: Counter = field(default_factory=Counter)
+    candidates: List[CandidateDiff] = field(default_factory=list)
+
+
+# Coordinators per config path, built once per worker process
+_coordinators: Dict[str, CoordinatorAgent] = {}
+
+
+def _coordinator(config_path: str) -> CoordinatorAgent:
+    coordinator = _coordinators.get(config_path)
+    if coordinator is None:
+        # No correlator or zone activity: history slices run out of
+        # order across workers, so only stateless decisions are compared
+        coordinator = _coordinators[config_path] = CoordinatorAgent(campus_config_path=config_path)
+    return coordinator
+
+
+def _outcome(coordinator: CoordinatorAgent, payload: dict) -> Outcome:
+    # Decisions are final after the response stage; the audit only
+    # renders them, so the generator is closed before it runs
+    stages = coordinator.iter_stages(payload)
+    try:
+        next(stages)
+        _, risk = next(stages)
+        _, response = next(stages)
+    finally:
+        stages.close()
+    return risk.risk_level, tuple(response.escalation_chain), risk.zone or UNZONED
+
+
+def simulate_lines(
+    lines: Sequence[str],
+    baseline: str,
+    candidates: Sequence[str],
+    max_examples: int = 10
+) -> SimulationPart:
+    """
+    Replays NDJSON payload lines under the baseline and every candidate
+    config. Line numbers in examples are relative to `lines`.
+    """
+    part = SimulationPart(lines=len(lines), candidates=[CandidateDiff() for _ in candidates])
+    base = _coordinator(baseline)
+    others = [_coordinator(path) for path in candidates]
+
+    for number, payload, error in read_ndjson(lines):
+        if error is not None:
+            part.failed += 1
+            continue
+        try:
+            before = _outcome(base, payload)
+            afters = [_outcome(coordinator, payload) for coordinator in others]
+        except Exception:
+            part.failed += 1
+            continue
+
+        part.incidents += 1
+        part.baseline_levels[before[0]] += 1
+        part.baseline_zones[before[2]] += 1
+
+        for diff, after in zip(part.candidates, afters):
+            level, chain, zone = after
+            diff.levels[level] += 1
+            diff.zones[zone] += 1
+            if level != before[0]:
+                diff.transitions[(before[0], level)] += 1
+                if _RANK[level] > _RANK[before[0]]:
+                    diff.raised[zone] += 1
+                else:
+                    diff.lowered[zone] += 1
+            if chain != before[1]:
+                diff.chains[(before[1], chain)] += 1
+            if after != before:
+                diff.changed += 1
+                if len(diff.examples) < max_examples:
+                    diff.examples.append({
+                        "line": number,
+                        "location": payload.get("location"),
+                        "before": {"risk_level": before[0], "zone": before[2],
+                                   "escalation_chain": list(before[1])},
+                        "after": {"risk_level": level, "zone": zone,
+                                  "escalation_chain": list(chain)},
+                    })
+    return part
+
+
+def _simulate_range(
+    history: str,
+    start: int,
+    end: int,
+    baseline: str,
+    candidates: Sequence[str],
+    max_examples: int
+) -> SimulationPart:
+    with open(history, "rb") as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    # Cut on "\n" only, as split_ranges does: str.splitlines() also
+    # splits on characters JSON allows unescaped inside strings
+    lines = raw.decode("utf-8").split("\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    return simulate_lines(lines, baseline, candidates, max_examples)
+
+
+def split_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Byte ranges covering the file, cut on line boundaries, so workers
+    read their own slice instead of receiving pickled payloads.
+    """
+    size = os.path.getsize(path)
+    cuts = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            target = size * i // parts
+            if target <= cuts[-1]:
+                continue
+            f.seek(target - 1)
+            f.readline()
+            position = f.tell()
+            if cuts[-1] < position < size:
+                cuts.append(position)
+    cuts.append(size)
+    return [(start, end) for start, end in zip(cuts, cuts[1:]) if end > start]
+
+
+def simulate(
+    history: str,
+    baseline: str,
+    candidates: Sequence[str],
+    workers: Optional[int] = None,
+    tasks_per_worker: int = 4,
+    max_examples: int = 10
+) -> dict:
+    """
+    Replays an NDJSON incident history under the baseline config and
+    each candidate, in parallel worker processes, and returns the diff
+    report. workers=1 runs in this process.
+    """
+    # Load every config up front: invalid candidates fail before any work
+    loaders = [CampusConfigLoader(path) for path in [baseline, *candidates]]
+
+    workers = workers or os.cpu_count() or 1
+    ranges = split_ranges(history, max(1, workers * tasks_per_worker))
+    args = (baseline, list(candidates), max_examples)
+
+    if workers == 1:
+        parts = [_simulate_range(history, start, end, *args) for start, end in ranges]
+    else:
+        # Spawned workers share no locks or threads with this process
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [pool.submit(_simulate_range, history, start, end, *args) for start, end in ranges]
+            parts = [future.result() for future in futures]
+
+    total = SimulationPart(candidates=[CandidateDiff() for _ in candidates])
+    for part in parts:
+        for merged, diff in zip(total.candidates, part.candidates):
+            merged.merge(diff, total.lines, max_examples)
+        total.lines += part.lines
+        total.incidents += part.incidents
+        total.failed += part.failed
+        total.baseline_levels.update(part.baseline_levels)
+        total.baseline_zones.update(part.baseline_zones)
+
+    return _report(history, loaders, total)
+
+
+def _report(history: str, loaders: List[CampusConfigLoader], total: SimulationPart) -> dict:
+    base = loaders[0]
+    candidates = []
+    for loader, diff in zip(loaders[1:], total.candidates):
+        zones = sorted(set(total.baseline_zones) | set(diff.zones))
+        candidates.append({
+            "config": loader.config_path,
+            "config_version": loader.get_config_version(),
+            "warnings": loader.get_validation_warnings(),
+            "changed": diff.changed,
+            "risk_levels": _levels(diff.levels),
+            "transitions": [
+                {"from": before, "to": after, "count": count}
+                for (before, after), count in diff.transitions.most_common()
+            ],
+            "escalation_changes": [
+                {"from": list(before), "to": list(after), "count": count}
+                for (before, after), count in diff.chains.most_common()
+            ],
+            "zones": {
+                zone: {
+                    "baseline": total.baseline_zones[zone],
+                    "candidate": diff.zones[zone],
+                    "raised": diff.raised[zone],
+                    "lowered": diff.lowered[zone],
+                }
+                for zone in zones
+            },
+            "examples": diff.examples,
+        })
+
+    return {
+        "history": history,
+        "incidents": total.incidents,
+        "failed": total.failed,
+        "baseline": {
+            "config": base.config_path,
+            "config_version": base.get_config_version(),
+            "risk_levels": _levels(total.baseline_levels),
+        },
+        "candidates": candidates,
+    }
+
+
+def _levels(counts: Counter) -> Dict[str, int]:
+    return {level: counts[level] for level in RISK_LEVELS}
+
+
+def format_report(report: dict, top: int = 5) -> str:
+    lines = [
+        f"{report['incidents']} incidents replayed ({report['failed']} failed)",
+        f"baseline  {report['baseline']['config']} ({report['baseline']['config_version']}): "
+        + _format_levels(report["baseline"]["risk_levels"]),
+    ]
+    for candidate in report["candidates"]:
+        share = candidate["changed"] / report["incidents"] if report["incidents"] else 0.0
+        lines.append("")
+        lines.append(
+            f"candidate {candidate['config']} ({candidate['config_version']}): "
+            + _format_levels(candidate["risk_levels"])
+        )
+        lines.append(f"  {candidate['changed']} decisions changed ({share:.1%})")
+        for warning in candidate["warnings"]:
+            lines.append(f"  warning: {warning}")
+        for transition in candidate["transitions"][:top]:
+            lines.append(f"  {transition['from']:>6} -> {transition['to']:<6} {transition['count']}")
+        for change in candidate["escalation_changes"][:top]:
+            lines.append(
+                f"  chain {' > '.join(change['from']) or '-'}  =>  "
+                f"{' > '.join(change['to']) or '-'}  ({change['count']})"
+            )
+        moved = sorted(
+            candidate["zones"].items(),
+            key=lambda item: item[1]["raised"] + item[1]["lowered"],
+            reverse=True
+        )
+        for zone, counts in moved[:top]:
+            if counts["raised"] or counts["lowered"]:
+                lines.append(
+                    f"  zone {zone}: {counts['baseline']} -> {counts['candidate']} incidents, "
+                    f"{counts['raised']} raised, {counts['lowered']} lowered"
+                )
+    return "\n".join(lines)
+
+
+def _format_levels(levels: Dict[str, int]) -> str:
+    return ", ".join(f"{level} {count}" for level, count in levels.items())
@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from backend.core.config_loader import CampusConfigLoader, resolve_config_path
+from backend.core.metrics import CONFIG_RELOADS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RegistryEntry:
+    config_path: str
+    version: str
+    mtime_ns: int
+    checked_at: float
+    coordinator: Any
+
+
+class CampusRegistry:
+    """
+    Campus Registry
+    ---------------
+    Process-wide cache of loaded campus configurations and the
+    coordinators built on top of them.
+
+    - A config is parsed once and reused across requests
+    - The file is re-checked at most every `check_interval` seconds
+    - A rebuild only happens when mtime AND content hash change
+    - New versions are swapped in atomically; in-flight requests
+      keep the coordinator they started with
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[CampusConfigLoader], Any],
+        check_interval: float = 1.0
+    ):
+        self.factory = factory
+        self.check_interval = check_interval
+        self._entries: Dict[str, RegistryEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, config_path: str) -> Any:
+        """
+        Returns the coordinator for the current version of a config.
+        """
+        path = resolve_config_path(config_path)
+        entry = self._entries.get(path)
+
+        if entry is not None and not self._needs_check(entry):
+            return entry.coordinator
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or self._needs_check(entry):
+                entry = self._refresh(path, entry)
+
+        return entry.coordinator
+
+    def get_entry(self, config_path: str) -> Optional[RegistryEntry]:
+        return self._entries.get(resolve_config_path(config_path))
+
+    def invalidate(self, config_path: Optional[str] = None):
+        with self._lock:
+            if config_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(resolve_config_path(config_path), None)
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _needs_check(self, entry: RegistryEntry) -> bool:
+        return time.monotonic() - entry.checked_at >= self.check_interval
+
+    def _refresh(self, path: str, entry: Optional[RegistryEntry]) -> RegistryEntry:
+        now = time.monotonic()
+
+        if entry is None:
+            return self._build(path, now)
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            # File vanished mid-deploy: keep serving the last good version
+            logger.warning("Campus config %s unavailable, keeping %s", path, entry.version)
+            return self._store(path, entry, checked_at=now)
+
+        if mtime_ns == entry.mtime_ns:
+            return self._store(path, entry, checked_at=now)
+
+        # mtime moved: only rebuild when the content really changed
+        try:
+            with open(path, "rb") as f:
+                version = hashlib.sha256(f.read()).hexdigest()[:12]
+        except OSError:
+            return self._store(path, entry, checked_at=now)
+
+        if version == entry.version:
+            return self._store(path, entry, checked_at=now, mtime_ns=mtime_ns)
+
+        try:
+            return self._build(path, now, previous=entry)
+        except (OSError, ValueError) as exc:
+            # Half-written or invalid file: keep the previous version live
+            logger.error("Reload of %s failed, keeping %s: %s", path, entry.version, exc)
+            return self._store(path, entry, checked_at=now)
+
+    def _build(
+        self,
+        path: str,
+        now: float,
+        previous: Optional[RegistryEntry] = None
+    ) -> RegistryEntry:
+        loader = CampusConfigLoader(path)
+        coordinator = self.factory(loader)
+        CONFIG_RELOADS.inc()
+
+        if previous is not None:
+            logger.info(
+                "Campus config %s reloaded: %s -> %s",
+                path, previous.version, loader.version
+            )
+
+        entry = RegistryEntry(
+            config_path=path,
+            version=loader.version,
+            mtime_ns=loader.mtime_ns,
+            checked_at=now,
+            coordinator=coordinator
+        )
+        self._entries[path] = entry
+        return entry
+
+    def _store(
+        self,
+        path: str,
+        entry: RegistryEntry,
+        checked_at: float,
+        mtime_ns: Optional[int] = None
+    ) -> RegistryEntry:
+        entry = RegistryEntry(
+            config_path=entry.config_path,
+            version=entry.version,
+            mtime_ns=entry.mtime_ns if mtime_ns is None else mtime_ns,
+            checked_at=checked_at,
+            coordinator=entry.coordinator
+        )
+        self._entries[path] = entry
+        return entry
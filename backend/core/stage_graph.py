@@ -0,0 +1,378 @@
+import importlib
+import logging
+import threading
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from backend.core.metrics import METRICS, STAGE_FALLBACKS, STAGE_LATENCY
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Built-in stages and what each waits for. correlation and risk only
+# need the intake, so they may run side by side.
+CORE_STAGES: Dict[str, Tuple[str, ...]] = {
+    "intake": (),
+    "correlation": ("intake",),
+    "risk": ("intake",),
+    "response": ("risk", "correlation"),
+    "audit": ("response",),
+}
+
+# Keys the coordinator seeds into or keeps in every run's results;
+# stage names may not shadow them
+RESERVED_NAMES = ("payload", "features", "risk_decision", "response_template")
+
+# Applied to the core stages of any graph that runs stages on the
+# pool; a graph with no timeouts at all keeps them inline
+CORE_STAGE_TIMEOUT = 1.0
+
+STAGE_POOL_WORKERS = 32
+# Optional stages have their own pool, so hung enrichment cannot use
+# up the threads the core stages need
+ENRICHMENT_POOL_WORKERS = 16
+
+StageFn = Callable[[Dict[str, Any]], Any]
+
+
+class StageTimeout(TimeoutError):
+    pass
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One node of the pipeline graph.
+
+    - `run(results)` gets the live results of every finished stage by
+      name and must only read them
+    - `after` / `before` add edges from / to other stages
+    - A stage with a `timeout` runs on the stage pool (the enrichment
+      pool if `optional`) and is abandoned when the timeout passes; one
+      without runs inline unless pooled stages are in flight
+    - `fallback(results)` replaces the result of a stage that failed
+      or timed out; without one the error fails the run
+    - `optional` marks enrichment: on the fast path it only starts
+      once the escalation has been emitted
+    """
+    name: str
+    run: StageFn
+    after: Tuple[str, ...] = ()
+    before: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Optional[StageFn] = None
+    optional: bool = False
+
+
+def topological_order(deps: Dict[str, Sequence[str]]) -> List[str]:
+    """
+    Stage names with every stage after its dependencies, keeping
+    insertion order where the graph allows. Raises ValueError on an
+    unknown dependency or a cycle.
+    """
+    for name, after in deps.items():
+        for dep in after:
+            if dep not in deps:
+                raise ValueError(f"Pipeline stage '{name}' depends on unknown stage '{dep}'")
+
+    order: List[str] = []
+    placed = set()
+    remaining = list(deps)
+    while remaining:
+        ready = [name for name in remaining if all(dep in placed for dep in deps[name])]
+        if not ready:
+            raise ValueError(f"Pipeline stages form a cycle: {', '.join(remaining)}")
+        for name in ready:
+            order.append(name)
+            placed.add(name)
+        remaining = [name for name in remaining if name not in placed]
+    return order
+
+
+def graph_edges(stages: Iterable[Stage], terminal: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Dependencies per stage, with `before` edges folded in and the
+    `terminal` stage waiting for every other stage.
+    """
+    stages = list(stages)
+    deps = {stage.name: list(stage.after) for stage in stages}
+    for stage in stages:
+        for target in stage.before:
+            if target not in deps:
+                raise ValueError(f"Pipeline stage '{stage.name}' runs before unknown stage '{target}'")
+            if stage.name not in deps[target]:
+                deps[target].append(stage.name)
+    if terminal in deps:
+        deps[terminal].extend(name for name in deps if name != terminal and name not in deps[terminal])
+    return deps
+
+
+class StageGraph:
+    """
+    Stage Graph
+    -----------
+    Runs pipeline stages in dependency order.
+
+    - Stages without a timeout run inline on the caller's thread, so
+      the default pipeline costs no thread hops
+    - Stages with a timeout run on a shared pool: independent ones
+      overlap, and each is bounded by its own deadline. While any are
+      in flight, stages without a timeout run on the pool too, so the
+      caller's thread is always free to enforce those deadlines
+    - Fast path: once `fast_path(results)` holds, `fast_target` and
+      the stages it needs skip their optional dependencies, and
+      optional stages wait until `fast_target` has finished
+    - A timed-out stage's thread cannot be stopped; it finishes in the
+      background and its result is discarded
+    """
+
+    def __init__(
+        self,
+        stages: Iterable[Stage],
+        fast_target: Optional[str] = None,
+        terminal: Optional[str] = None
+    ):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages or stage.name in RESERVED_NAMES:
+                raise ValueError(f"Duplicate or reserved pipeline stage name: '{stage.name}'")
+            self.stages[stage.name] = stage
+
+        self.deps = graph_edges(self.stages.values(), terminal)
+        self.order = topological_order(self.deps)
+        self.fast_target = fast_target
+        self._lead = self._required_closure(fast_target) if fast_target in self.stages else set()
+        # Same stages, with the fast target and what it needs first
+        self._fast_order = [n for n in self.order if n in self._lead] + [
+            n for n in self.order if n not in self._lead
+        ]
+        self._pooled = any(stage.timeout is not None for stage in self.stages.values())
+        self._optional = any(stage.optional for stage in self.stages.values())
+
+    def run(
+        self,
+        results: Dict[str, Any],
+        fast_path: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields (stage, result) as each stage finishes and stores every
+        result in `results`. Closing the generator abandons the rest.
+        """
+        if not self._optional:
+            # Nothing to hold back, so the fast path changes nothing
+            fast_path = None
+        if not self._pooled:
+            return self._run_inline(results, fast_path)
+        return self._run_scheduled(results, fast_path)
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _run_inline(
+        self,
+        results: Dict[str, Any],
+        fast_path: Optional[Callable[[Dict[str, Any]], bool]]
+    ) -> Iterator[Tuple[str, Any]]:
+        # No timeouts: a fixed order on the caller's thread
+        done = set()
+        order = self.order
+        index = 0
+        while index < len(order):
+            stage = self.stages[order[index]]
+            index += 1
+            if stage.name in done:
+                continue
+            started = perf_counter()
+            try:
+                value = stage.run(results)
+            except Exception as exc:
+                value = self._fallback(stage, results, exc, "error")
+            yield self._finish(stage, value, started, results, done)
+
+            if fast_path is not None and fast_path(results):
+                fast_path = None
+                order, index = self._fast_order, 0
+
+    def _run_scheduled(
+        self,
+        results: Dict[str, Any],
+        fast_path: Optional[Callable[[Dict[str, Any]], bool]]
+    ) -> Iterator[Tuple[str, Any]]:
+        waiting = list(self.order)
+        done = set()
+        running: Dict["Future", Tuple[Stage, float, float]] = {}
+        fast = False
+
+        while waiting or running:
+            if fast_path is not None and not fast and fast_path(results):
+                fast = True
+
+            ready = [self.stages[n] for n in waiting if self._ready(n, done, fast)]
+            untimed = []
+            for stage in ready:
+                if stage.timeout is None:
+                    untimed.append(stage)
+                    continue
+                waiting.remove(stage.name)
+                self._submit(stage, results, running)
+
+            if untimed and not running:
+                inline = untimed[0]
+                waiting.remove(inline.name)
+                started = perf_counter()
+                try:
+                    value = inline.run(results)
+                except Exception as exc:
+                    value = self._fallback(inline, results, exc, "error")
+                yield self._finish(inline, value, started, results, done)
+                continue
+            for stage in untimed:
+                waiting.remove(stage.name)
+                self._submit(stage, results, running)
+
+            if not running:
+                raise RuntimeError(f"Pipeline stages cannot start: {', '.join(waiting)}")
+
+            from concurrent.futures import FIRST_COMPLETED, wait
+
+            deadline = min(end for _, _, end in running.values())
+            timeout = None if deadline == float("inf") else max(0.0, deadline - perf_counter())
+            wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            now = perf_counter()
+            for future, (stage, started, end) in list(running.items()):
+                if future.done():
+                    del running[future]
+                    try:
+                        value = future.result()
+                    except Exception as exc:
+                        value = self._fallback(stage, results, exc, "error")
+                elif now >= end:
+                    del running[future]
+                    future.cancel()
+                    value = self._fallback(
+                        stage, results,
+                        StageTimeout(f"Pipeline stage '{stage.name}' timed out after {stage.timeout}s"),
+                        "timeout"
+                    )
+                else:
+                    continue
+                yield self._finish(stage, value, started, results, done)
+
+    @staticmethod
+    def _submit(stage: Stage, results: Dict[str, Any], running: Dict["Future", Tuple[Stage, float, float]]):
+        started = perf_counter()
+        future = _stage_pool(stage.optional).submit(stage.run, results)
+        end = float("inf") if stage.timeout is None else started + stage.timeout
+        running[future] = (stage, started, end)
+
+    def _ready(self, name: str, done: set, fast: bool) -> bool:
+        stage = self.stages[name]
+        if fast and stage.optional and self.fast_target not in done:
+            return False
+        deps = self.deps[name]
+        if fast and name in self._lead:
+            deps = [dep for dep in deps if not self.stages[dep].optional]
+        return all(dep in done for dep in deps)
+
+    def _required_closure(self, name: str) -> set:
+        closure = set()
+        stack = [name]
+        while stack:
+            current = stack.pop()
+            if current in closure:
+                continue
+            closure.add(current)
+            stack.extend(dep for dep in self.deps[current] if not self.stages[dep].optional)
+        return closure
+
+    @staticmethod
+    def _fallback(stage: Stage, results: Dict[str, Any], exc: BaseException, reason: str) -> Any:
+        if stage.fallback is None:
+            raise exc
+        logger.warning("Pipeline stage %s failed (%s), using its fallback: %s", stage.name, reason, exc)
+        if METRICS.enabled:
+            STAGE_FALLBACKS.inc(stage.name, reason)
+        return stage.fallback(results)
+
+    @staticmethod
+    def _finish(
+        stage: Stage,
+        value: Any,
+        started: float,
+        results: Dict[str, Any],
+        done: set
+    ) -> Tuple[str, Any]:
+        if METRICS.enabled:
+            STAGE_LATENCY.observe(perf_counter() - started, stage.name)
+        results[stage.name] = value
+        done.add(stage.name)
+        return stage.name, value
+
+
+# Core and optional stage pools, keyed by `optional`
+_pools: Dict[bool, "ThreadPoolExecutor"] = {}
+_pool_lock = threading.Lock()
+
+
+def _stage_pool(optional: bool = False) -> "ThreadPoolExecutor":
+    pool = _pools.get(optional)
+    if pool is None:
+        with _pool_lock:
+            pool = _pools.get(optional)
+            if pool is None:
+                # Deferred: only pipelines with stage timeouts need them
+                from concurrent.futures import ThreadPoolExecutor
+
+                pool = _pools[optional] = ThreadPoolExecutor(
+                    max_workers=ENRICHMENT_POOL_WORKERS if optional else STAGE_POOL_WORKERS,
+                    thread_name_prefix="pipeline-enrichment" if optional else "pipeline-stage"
+                )
+    return pool
+
+
+# ---------------- CONFIG ----------------
+
+def resolve_callable(path: str) -> StageFn:
+    """
+    "package.module:function" -> the function.
+    """
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Pipeline stage callable must look like 'module:function', got '{path}'")
+    target: Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        target = getattr(target, part)
+    if not callable(target):
+        raise ValueError(f"Pipeline stage callable '{path}' is not callable")
+    return target
+
+
+def _constant(value: Any) -> StageFn:
+    return lambda results: value
+
+
+def stages_from_config(section: Dict[str, Any]) -> List[Stage]:
+    """
+    Custom stages from a campus config's "pipeline.stages". They are
+    optional enrichment unless marked otherwise, and an optional stage
+    without a "fallback" falls back to null.
+    """
+    stages = []
+    for spec in section.get("stages", []):
+        optional = spec.get("optional", True)
+        fallback = None
+        if "fallback" in spec or optional:
+            fallback = _constant(spec.get("fallback"))
+        stages.append(Stage(
+            name=spec["name"],
+            run=resolve_callable(spec["callable"]),
+            after=tuple(spec.get("after", ("intake",))),
+            before=tuple(spec.get("before", ())),
+            timeout=spec.get("timeout"),
+            fallback=fallback,
+            optional=optional
+        ))
+    return stages
@@ -0,0 +1,360 @@
+import asyncio
+import json
+import smtplib
+import ssl
+import threading
+from collections import deque
+from email.message import EmailMessage
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class DeliveryError(Exception):
+    """
+    A notification could not be delivered. Transient errors are
+    retried until the notification's deadline; permanent ones are not.
+    """
+    transient = True
+
+
+class TransientDeliveryError(DeliveryError):
+    transient = True
+
+
+class PermanentDeliveryError(DeliveryError):
+    transient = False
+
+
+def notification_text(notification: Dict[str, Any]) -> str:
+    """
+    One-line summary used for SMS bodies and e-mail subjects.
+    """
+    return (
+        f"[{notification['risk_level']}] {notification['incident_type']} at "
+        f"{notification['location']}: {notification['authority']} is step "
+        f"{notification['step']} of the escalation. Incident {notification['incident_id']}"
+    )
+
+
+# ---------------- HTTP ----------------
+
+class HttpConnectionPool:
+    """
+    HTTP Connection Pool
+    --------------------
+    Minimal asyncio HTTP/1.1 client with keep-alive connections per
+    (scheme, host, port), enough for webhook and SMS gateway POSTs.
+
+    - At most `max_connections` per origin; idle ones are reused
+    - Connections the server closes, or that fail mid-request, are
+      dropped rather than returned to the pool
+    - Must be used from a single event loop
+    """
+
+    def __init__(self, max_connections: int = 8):
+        self.max_connections = max_connections
+        self.opened = 0
+        self._idle: Dict[Tuple[str, str, int], Deque[Tuple[Any, Any]]] = {}
+        self._slots: Dict[Tuple[str, str, int], asyncio.Semaphore] = {}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, bytes]:
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        origin = (parts.scheme, parts.hostname or "localhost", parts.port or (443 if secure else 80))
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        head = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+        ]
+        head.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        request = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        slots = self._slots.setdefault(origin, asyncio.Semaphore(self.max_connections))
+        async with slots:
+            reader, writer, reused = await self._connect(origin, secure)
+            try:
+                status, keep_alive, payload = await _exchange(reader, writer, request)
+            except ConnectionError:
+                writer.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection
+                reader, writer, _ = await self._connect(origin, secure, fresh=True)
+                try:
+                    status, keep_alive, payload = await _exchange(reader, writer, request)
+                except BaseException:
+                    writer.close()
+                    raise
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self._idle.setdefault(origin, deque()).append((reader, writer))
+            else:
+                writer.close()
+        return status, payload
+
+    async def close(self):
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+
+    async def _connect(self, origin: Tuple[str, str, int], secure: bool, fresh: bool = False):
+        idle = self._idle.get(origin)
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        self.opened += 1
+        reader, writer = await asyncio.open_connection(
+            origin[1], origin[2], ssl=ssl.create_default_context() if secure else None
+        )
+        return reader, writer, False
+
+
+class _ClosedEarly(ConnectionError):
+    pass
+
+
+async def _exchange(reader, writer, request: bytes) -> Tuple[int, bool, bytes]:
+    writer.write(request)
+    await writer.drain()
+    return await _read_response(reader)
+
+
+async def _read_response(reader) -> Tuple[int, bool, bytes]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise _ClosedEarly("Connection closed before a response")
+    version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks: List[bytes] = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        payload = b"".join(chunks)
+        keep_alive = True
+    elif "content-length" in headers:
+        payload = await reader.readexactly(int(headers["content-length"]))
+        keep_alive = True
+    else:
+        # Body runs until the server closes the connection
+        payload = await reader.read()
+        keep_alive = False
+
+    connection = headers.get("connection", "").lower()
+    if connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive"):
+        keep_alive = False
+    return int(status), keep_alive, payload
+
+
+class WebhookTransport:
+    """
+    POSTs the notification as JSON. 2xx is delivered, 408/429/5xx are
+    retried, any other status is a permanent failure.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 8
+    ):
+        self.url = url
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.pool = HttpConnectionPool(max_connections)
+
+    def render(self, notification: Dict[str, Any]) -> Dict[str, Any]:
+        return notification
+
+    async def send(self, notification: Dict[str, Any]):
+        body = json.dumps(self.render(notification)).encode("utf-8")
+        try:
+            status, payload = await self.pool.request("POST", self.url, body, self.headers)
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            raise TransientDeliveryError(f"{type(exc).__name__}: {exc}") from exc
+
+        if 200 <= status < 300:
+            return
+        detail = f"HTTP {status} from {self.url}: {payload[:200].decode('utf-8', 'replace')}"
+        if status in (408, 429) or status >= 500:
+            raise TransientDeliveryError(detail)
+        raise PermanentDeliveryError(detail)
+
+    async def close(self):
+        await self.pool.close()
+
+
+class SmsGatewayTransport(WebhookTransport):
+    """
+    SMS through an HTTP gateway: {"to", "from", "message"} JSON.
+    """
+
+    def __init__(self, url: str, sender: str, **kwargs):
+        super().__init__(url, **kwargs)
+        self.sender = sender
+
+    def render(self, notification: Dict[str, Any]) -> Dict[str, Any]:
+        if not notification.get("recipient"):
+            raise PermanentDeliveryError(f"No phone number for {notification['authority']}")
+        return {
+            "to": notification["recipient"],
+            "from": self.sender,
+            "message": notification_text(notification),
+        }
+
+
+# ---------------- SMTP ----------------
+
+class SmtpTransport:
+    """
+    E-mail over pooled SMTP sessions. smtplib is blocking, so each send
+    runs in a worker thread; sessions stay open between sends.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 25,
+        sender: str = "campus-safety@localhost",
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = False,
+        max_connections: int = 2,
+        timeout: float = 10.0
+    ):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.opened = 0
+        self._idle: List[smtplib.SMTP] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def render(self, notification: Dict[str, Any]) -> EmailMessage:
+        if not notification.get("recipient"):
+            raise PermanentDeliveryError(f"No e-mail address for {notification['authority']}")
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = notification["recipient"]
+        message["Subject"] = notification_text(notification)
+        message.set_content(json.dumps(notification, indent=2))
+        return message
+
+    async def send(self, notification: Dict[str, Any]):
+        await asyncio.to_thread(self._send, self.render(notification))
+
+    async def close(self):
+        await asyncio.to_thread(self._close_idle)
+
+    def _send(self, message: EmailMessage):
+        with self._slots:
+            try:
+                self._deliver(self._checkout(), message)
+            except smtplib.SMTPServerDisconnected:
+                # Stale pooled session: one attempt on a fresh one
+                try:
+                    self._deliver(self._open(), message)
+                except smtplib.SMTPServerDisconnected as exc:
+                    raise TransientDeliveryError(f"SMTP server disconnected: {exc}") from exc
+
+    def _deliver(self, session: smtplib.SMTP, message: EmailMessage):
+        try:
+            session.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            session.close()
+            raise
+        except smtplib.SMTPResponseException as exc:
+            self._checkin(session)
+            raise _smtp_error(exc) from exc
+        except smtplib.SMTPRecipientsRefused as exc:
+            self._checkin(session)
+            raise PermanentDeliveryError(f"Recipients refused: {list(exc.recipients)}") from exc
+        except (smtplib.SMTPException, OSError) as exc:
+            session.close()
+            raise TransientDeliveryError(f"{type(exc).__name__}: {exc}") from exc
+        self._checkin(session)
+
+    def _checkout(self) -> smtplib.SMTP:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._open()
+
+    def _checkin(self, session: smtplib.SMTP):
+        with self._lock:
+            self._idle.append(session)
+
+    def _open(self) -> smtplib.SMTP:
+        try:
+            session = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.starttls:
+                session.starttls(context=ssl.create_default_context())
+            if self.username:
+                session.login(self.username, self.password or "")
+        except (smtplib.SMTPException, OSError) as exc:
+            raise TransientDeliveryError(f"SMTP connect failed: {exc}") from exc
+        self.opened += 1
+        return session
+
+    def _close_idle(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for session in idle:
+            try:
+                session.quit()
+            except (smtplib.SMTPException, OSError):
+                session.close()
+
+
+def _smtp_error(exc: smtplib.SMTPResponseException) -> DeliveryError:
+    detail = f"SMTP {exc.smtp_code}: {exc.smtp_error!r}"
+    if 400 <= exc.smtp_code < 500:
+        return TransientDeliveryError(detail)
+    return PermanentDeliveryError(detail)
+
+
+TRANSPORT_TYPES = {
+    "webhook": WebhookTransport,
+    "sms": SmsGatewayTransport,
+    "smtp": SmtpTransport,
+}
+
+
+def build_transport(spec: Dict[str, Any]):
+    """
+    Builds a transport from a config entry: {"type": ..., **options}.
+    """
+    options = dict(spec)
+    kind = options.pop("type", None)
+    if kind not in TRANSPORT_TYPES:
+        raise ValueError(f"Unknown notification transport type: {kind!r}")
+    return TRANSPORT_TYPES[kind](**options)
@@ -0,0 +1,69 @@
+import math
+import threading
+from typing import Dict, List, Optional
+
+
+class ZoneActivity:
+    """
+    Zone Activity
+    -------------
+    Exponentially decayed incident count per zone, used to raise the
+    risk of reports that arrive close together in one place.
+
+    - Each zone keeps only (level, last update time); an update decays
+      the level to the new time and adds one, so it is O(1)
+    - Memory is bounded by the campus zones; unzoned reports are not
+      tracked
+    - Times are incident times, so replayed or out-of-order reports
+      decay correctly instead of being counted as "now"
+    """
+
+    def __init__(self, half_life_seconds: float = 900.0, max_boost: int = 2):
+        if half_life_seconds <= 0:
+            raise ValueError("half_life_seconds must be positive")
+        self.half_life_seconds = half_life_seconds
+        self.max_boost = max_boost
+        self._decay = math.log(2) / half_life_seconds
+        self._zones: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, zone: Optional[str], timestamp: float) -> int:
+        """
+        Records one incident in `zone` and returns the risk boost from
+        the activity that preceded it.
+        """
+        if not zone:
+            return 0
+        with self._lock:
+            state = self._zones.get(zone)
+            if state is None:
+                self._zones[zone] = [1.0, timestamp]
+                return 0
+            level, last = state
+            if timestamp >= last:
+                prior = level * math.exp(-self._decay * (timestamp - last))
+                state[0] = prior + 1.0
+                state[1] = timestamp
+            else:
+                # Late arrival: scored against the zone's current level,
+                # and its own weight is decayed forward to the zone clock
+                prior = level
+                state[0] = level + math.exp(-self._decay * (last - timestamp))
+        return self.boost_for(prior)
+
+    def level(self, zone: str, timestamp: float) -> float:
+        with self._lock:
+            state = self._zones.get(zone)
+            if state is None:
+                return 0.0
+            level, last = state
+        return level * math.exp(-self._decay * max(0.0, timestamp - last))
+
+    def boost_for(self, level: float) -> int:
+        # Roughly the number of recent reports still within a half-life
+        return min(self.max_boost, int(level + 0.5))
+
+    def snapshot(self, timestamp: float) -> Dict[str, float]:
+        with self._lock:
+            zones = list(self._zones)
+        return {zone: round(self.level(zone, timestamp), 3) for zone in zones}
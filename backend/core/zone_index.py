@@ -0,0 +1,198 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+TIER_ORDER = ("high", "medium", "low")
+DEFAULT_TIER = "low"
+_TIER_RANK = {tier: rank for rank, tier in enumerate(TIER_ORDER)}
+
+_TOKEN = re.compile(r"\w+")
+_QUALIFIED = re.compile(r"^(?P<name>.*?)\s*\((?P<qualifier>[^()]*)\)\s*$")
+_CLOCK = r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?"
+_AFTER = re.compile(r"^(?:after|from)\s+" + _CLOCK + r"$")
+_BEFORE = re.compile(r"^(?:before|until)\s+" + _CLOCK + r"$")
+_RANGE = re.compile(r"^" + _CLOCK + r"\s*(?:-|to)\s*" + _CLOCK + r"$")
+
+# Bounded cache of location string -> candidate rules (time independent)
+_LOCATION_CACHE_LIMIT = 2048
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """
+    Half-open hour window [start, end); wraps past midnight when
+    start > end and covers the whole day when start == end.
+    """
+    start: int
+    end: int
+
+    def contains(self, hour: int) -> bool:
+        if self.start == self.end:
+            return True
+        if self.start < self.end:
+            return self.start <= hour < self.end
+        return hour >= self.start or hour < self.end
+
+
+@dataclass(frozen=True)
+class ZoneRule:
+    zone: str
+    tier: str
+    window: Optional[TimeWindow]
+
+    def active(self, hour: Optional[int]) -> bool:
+        if self.window is None:
+            return True
+        # Without a usable timestamp a time-qualified zone cannot apply
+        return hour is not None and self.window.contains(hour)
+
+
+@dataclass(frozen=True)
+class ZoneMatch:
+    zone: Optional[str]
+    tier: str
+
+
+def parse_hour(value: str) -> int:
+    """
+    Parses "20:00" style config times into an hour of day.
+    """
+    return int(value.split(":")[0]) % 24
+
+
+def _clock_hour(hour: str, meridiem: Optional[str]) -> int:
+    value = int(hour)
+    if meridiem == "pm" and value < 12:
+        value += 12
+    elif meridiem == "am" and value == 12:
+        value = 0
+    return value % 24
+
+
+def parse_qualifier(qualifier: str, day_start: int, night_start: int) -> TimeWindow:
+    """
+    Turns a zone qualifier such as "Night", "Day Time", "After 8 PM",
+    "Before 6 AM" or "8 PM - 6 AM" into an hour window.
+    """
+    text = " ".join(qualifier.lower().replace(".", "").split())
+
+    if text in ("night", "night time", "nighttime", "at night"):
+        return TimeWindow(night_start, day_start)
+    if text in ("day", "day time", "daytime", "during day"):
+        return TimeWindow(day_start, night_start)
+
+    match = _AFTER.match(text)
+    if match:
+        # "After 8 PM" lasts until the campus day starts again
+        return TimeWindow(_clock_hour(match.group(1), match.group(3)), day_start)
+
+    match = _BEFORE.match(text)
+    if match:
+        return TimeWindow(0, _clock_hour(match.group(1), match.group(3)))
+
+    match = _RANGE.match(text)
+    if match:
+        return TimeWindow(
+            _clock_hour(match.group(1), match.group(3)),
+            _clock_hour(match.group(4), match.group(6))
+        )
+
+    raise ValueError(f"Unrecognised risk zone time qualifier: '{qualifier}'")
+
+
+class ZoneIndex:
+    """
+    Zone Index
+    ----------
+    Compiled location -> risk tier lookup built once per campus config.
+
+    - Zone names live in a word-token trie, so resolving a location
+      costs O(words in location), not O(number of zones)
+    - Parenthesised qualifiers ("Night", "After 8 PM") become real
+      hour windows checked against the incident hour
+    - When several zones match, the highest tier wins
+    """
+
+    def __init__(self, risk_zones: Dict[str, List[str]], day_start: int, night_start: int):
+        self.day_start = day_start
+        self.night_start = night_start
+        self.night = TimeWindow(night_start, day_start)
+
+        self._trie: dict = {}
+        self._rules: List[ZoneRule] = []
+        self._location_cache: Dict[str, Tuple[ZoneRule, ...]] = {}
+
+        for tier in TIER_ORDER:
+            for entry in risk_zones.get(tier, []):
+                self._add(entry, tier)
+
+    @classmethod
+    def from_config(cls, campus_config: dict) -> "ZoneIndex":
+        hours = campus_config["campus"]["operating_hours"]
+        return cls(
+            campus_config.get("risk_zones", {}),
+            day_start=parse_hour(hours.get("day_start", "06:00")),
+            night_start=parse_hour(hours["night_start"])
+        )
+
+    @property
+    def rules(self) -> Tuple[ZoneRule, ...]:
+        return tuple(self._rules)
+
+    def is_night(self, hour: Optional[int]) -> bool:
+        return hour is not None and self.night.contains(hour)
+
+    def resolve(self, location: str, hour: Optional[int]) -> ZoneMatch:
+        best = None
+        for rule in self._candidates(location):
+            if not rule.active(hour):
+                continue
+            if best is None or _TIER_RANK[rule.tier] < _TIER_RANK[best.tier]:
+                best = rule
+
+        if best is None:
+            return ZoneMatch(zone=None, tier=DEFAULT_TIER)
+        return ZoneMatch(zone=best.zone, tier=best.tier)
+
+    # ---------------- INTERNAL HELPERS ----------------
+
+    def _add(self, entry: str, tier: str):
+        match = _QUALIFIED.match(entry)
+        if match:
+            name = match.group("name")
+            window = parse_qualifier(match.group("qualifier"), self.day_start, self.night_start)
+        else:
+            name, window = entry, None
+
+        tokens = _TOKEN.findall(name.lower())
+        if not tokens:
+            return
+
+        rule = ZoneRule(zone=name.strip(), tier=tier, window=window)
+        self._rules.append(rule)
+
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(None, []).append(rule)
+
+    def _candidates(self, location: str) -> Tuple[ZoneRule, ...]:
+        cached = self._location_cache.get(location)
+        if cached is not None:
+            return cached
+
+        tokens = _TOKEN.findall(location.lower())
+        found = []
+        for start in range(len(tokens)):
+            node = self._trie
+            for token in tokens[start:]:
+                node = node.get(token)
+                if node is None:
+                    break
+                found.extend(node.get(None, ()))
+
+        candidates = tuple(found)
+        if len(self._location_cache) < _LOCATION_CACHE_LIMIT:
+            self._location_cache[location] = candidates
+        return candidates
@@ -1,8 +1,22 @@
-from core.coordinator import CoordinatorAgent
+"""
+Streaming entry point: NDJSON incidents in, NDJSON decisions out.
 
+    python -m backend.main incidents.ndjson -o decisions.ndjson
+    gateway-tail | python -m backend.main > decisions.ndjson
+    python -m backend.main --demo
 
-def main():
-    coordinator = CoordinatorAgent()
+Throughput statistics are written to stderr so stdout stays pure NDJSON.
+"""
+import argparse
+import json
+import sys
+
+from backend.core.coordinator import DEFAULT_CAMPUS_CONFIG, CoordinatorAgent
+from backend.core.ndjson_stream import stream_ndjson
+
+
+def run_demo(config_path: str):
+    coordinator = CoordinatorAgent(config_path)
 
     # Demo input (what judges see)
     incident_payload = {
@@ -17,8 +31,48 @@ def main():
     print(f"Decision      : {result.final_decision}")
     print(f"Risk Level    : {result.risk_level}")
     print(f"Confidence    : {result.confidence_level}")
-    print(f"Explanation   : {result.explanation}")
+    print(f"Explanation   : {result.explain()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream NDJSON incidents through the safety pipeline")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="NDJSON file or FIFO; '-' reads stdin (default)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Where to write NDJSON results; '-' is stdout (default)")
+    parser.add_argument("--config", default=DEFAULT_CAMPUS_CONFIG, help="Campus config file")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--queue-size", type=int, default=8,
+                        help="Batches buffered between parse, pipeline and output stages")
+    parser.add_argument("--explain", action="store_true", help="Include explanations in the output")
+    parser.add_argument("--stats-json", action="store_true", help="Print statistics as JSON")
+    parser.add_argument("--demo", action="store_true", help="Run the single-incident demo")
+    args = parser.parse_args(argv)
+
+    if args.demo:
+        run_demo(args.config)
+        return 0
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        stats = stream_ndjson(
+            source,
+            sink,
+            config_path=args.config,
+            batch_size=args.batch_size,
+            queue_size=args.queue_size,
+            explain=args.explain
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    print(json.dumps(stats.as_dict()) if args.stats_json else stats.summary(), file=sys.stderr)
+    return 0 if stats.failed == 0 else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+What-if policy simulation: replays an incident history under candidate
+campus configs and reports how decisions would shift.
+
+    python -m backend.simulate history.ndjson candidate.json
+    python -m backend.simulate history.ndjson a.json b.json --workers 8 --out diff.json
+
+The history is NDJSON incident payloads, the same input backend.main
+takes. The readable summary goes to stdout; --out writes the full JSON
+report (transitions, escalation chain changes, per-zone counts).
+"""
+import argparse
+import json
+import sys
+from time import perf_counter
+
+from backend.core.coordinator import DEFAULT_CAMPUS_CONFIG
+from backend.core.policy_simulation import format_report, simulate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay incident history under candidate campus configs")
+    parser.add_argument("history", help="NDJSON file of incident payloads")
+    parser.add_argument("candidates", nargs="+", help="Candidate campus config files")
+    parser.add_argument("--baseline", default=DEFAULT_CAMPUS_CONFIG, help="Config the history is compared against")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--examples", type=int, default=10, help="Changed incidents to include per candidate")
+    parser.add_argument("--top", type=int, default=5, help="Rows per section in the summary")
+    parser.add_argument("--out", help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    started = perf_counter()
+    try:
+        report = simulate(
+            args.history,
+            args.baseline,
+            args.candidates,
+            workers=args.workers,
+            max_examples=args.examples
+        )
+    except (OSError, ValueError) as exc:
+        print(f"simulation failed: {exc}", file=sys.stderr)
+        return 2
+    elapsed = perf_counter() - started
+
+    print(format_report(report, top=args.top))
+    print(f"\nreplayed in {elapsed:.1f}s", file=sys.stderr)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+import unittest
+
+from backend.core.admission import AdmissionController, AdmissionRejected, parse_trusted_sources
+from backend.core.coordinator import build_payload
+from backend.core.ingestion import PRIORITY_CRITICAL, PRIORITY_HIGH, PRIORITY_LOW
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _payload(text, location="Central Library"):
+    return build_payload(text, location, "Student")
+
+
+class TestAdmissionController(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _controller(self, **kwargs):
+        options = {
+            "rate": 10.0, "burst": 10.0,
+            "source_rate": 1.0, "source_burst": 3.0,
+            "location_rate": 100.0, "location_burst": 100.0,
+            "clock": self.clock,
+        }
+        options.update(kwargs)
+        return AdmissionController(**options)
+
+    def test_source_limit_refills(self):
+        """A chatty source is shed once its burst is spent, then recovers"""
+        controller = self._controller()
+        for i in range(3):
+            controller.admit("10.0.0.1", "gla", _payload(f"Noise {i}"), PRIORITY_HIGH)
+
+        with self.assertRaises(AdmissionRejected) as caught:
+            controller.admit("10.0.0.1", "gla", _payload("Noise 3"), PRIORITY_HIGH)
+        self.assertEqual(caught.exception.reason, "source_limit")
+        self.assertAlmostEqual(caught.exception.retry_after, 1.0)
+
+        # Other sources are unaffected; the first recovers after a second
+        controller.admit("10.0.0.2", "gla", _payload("Noise"), PRIORITY_HIGH)
+        self.clock.now = 1.0
+        controller.admit("10.0.0.1", "gla", _payload("Noise 4"), PRIORITY_HIGH)
+
+    def test_overload_sheds_low_and_duplicates_first(self):
+        """Low and duplicate traffic stop at half the global bucket; High uses the rest"""
+        controller = self._controller(source_burst=100.0)
+        for i in range(5):
+            controller.admit(f"s{i}", "gla", _payload(f"Bike missing {i}"), PRIORITY_LOW)
+
+        with self.assertRaises(AdmissionRejected) as low:
+            controller.admit("s9", "gla", _payload("Bike missing again"), PRIORITY_LOW)
+        self.assertEqual(low.exception.reason, "overload")
+        with self.assertRaises(AdmissionRejected) as duplicate:
+            controller.admit("s0", "gla", _payload("Bike missing 0"), PRIORITY_HIGH)
+        self.assertEqual(duplicate.exception.traffic_class, "duplicate")
+
+        for i in range(5):
+            controller.admit(f"h{i}", "gla", _payload(f"Assault {i}"), PRIORITY_HIGH)
+        with self.assertRaises(AdmissionRejected):
+            controller.admit("h9", "gla", _payload("Assault again"), PRIORITY_HIGH)
+
+        stats = controller.stats()
+        self.assertEqual(stats["admitted"], 10)
+        self.assertEqual(stats["shed"], 3)
+        self.assertEqual(stats["by_class"]["low"], {"admitted": 5, "overload": 1})
+
+    def test_critical_always_admitted(self):
+        """Panic reports pass every limit but still spend the source's budget"""
+        controller = self._controller()
+        for _ in range(20):
+            traffic_class = controller.admit(
+                "10.0.0.1", "gla", _payload("EMERGENCY. Help"), PRIORITY_CRITICAL
+            )
+            self.assertEqual(traffic_class, "critical")
+
+        with self.assertRaises(AdmissionRejected) as caught:
+            controller.admit("10.0.0.1", "gla", _payload("Noise"), PRIORITY_HIGH)
+        self.assertEqual(caught.exception.reason, "source_limit")
+        self.assertEqual(controller.stats()["by_class"]["critical"], {"admitted": 20})
+
+    def test_shed_report_retries_as_itself(self):
+        """A report shed with a 429 is not a duplicate when it is retried"""
+        controller = self._controller(source_burst=1.0)
+        controller.admit("10.0.0.1", "gla", _payload("Noise"), PRIORITY_HIGH)
+        with self.assertRaises(AdmissionRejected) as caught:
+            controller.admit("10.0.0.1", "gla", _payload("Assault"), PRIORITY_HIGH)
+        self.assertEqual(caught.exception.traffic_class, "high")
+
+        self.clock.now = caught.exception.retry_after
+        self.assertEqual(
+            controller.admit("10.0.0.1", "gla", _payload("Assault"), PRIORITY_HIGH), "high"
+        )
+
+    def test_batch_charges_source_once(self):
+        """A gateway batch costs its source one token; locations are charged per item"""
+        controller = self._controller(rate=1000.0, burst=1000.0, location_burst=3.0)
+        items = [(_payload(f"Noise {i}", f"Room {i}"), PRIORITY_HIGH) for i in range(50)]
+
+        outcomes = controller.admit_batch("10.0.0.1", "gla", items)
+        self.assertTrue(all(outcome == "high" for outcome in outcomes))
+
+        crowded = [(_payload(f"Smoke {i}", "Cafeteria"), PRIORITY_HIGH) for i in range(5)]
+        outcomes = controller.admit_batch("10.0.0.1", "gla", crowded)
+        self.assertEqual([o.reason for o in outcomes[3:]], ["location_limit"] * 2)
+
+        # The source has now spent 2 of its 3 tokens
+        controller.admit_batch("10.0.0.1", "gla", [(_payload("Leak"), PRIORITY_HIGH)])
+        outcomes = controller.admit_batch("10.0.0.1", "gla", [
+            (_payload("Water leak"), PRIORITY_HIGH),
+            (_payload("EMERGENCY. Help"), PRIORITY_CRITICAL),
+        ])
+        self.assertEqual(outcomes[0].reason, "source_limit")
+        self.assertEqual(outcomes[1], "critical")
+
+    def test_trusted_sources_get_their_own_limits(self):
+        trusted = parse_trusted_sources("10.0.0.9=50/100, 10.0.0.8=1/1")
+        self.assertEqual(trusted["10.0.0.9"], (50.0, 100.0))
+        with self.assertRaises(ValueError):
+            parse_trusted_sources("10.0.0.9=fast")
+
+        controller = self._controller(rate=1000.0, burst=1000.0, trusted_sources=trusted)
+        for i in range(20):
+            controller.admit("10.0.0.9", "gla", _payload(f"Noise {i}"), PRIORITY_HIGH)
+        with self.assertRaises(AdmissionRejected):
+            for i in range(4):
+                controller.admit("10.0.0.1", "gla", _payload(f"Noise {i}"), PRIORITY_HIGH)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from backend.core.config_loader import CampusConfigLoader
+from backend.core.keyword_matcher import KeywordMatcher
+from backend.core.zone_index import TimeWindow, ZoneIndex, parse_qualifier
+
+
+class TestKeywordMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = KeywordMatcher()
+
+    def test_word_boundaries(self):
+        """Critical keywords should not match inside longer words"""
+        features = self.matcher.extract("Printer broken at the IT helpdesk")
+        self.assertFalse(features.critical)
+
+        features = self.matcher.extract("Please HELP, someone collapsed")
+        self.assertEqual(features.critical_hits, ("help",))
+
+    def test_stems_and_shared_features(self):
+        """One scan should feed both classification and the override"""
+        features = self.matcher.extract("A man kept following me near the gate")
+        self.assertEqual(features.incident_type, "Harassment")
+        self.assertTrue(features.critical)
+
+        features = self.matcher.extract("Someone followed me")
+        self.assertEqual(features.incident_type, "Harassment")
+        self.assertFalse(features.critical)
+
+    def test_classification_priority(self):
+        """Fire should win over Lab Hazard when both match"""
+        features = self.matcher.extract("Fire reported in chemistry lab")
+        self.assertEqual(features.incident_type, "Fire")
+        self.assertEqual(
+            self.matcher.extract("Library is noisy").incident_type,
+            "General Incident"
+        )
+
+    def test_campus_keywords(self):
+        """Campus configs can override both keyword sets"""
+        matcher = KeywordMatcher.from_config({
+            "keywords": {
+                "incident_types": {"Cyberbullying": ["troll*", "cyber bullying"]},
+                "critical": ["gas leak"]
+            }
+        })
+
+        features = matcher.extract("Cyber   bullying and a GAS LEAK in block C")
+        self.assertEqual(features.incident_type, "Cyberbullying")
+        self.assertEqual(features.critical_hits, ("gas leak",))
+        self.assertFalse(matcher.extract("fire drill").critical)
+
+
+class TestZoneIndex(unittest.TestCase):
+
+    def setUp(self):
+        loader = CampusConfigLoader("config/gla_university.json")
+        self.index = loader.get_zone_index()
+
+    def test_plain_zones(self):
+        """Zone names should resolve inside longer location strings"""
+        self.assertEqual(self.index.resolve("Near Back Gate", 12).tier, "high")
+        self.assertEqual(self.index.resolve("Chemistry Lab", 12).tier, "medium")
+        self.assertEqual(self.index.resolve("Library", 12).tier, "low")
+
+    def test_time_qualified_zones(self):
+        """Qualifiers should act as time windows, not literal text"""
+        match = self.index.resolve("Cricket Ground", 21)
+        self.assertEqual((match.zone, match.tier), ("Cricket Ground", "high"))
+        self.assertEqual(self.index.resolve("Cricket Ground", 14).tier, "low")
+        self.assertEqual(self.index.resolve("Hostel Corridors", 2).tier, "high")
+        self.assertEqual(self.index.resolve("Hostel Corridors", None).tier, "low")
+
+    def test_highest_tier_wins(self):
+        index = ZoneIndex(
+            {"high": ["Gate (Night)"], "medium": ["Main Gate"]},
+            day_start=6,
+            night_start=20
+        )
+        self.assertEqual(index.resolve("Main Gate", 23).tier, "high")
+        self.assertEqual(index.resolve("Main Gate", 10).tier, "medium")
+
+    def test_qualifier_parsing(self):
+        self.assertEqual(parse_qualifier("After 8 PM", 6, 20), TimeWindow(20, 6))
+        self.assertEqual(parse_qualifier("Day Time", 6, 20), TimeWindow(6, 20))
+        self.assertEqual(parse_qualifier("10 PM - 5 AM", 6, 20), TimeWindow(22, 5))
+        with self.assertRaises(ValueError):
+            parse_qualifier("Exam Season", 6, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
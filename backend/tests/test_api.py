@@ -0,0 +1,120 @@
+import time
+import unittest
+
+from backend.core.campus_router import DEFAULT_CAMPUS_ID
+from backend.core.coordinator import add_sink, remove_sink
+
+try:
+    from fastapi.testclient import TestClient
+
+    import api.app as api_app
+except ImportError:
+    api_app = None
+
+
+def _report(description, location="Central Library", panic=False):
+    return {
+        "incident_type": "Report",
+        "description": description,
+        "location": location,
+        "user_role": "Student",
+        "panic": panic,
+    }
+
+
+@unittest.skipUnless(api_app, "fastapi and httpx are not installed")
+class TestReportAdmission(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = {
+            name: getattr(api_app, name)
+            for name in (
+                "INCIDENT_DB_PATH", "NOTIFY_OUTBOX_PATH", "AUDIT_LOG_PATH",
+                "ADMIT_SOURCE_RATE", "ADMIT_SOURCE_BURST", "ADMIT_TRUSTED_SOURCES",
+            )
+        }
+        api_app.INCIDENT_DB_PATH = ""
+        api_app.NOTIFY_OUTBOX_PATH = ""
+        api_app.AUDIT_LOG_PATH = ""
+
+    def tearDown(self):
+        for name, value in self.saved.items():
+            setattr(api_app, name, value)
+
+    def test_shed_report_gets_429_and_retry_after(self):
+        api_app.ADMIT_SOURCE_RATE = 0.01
+        api_app.ADMIT_SOURCE_BURST = 2
+        with TestClient(api_app.app) as client:
+            for i in range(2):
+                response = client.post("/api/report-incident", json=_report(f"Noise {i}"))
+                self.assertEqual(response.status_code, 200)
+
+            response = client.post("/api/report-incident", json=_report("Noise 2"))
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response.json()["reason"], "source_limit")
+            self.assertGreaterEqual(int(response.headers["Retry-After"]), 1)
+
+            # Panic reports still get through
+            response = client.post("/api/report-incident", json=_report("Help", panic=True))
+            self.assertEqual(response.status_code, 200)
+
+    def test_gateway_batch_is_admitted_whole(self):
+        """A 50-item batch from one address is not cut down by the per-source limit"""
+        incidents = [_report(f"Noise in room {i}", f"Room {i}") for i in range(50)]
+        with TestClient(api_app.app) as client:
+            response = client.post(
+                "/api/report-incidents/batch",
+                json={"campus_id": DEFAULT_CAMPUS_ID, "incidents": incidents}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["failed"], 0)
+
+    def test_trusted_gateway_has_its_own_budget(self):
+        api_app.ADMIT_SOURCE_RATE = 0.01
+        api_app.ADMIT_SOURCE_BURST = 1
+        api_app.ADMIT_TRUSTED_SOURCES = "testclient=100/100"
+        with TestClient(api_app.app) as client:
+            for i in range(5):
+                response = client.post("/api/report-incident", json=_report(f"Noise {i}"))
+                self.assertEqual(response.status_code, 200)
+
+
+@unittest.skipUnless(api_app, "fastapi and httpx are not installed")
+class TestReportStream(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = {
+            name: getattr(api_app, name)
+            for name in ("INCIDENT_DB_PATH", "NOTIFY_OUTBOX_PATH", "AUDIT_LOG_PATH")
+        }
+        for name in self.saved:
+            setattr(api_app, name, "")
+        self.records = []
+        add_sink(self.records.append)
+
+    def tearDown(self):
+        remove_sink(self.records.append)
+        for name, value in self.saved.items():
+            setattr(api_app, name, value)
+
+    def test_dropped_stream_still_processes_the_report(self):
+        """A client that disconnects after the intake event does not stop its report"""
+        with TestClient(api_app.app) as client:
+            with client.stream(
+                "POST", "/api/report-incident/stream", json=_report("Help, fire!", "Chemistry Lab", panic=True)
+            ) as response:
+                self.assertEqual(response.status_code, 200)
+                for line in response.iter_lines():
+                    if line == "event: intake":
+                        break
+
+            deadline = time.monotonic() + 5
+            while not self.records and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertEqual(len(self.records), 1)
+        self.assertEqual(self.records[0].risk.risk_level, "High")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+from backend.core.audit_log import GENESIS, AuditLog, explain_entry, verify_log
+from backend.core.coordinator import CoordinatorAgent
+from backend.verify_audit import main as verify_main
+
+
+class TestAuditLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "audit.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, count):
+        log = AuditLog(self.path, fsync=False)
+        for i in range(count):
+            log.append({"incident_id": f"INC_{i}", "risk_level": "Low"})
+        head = log.head()
+        log.close()
+        return head
+
+    def _lines(self):
+        with open(self.path, "rb") as f:
+            return f.readlines()
+
+    def test_records_pipeline_decisions(self):
+        """Every audited decision lands in the log; its explanation is rendered on read"""
+        log = AuditLog(self.path)
+        coordinator = CoordinatorAgent()
+        coordinator.sinks.append(log.record)
+        try:
+            audit = coordinator.process_incident({
+                "source": "Security",
+                "description": "Fire in chemistry lab",
+                "location": "Chemistry Lab",
+            })
+            coordinator.process_incident({
+                "source": "Student",
+                "description": "Bike missing",
+                "location": "Student Parking",
+            })
+        finally:
+            log.close()
+        head = log.head()
+
+        first = json.loads(self._lines()[0])
+        self.assertEqual(first["prev"], GENESIS)
+        self.assertEqual(first["entry"]["risk_level"], audit.risk_level)
+        self.assertEqual(first["entry"]["escalation_chain"], audit.escalation_chain)
+        self.assertNotIn("explanation", first["entry"])
+        self.assertEqual(explain_entry(first["entry"]), audit.explain())
+
+        result = verify_log(self.path, expected_head=head["hash"])
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["entries"], 2)
+
+    def test_concurrent_appends_share_fsyncs(self):
+        """Concurrent writers are group-committed and keep one unbroken chain"""
+        log = AuditLog(self.path)
+        seqs = []
+
+        def writer(name):
+            for i in range(50):
+                seqs.append(log.append({"writer": name, "i": i}))
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = log.stats()
+        log.close()
+
+        self.assertEqual(sorted(seqs), list(range(1, 401)))
+        self.assertEqual(stats["entries"], 400)
+        self.assertLess(stats["batches"], 400)
+        self.assertTrue(verify_log(self.path)["ok"])
+
+    def test_full_queue_blocks_appends(self):
+        """At most max_pending entries wait in memory; further appends wait for room"""
+        log = AuditLog(self.path, max_batch=1, max_pending=2)
+        for i in range(50):
+            log.append({"i": i}, wait=False)
+            self.assertLessEqual(log.stats()["pending"], 2)
+        log.close()
+
+        self.assertGreater(log.stats()["throttled"], 0)
+        self.assertEqual(verify_log(self.path)["entries"], 50)
+
+    def test_processes_sharing_a_file_keep_one_chain(self):
+        """Two writers on one file (as two workers would be) interleave without forking the chain"""
+        logs = [AuditLog(self.path, fsync=False), AuditLog(self.path, fsync=False)]
+        # Each picks up where the other left off
+        self.assertEqual(logs[0].append({"writer": 0}), 1)
+        self.assertEqual(logs[1].append({"writer": 1}), 2)
+        self.assertEqual(logs[0].append({"writer": 0}), 3)
+        seqs = [1, 2, 3]
+
+        def writer(log, name):
+            for i in range(100):
+                seqs.append(log.append({"writer": name, "i": i}))
+
+        threads = [threading.Thread(target=writer, args=(log, n)) for n, log in enumerate(logs)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for log in logs:
+            log.close()
+
+        self.assertEqual(sorted(seqs), list(range(1, 204)))
+        result = verify_log(self.path)
+        self.assertTrue(result["ok"], result)
+        self.assertEqual(result["entries"], 203)
+
+    def test_reports_first_broken_link(self):
+        """Edits, deletions and truncation are each caught at the right line"""
+        head = self._write(10)
+        original = self._lines()
+
+        edited = list(original)
+        edited[3] = edited[3].replace(b'"Low"', b'"High"')
+        with open(self.path, "wb") as f:
+            f.writelines(edited)
+        result = verify_log(self.path)
+        self.assertFalse(result["ok"])
+        self.assertEqual((result["line"], result["entries"]), (4, 3))
+        self.assertEqual(result["error"], "hash does not match the entry")
+        self.assertEqual(result["offset"], sum(len(line) for line in original[:3]))
+
+        with open(self.path, "wb") as f:
+            f.writelines(original[:5] + original[6:])
+        result = verify_log(self.path)
+        self.assertEqual(result["line"], 6)
+        self.assertIn("expected seq 6", result["error"])
+
+        with open(self.path, "wb") as f:
+            f.writelines(original[:8])
+        self.assertTrue(verify_log(self.path)["ok"])
+        result = verify_log(self.path, expected_head=head["hash"])
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["line"], 9)
+
+    def test_torn_tail_is_cut_on_reopen(self):
+        """A partial line left by a crash is dropped and the chain continues"""
+        self._write(3)
+        with open(self.path, "ab") as f:
+            f.write(b'{"seq":4,"prev":"')
+        self.assertEqual(verify_log(self.path)["error"], "incomplete last line")
+
+        head = self._write(2)
+        self.assertEqual(head["seq"], 5)
+        self.assertTrue(verify_log(self.path, expected_head=head["hash"])["ok"])
+
+    def test_cli_exit_status(self):
+        self._write(3)
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+            self.assertEqual(verify_main([self.path]), 0)
+            with open(self.path, "ab") as f:
+                f.write(b"not json\n")
+            self.assertEqual(verify_main([self.path]), 1)
+            self.assertEqual(verify_main([os.path.join(self.tmpdir, "missing.log")]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from backend.benchmarks.synthetic import SyntheticIncidentGenerator
+from backend.core.coordinator import CoordinatorAgent
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestBatchScoring(unittest.TestCase):
+
+    def setUp(self):
+        from backend.core.batch_scoring import BatchRiskScorer
+
+        self.coordinator = CoordinatorAgent(campus_config_path="config/gla_university.json")
+        self.scorer = BatchRiskScorer(self.coordinator.zone_index, self.coordinator.keyword_matcher)
+
+    def _scalar(self, incidents):
+        config = self.coordinator.campus_config
+        return [
+            self.coordinator.risk_agent.evaluate_risk(
+                incident, config,
+                matcher=self.coordinator.keyword_matcher,
+                zone_index=self.coordinator.zone_index
+            )
+            for incident in incidents
+        ]
+
+    def test_parity_with_scalar_agent(self):
+        """Vectorized scores, levels and tiers match evaluate_risk exactly"""
+        config = self.coordinator.campus_config
+        payloads = SyntheticIncidentGenerator(config, seed=11).generate(3000)
+        payloads.append({"source": "Student", "description": "Noise", "location": "Back Gate",
+                         "timestamp": "not a time"})
+        intakes = [
+            self.coordinator.intake_agent.handle_incident(
+                payload, campus_config=config, matcher=self.coordinator.keyword_matcher
+            )
+            for payload in payloads
+        ]
+        expected = self._scalar(intakes)
+
+        batch = self.scorer.score_incidents(intakes)
+
+        self.assertEqual(batch.scores.tolist(), [r.risk_score for r in expected])
+        self.assertEqual(batch.risk_levels(), [r.risk_level for r in expected])
+        self.assertEqual(batch.tiers(), [r.zone_tier for r in expected])
+        self.assertEqual(sum(batch.level_counts().values()), len(payloads))
+
+    def test_encode_from_columns(self):
+        """Raw columns work too; descriptions are scanned for critical flags"""
+        columns = self.scorer.encode(
+            locations=["Back Gate", "Central Library", "Back Gate"],
+            timestamps=["2026-10-18T23:00:00", "2026-10-18T11:00:00", None],
+            confidence_levels=["High", "Low", "Medium"],
+            descriptions=["Someone is following me", "Noise complaint", "Loitering"],
+            activity_boost=[0, 0, 2]
+        )
+        batch = self.scorer.score(columns)
+
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(batch.risk_levels()[0], "High")
+        self.assertEqual(batch.risk_levels()[1], "Low")
+        # high tier (3) + medium confidence (1) + boost (2), no usable hour
+        self.assertEqual(batch.scores.tolist()[2], 6)
+
+        with self.assertRaises(ValueError):
+            self.scorer.encode(["Library"], [None], ["Low"])
+
+
+if __name__ == "__main__":
+    unittest.main()
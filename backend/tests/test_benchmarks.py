@@ -0,0 +1,95 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.benchmarks.load import check_thresholds, parse_mix, run_load
+from backend.benchmarks.run import run_benchmarks
+from backend.benchmarks.startup import measure_entry_point
+from backend.benchmarks.synthetic import SyntheticIncidentGenerator
+from backend.core.config_loader import CampusConfigLoader
+
+
+class _StandInApi(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        # The batch endpoint fails, so errors show up per endpoint
+        status = 500 if self.path.endswith("/batch") else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def setUp(self):
+        self.config = CampusConfigLoader("config/gla_university.json").get_full_config()
+
+    def test_generator_is_seeded(self):
+        first = SyntheticIncidentGenerator(self.config, seed=3).generate(50)
+        second = SyntheticIncidentGenerator(self.config, seed=3).generate(50)
+        other = SyntheticIncidentGenerator(self.config, seed=4).generate(50)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_generator_uses_campus_zones(self):
+        generator = SyntheticIncidentGenerator(self.config, seed=1)
+        for payload in generator.generate(100):
+            self.assertIn(payload["location"], generator.locations)
+        self.assertIn("Cricket Ground", generator.locations)
+        self.assertNotIn("Cricket Ground (After 8 PM)", generator.locations)
+
+    def test_harness_smoke(self):
+        results = run_benchmarks(count=20, batch_size=10, config_loads=2)
+        self.assertIn("pipeline.process_incident", results)
+        self.assertGreater(results["agent.risk"]["ops_per_sec"], 0)
+
+    def test_startup_report_smoke(self):
+        samples = measure_entry_point("backend", runs=1)
+        self.assertEqual(len(samples["first_request"]), 1)
+        self.assertGreater(samples["process"][0], samples["import"][0])
+        self.assertIsNone(measure_entry_point("backend.no_such_module", runs=1))
+
+    def test_load_harness_smoke(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInApi)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            results, statuses = run_load(
+                f"http://127.0.0.1:{server.server_address[1]}",
+                self.config,
+                concurrency=4,
+                duration=None,
+                total=200,
+                mix=parse_mix("report=3,batch=1"),
+                batch_size=5
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(results["load.all"]["samples"], 200)
+        self.assertEqual(results["load.report"]["error_rate"], 0.0)
+        self.assertEqual(results["load.batch"]["error_rate"], 1.0)
+        self.assertEqual(sum(statuses.values()), 200)
+        self.assertGreaterEqual(results["load.all"]["p99_us"], results["load.all"]["p50_us"])
+
+        violations = check_thresholds(results, {
+            "report": {"max_error_rate": 0.01, "max_p99_ms": 10000},
+            "batch": {"max_error_rate": 0.01},
+            "all": {"min_rps": 10 ** 9},
+        })
+        self.assertEqual(len(violations), 2)
+        self.assertTrue(violations[0].startswith("batch: max_error_rate"))
+        with self.assertRaises(ValueError):
+            parse_mix("report=1,upload=1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from backend.core.campus_router import (
+    CampusDirectory,
+    CampusRouter,
+    UnknownCampusError,
+    shard_for,
+)
+from backend.core.config_loader import resolve_config_path
+from backend.core.ingestion import PRIORITY_CRITICAL
+from backend.core.metrics import METRICS, TIME_TO_ESCALATION
+from backend.core.coordinator import (
+    add_escalation_sink,
+    add_sink,
+    build_payload,
+    get_registry,
+    remove_escalation_sink,
+    remove_sink,
+)
+
+
+class TestCampusRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+        for name in ("gla_university.json", "demo_university.json"):
+            shutil.copy(resolve_config_path(os.path.join("config", name)), self.config_dir)
+        open(os.path.join(self.config_dir, "empty_campus.json"), "w").close()
+        self.directory = CampusDirectory(self.config_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.config_dir)
+
+    def test_directory_maps_file_stems(self):
+        self.assertEqual(self.directory.campus_ids(), ["demo_university", "gla_university"])
+        with self.assertRaises(UnknownCampusError):
+            self.directory.config_path("empty_campus")
+
+    def test_shard_assignment_is_stable(self):
+        for campus_id in ("gla_university", "demo_university"):
+            shard = shard_for(campus_id, 4)
+            self.assertIn(shard, range(4))
+            self.assertEqual(shard, shard_for(campus_id, 4))
+
+    def test_routes_by_campus(self):
+        router = CampusRouter(self.directory, workers=1)
+        try:
+            payload = build_payload("Medical emergency, student fainted", "Cafeteria", "Student")
+            demo = router.submit("demo_university", payload).result(timeout=5)
+            gla = router.submit("gla_university", dict(payload)).result(timeout=5)
+
+            self.assertEqual(demo["campus"], "Demo University")
+            self.assertEqual(gla["campus"], "GLA University")
+            # Each campus escalates through its own policy
+            self.assertIn("Medical Room", demo["final"].escalation_chain)
+            self.assertIn("University Health Center", gla["final"].escalation_chain)
+
+            campuses = {c["campus_id"]: c for c in router.campuses()}
+            self.assertGreater(campuses["gla_university"]["memory_bytes"], 0)
+            self.assertGreater(
+                campuses["gla_university"]["memory_bytes"],
+                campuses["demo_university"]["memory_bytes"]
+            )
+        finally:
+            router.shutdown()
+
+    def test_abandoned_stream_still_finishes(self):
+        """A client that stops reading after intake does not stop its report"""
+        records, escalations = [], []
+        add_sink(records.append)
+        add_escalation_sink(escalations.append)
+        router = CampusRouter(self.directory, workers=1)
+        try:
+            payload = build_payload("Help, fire!", "Chemistry Lab", "Student", panic=True)
+            stages = router.stream("demo_university", payload)
+            self.assertEqual([next(stages)[0], next(stages)[0]], ["campus", "intake"])
+            stages.close()
+
+            deadline = time.monotonic() + 5
+            while not records and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(len(escalations), 1)
+            self.assertEqual(len(records), 1)
+        finally:
+            router.shutdown()
+            remove_sink(records.append)
+            remove_escalation_sink(escalations.append)
+
+    def test_sharded_records_reach_parent_sinks(self):
+        records, escalations = [], []
+        add_sink(records.append)
+        add_escalation_sink(escalations.append)
+        router = CampusRouter(self.directory, shards=1, workers=1)
+        escalated = TIME_TO_ESCALATION.count("High")
+        try:
+            payload = build_payload("Fire in the lab", "Chemistry Lab", "Student")
+            result = router.submit("demo_university", payload).result(timeout=60)
+
+            self.assertEqual(result["final"].risk_level, "High")
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0].intake.location, "Chemistry Lab")
+            # Escalations are forwarded as the shard plans them
+            deadline = time.monotonic() + 5
+            while not escalations and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(escalations[0].intake.incident_id, records[0].intake.incident_id)
+            # ...and so are the shard's metrics
+            if METRICS.enabled:
+                while TIME_TO_ESCALATION.count("High") == escalated and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertEqual(TIME_TO_ESCALATION.count("High"), escalated + 1)
+
+            # Streams and batches run in the shard too
+            stages = [stage for stage, _ in router.stream("demo_university", dict(payload))]
+            self.assertEqual(stages, ["campus", "intake", "risk", "response", "audit"])
+            info, items = router.process_batch("demo_university", [dict(payload)] * 2)
+            self.assertEqual(info["campus"], "Demo University")
+            self.assertTrue(all(item.ok for item in items))
+            self.assertEqual(len(records), 4)
+
+            # Classification never queues behind the shard's work
+            busy = router._shard("demo_university").submit(time.sleep, 1.0)
+            started = time.monotonic()
+            priority, _ = router.classify("demo_university", [dict(payload)])[0]
+            self.assertLess(time.monotonic() - started, 0.5)
+            self.assertEqual(priority, PRIORITY_CRITICAL)
+            busy.result()
+
+            # The campus state lives only in its shard: one correlator
+            # saw every report, and the parent never loaded the campus
+            self.assertIsNotNone(items[1].result.duplicate_of)
+            config_path = self.directory.config_path("demo_university")
+            self.assertIsNone(get_registry().get_entry(config_path))
+            self.assertEqual(router.campus_config("demo_university")["campus"]["name"], "Demo University")
+            self.assertIsNone(get_registry().get_entry(config_path))
+        finally:
+            router.shutdown()
+            remove_sink(records.append)
+            remove_escalation_sink(escalations.append)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from backend.core.config_loader import CampusConfigLoader, resolve_config_path
+from backend.core.config_schema import ConfigValidationError, validate_config
+
+
+class TestConfigValidation(unittest.TestCase):
+
+    def setUp(self):
+        with open(resolve_config_path("config/gla_university.json")) as f:
+            self.config = json.load(f)
+
+    def test_reports_every_error_at_load(self):
+        self.config["campus"]["operating_hours"]["night_start"] = "8pm"
+        self.config["incident_policies"]["fire"] = "Campus Security"
+        self.config["privacy_rules"]["anonymous_reporting"] = "yes"
+
+        with self.assertRaises(ConfigValidationError) as ctx:
+            validate_config(self.config)
+
+        errors = "\n".join(ctx.exception.errors)
+        self.assertEqual(len(ctx.exception.errors), 3)
+        self.assertIn("campus.operating_hours.night_start", errors)
+        self.assertIn("incident_policies.fire", errors)
+        self.assertIn("privacy_rules.anonymous_reporting", errors)
+
+    def test_rejects_unknown_zone_qualifier(self):
+        self.config["risk_zones"]["high"].append("Rooftop (Whenever)")
+        with self.assertRaisesRegex(ConfigValidationError, "Whenever"):
+            validate_config(self.config)
+
+    def test_cross_checks_are_warnings(self):
+        warnings = validate_config(self.config)
+        self.assertEqual(len(warnings), 3)
+        self.assertTrue(any("Faculty Rooms" in w for w in warnings))
+
+        del self.config["incident_policies"]["theft"]
+        warnings = validate_config(self.config)
+        self.assertTrue(any("incident_policies.theft" in w for w in warnings))
+
+
+class TestConfigSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "campus.json")
+        shutil.copy(resolve_config_path("config/gla_university.json"), self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_snapshot_round_trip(self):
+        first = CampusConfigLoader(self.path)
+        second = CampusConfigLoader(self.path)
+
+        self.assertFalse(first.from_snapshot)
+        self.assertTrue(second.from_snapshot)
+        self.assertEqual(second.get_config_version(), first.get_config_version())
+        self.assertEqual(second.get_full_config(), first.get_full_config())
+        self.assertEqual(second.get_validation_warnings(), first.get_validation_warnings())
+        self.assertEqual(
+            second.get_zone_index().resolve("Back Gate", 12),
+            first.get_zone_index().resolve("Back Gate", 12)
+        )
+        self.assertTrue(second.get_keyword_matcher().extract("smoke everywhere").critical)
+
+    def test_changed_file_invalidates_snapshot(self):
+        first = CampusConfigLoader(self.path)
+        with open(self.path) as f:
+            config = json.load(f)
+        config["campus"]["name"] = "Renamed University"
+        with open(self.path, "w") as f:
+            json.dump(config, f)
+
+        reloaded = CampusConfigLoader(self.path)
+        self.assertFalse(reloaded.from_snapshot)
+        self.assertEqual(reloaded.get_campus_name(), "Renamed University")
+        self.assertNotEqual(reloaded.get_config_version(), first.get_config_version())
+
+    def test_snapshot_from_other_code_is_ignored(self):
+        """A snapshot written before a schema or matcher change is rebuilt"""
+        first = CampusConfigLoader(self.path)
+        with open(first.snapshot_path(), "rb") as f:
+            snapshot = pickle.load(f)
+        snapshot["code"] = "older release"
+        with open(first.snapshot_path(), "wb") as f:
+            pickle.dump(snapshot, f)
+
+        self.assertFalse(CampusConfigLoader(self.path).from_snapshot)
+        self.assertTrue(CampusConfigLoader(self.path).from_snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
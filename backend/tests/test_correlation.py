@@ -0,0 +1,146 @@
+import unittest
+from datetime import datetime, timedelta
+
+from backend.agents.intake_agent import IncidentResult
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.correlation import IncidentCorrelator
+
+BASE_TIME = datetime(2026, 3, 2, 21, 0, 0)
+
+
+def _incident(incident_id, description, location, incident_type, minutes=0):
+    return IncidentResult(
+        incident_id=incident_id,
+        timestamp=(BASE_TIME + timedelta(minutes=minutes)).isoformat(),
+        location=location,
+        incident_type=incident_type,
+        source="Student",
+        description=description,
+        confidence_level="Low",
+        anonymous=False,
+        raw_payload={}
+    )
+
+
+class TestIncidentCorrelator(unittest.TestCase):
+
+    def setUp(self):
+        self.correlator = IncidentCorrelator(window_seconds=300)
+
+    def test_storm_collapses_onto_first_report(self):
+        """Same place, same type, inside the window -> one open incident"""
+        first = _incident("INC_1", "Fire in the chemistry lab", "Chemistry Lab", "Fire")
+        second = _incident("INC_2", "Lots of smoke near chem lab", "Chemistry Lab", "Fire", 1)
+
+        self.assertIsNone(self.correlator.observe(first))
+        match = self.correlator.observe(second)
+
+        self.assertEqual(match.primary_id, "INC_1")
+        self.assertEqual(match.report_count, 2)
+
+    def test_location_and_window_are_respected(self):
+        self.correlator.observe(_incident("INC_1", "Fire", "Chemistry Lab", "Fire"))
+
+        other_place = _incident("INC_2", "Fire", "Physics Lab", "Fire", 1)
+        self.assertIsNone(self.correlator.observe(other_place))
+
+        too_late = _incident("INC_3", "Fire", "Chemistry Lab", "Fire", 10)
+        self.assertIsNone(self.correlator.observe(too_late))
+        # Both earlier incidents aged out of the window
+        self.assertEqual(self.correlator.open_count(), 1)
+
+    def test_general_incidents_need_similar_text(self):
+        """Untyped reports only merge on description similarity"""
+        self.correlator.observe(_incident(
+            "INC_1", "Loud music and shouting from room 204", "Boys Hostel A", "General Incident"
+        ))
+
+        unrelated = _incident(
+            "INC_2", "Water cooler is leaking", "Boys Hostel A", "General Incident", 1
+        )
+        self.assertIsNone(self.correlator.observe(unrelated))
+
+        repeat = _incident(
+            "INC_3", "loud music and shouting from room 204 again", "Boys Hostel A",
+            "General Incident", 2
+        )
+        self.assertEqual(self.correlator.observe(repeat).primary_id, "INC_1")
+
+    def test_only_storm_types_match_on_type(self):
+        """Separate thefts at one busy place stay separate incidents"""
+        self.correlator.observe(_incident("INC_1", "My laptop was stolen", "Central Library", "Theft"))
+
+        other = _incident("INC_2", "Someone took my bicycle from the rack", "Central Library", "Theft", 1)
+        self.assertIsNone(self.correlator.observe(other))
+
+        repeat = _incident("INC_3", "my laptop was stolen from my desk", "Central Library", "Theft", 2)
+        self.assertEqual(self.correlator.observe(repeat).primary_id, "INC_1")
+
+    def test_incident_closes_after_max_age(self):
+        """A steady stream of reports cannot keep one incident open forever"""
+        correlator = IncidentCorrelator(window_seconds=300, max_age_seconds=600)
+        correlator.observe(_incident("INC_0", "Fire", "Chemistry Lab", "Fire"))
+        for minute in (4, 8):
+            match = correlator.observe(_incident(f"INC_{minute}", "Fire", "Chemistry Lab", "Fire", minute))
+            self.assertEqual(match.primary_id, "INC_0")
+
+        late = _incident("INC_12", "Fire", "Chemistry Lab", "Fire", 12)
+        self.assertIsNone(correlator.observe(late))
+
+    def test_memory_is_bounded(self):
+        correlator = IncidentCorrelator(max_open=3)
+        for i in range(10):
+            correlator.observe(_incident(f"INC_{i}", "Fire", f"Zone {i}", "Fire"))
+        self.assertEqual(correlator.open_count(), 3)
+
+    def test_pipeline_does_not_re_escalate(self):
+        coordinator = CoordinatorAgent(
+            campus_config_path="config/gla_university.json",
+            correlator=IncidentCorrelator()
+        )
+        payload = {"source": "Student", "description": "Fire!", "location": "Chemistry Lab"}
+
+        first = coordinator.process_incident(payload)
+        second = coordinator.process_incident(payload)
+
+        self.assertIsNone(first.duplicate_of)
+        self.assertIsNotNone(second.duplicate_of)
+        self.assertIn("Linked to open incident", second.final_decision)
+
+    def test_riskier_report_is_escalated(self):
+        """A High report is never swallowed by an earlier Low one at the same place"""
+        coordinator = CoordinatorAgent(
+            campus_config_path="config/gla_university.json",
+            correlator=IncidentCorrelator()
+        )
+
+        def report(description):
+            return coordinator.process_incident({
+                "source": "Student", "description": description, "location": "Chemistry Lab"
+            })
+
+        leak = report("lab sink is leaking a bit")
+        spill = report("chemical spill, a student is unconscious and bleeding")
+        again = report("chemical spill near the sink, student unconscious")
+        trickle = report("lab sink still leaking a bit")
+
+        self.assertEqual((leak.risk_level, spill.risk_level), ("Low", "High"))
+        self.assertIsNone(spill.duplicate_of)
+        self.assertIn("raises open incident", spill.final_decision)
+        self.assertIn("from Low to High", spill.final_decision)
+        # The incident now escalated at High, so later reports attach
+        self.assertIsNotNone(again.duplicate_of)
+        self.assertIsNotNone(trickle.duplicate_of)
+
+    def test_out_of_order_reports_use_event_time(self):
+        self.correlator.observe(_incident("INC_1", "Fire", "Chemistry Lab", "Fire", 30))
+
+        replayed = _incident("INC_2", "Fire", "Chemistry Lab", "Fire", 0)
+        self.assertIsNone(self.correlator.observe(replayed))
+
+        close = _incident("INC_3", "Fire", "Chemistry Lab", "Fire", 33)
+        self.assertEqual(self.correlator.observe(close).primary_id, "INC_1")
+
+
+if __name__ == "__main__":
+    unittest.main()
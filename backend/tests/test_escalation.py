@@ -0,0 +1,289 @@
+import asyncio
+import json
+import os
+import shutil
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.core.config_loader import resolve_config_path
+from backend.core.config_schema import ConfigValidationError, validate_config
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.escalation import EscalationDispatcher, EscalationOutbox
+from backend.core.transports import SmtpTransport
+
+FIRE = {
+    "source": "Security",
+    "description": "Fire in chemistry lab",
+    "location": "Chemistry Lab",
+    "campus_id": "test_campus",
+}
+
+
+class StandInGateway(ThreadingHTTPServer):
+    """
+    Local webhook / SMS gateway: records JSON posts, can fail the first
+    requests or answer slowly, and counts TCP connections.
+    """
+    daemon_threads = True
+
+    def __init__(self, fail_first=0, status=503, delay=0.0):
+        self.received = []
+        self.connections = 0
+        self.fail_first = fail_first
+        self.status = status
+        self.delay = delay
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), _GatewayHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            failing = self.server.fail_first > 0
+            if failing:
+                self.server.fail_first -= 1
+            else:
+                self.server.received.append((self.path, json.loads(body)))
+        reply = b"fail" if failing else b"ok"
+        self.send_response(self.server.status if failing else 200)
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInSmtp(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        self.server.connections += 1
+        self._reply("220 stand-in ready")
+        while True:
+            line = self.rfile.readline().decode("ascii", "replace").strip()
+            verb = line.split(" ", 1)[0].upper()
+            if not line or verb == "QUIT":
+                self._reply("221 bye")
+                return
+            if verb == "DATA":
+                self._reply("354 go ahead")
+                data = []
+                while True:
+                    chunk = self.rfile.readline().decode("utf-8", "replace")
+                    if chunk.rstrip("\r\n") == ".":
+                        break
+                    data.append(chunk)
+                self.server.messages.append("".join(data))
+                self._reply("250 queued")
+            elif verb == "EHLO":
+                self._reply("250 stand-in")
+            else:
+                self._reply("250 ok")
+
+    def _reply(self, text):
+        self.wfile.write((text + "\r\n").encode("ascii"))
+
+
+class TestEscalationDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.gateway = StandInGateway(fail_first=2)
+        self.config_path = self._write_config(self.gateway.url)
+        self.outbox_path = os.path.join(self.tmpdir, "outbox.db")
+        self.dispatchers = []
+
+    def tearDown(self):
+        for dispatcher in self.dispatchers:
+            dispatcher.close()
+            dispatcher.outbox.close()
+        self.gateway.shutdown()
+        shutil.rmtree(self.tmpdir)
+
+    def _write_config(self, url, path="test_campus.json"):
+        with open(resolve_config_path("config/gla_university.json"), encoding="utf-8") as f:
+            config = json.load(f)
+        config["notifications"] = {
+            "transports": {
+                "desk": {"type": "webhook", "url": f"{url}/escalations"},
+                "sms": {"type": "sms", "url": f"{url}/sms", "sender": "CAMPUS"},
+            },
+            "routes": {
+                "*": ["desk"],
+                "Fire Safety Officer": ["sms", "desk"],
+            },
+        }
+        full_path = os.path.join(self.tmpdir, path)
+        with open(full_path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        return full_path
+
+    def _dispatcher(self, coordinator, start=True, **kwargs):
+        options = {"backoff": 0.01, "poll_interval": 0.05, **kwargs}
+        dispatcher = EscalationDispatcher(
+            EscalationOutbox(self.outbox_path),
+            config_for=lambda campus_id: coordinator.campus_config,
+            **options
+        )
+        if start:
+            dispatcher.start()
+        self.dispatchers.append(dispatcher)
+        return dispatcher
+
+    def _wait_for(self, dispatcher, status, count, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if dispatcher.outbox.counts().get(status, 0) >= count:
+                return
+            time.sleep(0.01)
+        self.fail(f"Timed out waiting for {count} {status}: {dispatcher.stats()}")
+
+    def test_fans_out_with_retries_over_pooled_connections(self):
+        """Every authority is notified; 503s are retried on kept-alive connections"""
+        coordinator = CoordinatorAgent(campus_config_path=self.config_path)
+        dispatcher = self._dispatcher(coordinator, concurrency=2)
+        coordinator.escalation_sinks.append(dispatcher.record)
+
+        audit = coordinator.process_incident(FIRE)
+        # desk for each authority, plus SMS for the fire safety officer
+        expected = len(audit.escalation_chain) + 1
+        self._wait_for(dispatcher, "sent", expected)
+
+        paths = sorted(path for path, _ in self.gateway.received)
+        self.assertEqual(paths.count("/escalations"), len(audit.escalation_chain))
+        sms = [body for path, body in self.gateway.received if path == "/sms"]
+        self.assertEqual(sms[0]["to"], coordinator.campus_config["emergency_contacts"]["fire_safety_officer"])
+        self.assertIn("Fire Safety Officer", sms[0]["message"])
+        # 6 requests (2 failed), at most 2 in flight: connections are reused
+        self.assertLessEqual(self.gateway.connections, 4)
+        retried = [e for e in dispatcher.outbox.entries("sent") if e["attempts"] > 1]
+        self.assertTrue(retried)
+
+    def test_report_latency_ignores_slow_gateway(self):
+        """Reports return while a slow gateway is still being called"""
+        self.gateway.fail_first = 0
+        self.gateway.delay = 0.5
+        coordinator = CoordinatorAgent(campus_config_path=self.config_path)
+        dispatcher = self._dispatcher(coordinator)
+        coordinator.escalation_sinks.append(dispatcher.record)
+
+        started = time.perf_counter()
+        coordinator.process_incident(FIRE)
+        self.assertLess(time.perf_counter() - started, 0.25)
+        self._wait_for(dispatcher, "sent", 1)
+
+    def test_permanent_failures_and_duplicates(self):
+        """4xx answers are not retried; reports linked to an open incident send nothing"""
+        self.gateway.fail_first = 100
+        self.gateway.status = 404
+        coordinator = CoordinatorAgent(campus_config_path=self.config_path)
+        dispatcher = self._dispatcher(coordinator)
+
+        records = []
+        coordinator.sinks.append(records.append)
+        coordinator.process_incident(FIRE)
+        record = records[-1]
+        dispatcher.record(record)
+        self._wait_for(dispatcher, "failed", len(record.response.escalation_chain) + 1)
+        self.assertTrue(all(e["attempts"] == 1 for e in dispatcher.outbox.entries("failed")))
+
+        before = sum(dispatcher.outbox.counts().values())
+        duplicate = type(record)(
+            record.intake, record.risk,
+            type(record.response)(**{**record.response.__dict__, "duplicate_of": "INC_1"}),
+            record.audit
+        )
+        dispatcher.record(duplicate)
+        self.assertEqual(sum(dispatcher.outbox.counts().values()), before)
+
+    def test_outbox_survives_restart(self):
+        """Queued and interrupted notifications are sent after a restart"""
+        self.gateway.fail_first = 0
+        coordinator = CoordinatorAgent(campus_config_path=self.config_path)
+        stopped = self._dispatcher(coordinator, start=False)
+        coordinator.sinks.append(stopped.record)
+        coordinator.process_incident(FIRE)
+
+        # Simulate a crash mid-send on one row
+        claimed = stopped.outbox.claim(time.time(), 1)
+        self.assertEqual(len(claimed), 1)
+        pending = stopped.outbox.counts()
+        stopped.outbox.close()
+        self.dispatchers.remove(stopped)
+
+        restarted = self._dispatcher(coordinator)
+        total = pending["pending"] + pending["sending"]
+        self._wait_for(restarted, "sent", total)
+        self.assertEqual(len(self.gateway.received), total)
+
+    def test_notifications_config_is_validated(self):
+        """Bad transport types and unknown route targets fail at load"""
+        with open(self.config_path, encoding="utf-8") as f:
+            config = json.load(f)
+        config["notifications"]["transports"]["pager"] = {"type": "carrier-pigeon"}
+        config["notifications"]["routes"]["Campus Security"] = ["fax"]
+
+        with self.assertRaises(ConfigValidationError) as caught:
+            validate_config(config)
+        self.assertEqual(len(caught.exception.errors), 2)
+
+
+class TestSmtpTransport(unittest.TestCase):
+
+    def test_sessions_are_pooled(self):
+        """Several e-mails go out over one SMTP session"""
+        server = StandInSmtp()
+        transport = SmtpTransport("127.0.0.1", server.server_address[1], sender="safety@campus.test")
+        notification = {
+            "notification_id": "INC_1:1:mail", "incident_id": "INC_1", "authority": "Counseling Cell",
+            "step": 1, "recipient": "cell@campus.test", "risk_level": "Medium",
+            "incident_type": "Cyberbullying", "location": "Library",
+        }
+
+        async def send_all():
+            for _ in range(3):
+                await transport.send(notification)
+            await transport.close()
+
+        try:
+            asyncio.run(send_all())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(len(server.messages), 3)
+        self.assertEqual(server.connections, 1)
+        self.assertIn("cell@campus.test", server.messages[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from datetime import datetime, timezone
+
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.incident_stats import IncidentStats, RollingCounter
+
+BASE = 1_800_000_000.0
+
+
+class TestIncidentStats(unittest.TestCase):
+
+    def setUp(self):
+        self.now = BASE
+        self.stats = IncidentStats(clock=lambda: self.now)
+        self.coordinator = CoordinatorAgent(
+            campus_config_path="config/gla_university.json",
+            sinks=[self.stats.record]
+        )
+
+    def _report(self, description, location, at, source="Student"):
+        return self.coordinator.process_incident({
+            "source": source,
+            "description": description,
+            "location": location,
+            "campus_id": "gla_university",
+            "timestamp": datetime.fromtimestamp(at, timezone.utc).isoformat()
+        })
+
+    def test_rolling_counter_expires_old_buckets(self):
+        """Buckets outside the ring drop out without any sweeping"""
+        counter = RollingCounter(60, 3)
+        counter.add(BASE)
+        counter.add(BASE + 60)
+        counter.add(BASE + 60)
+
+        self.assertEqual(sum(counter.series(BASE + 60)), 3)
+        self.assertEqual(counter.series(BASE + 180), [2, 0, 0])
+        self.assertEqual(sum(counter.series(BASE + 300)), 0)
+
+        # Too old for the ring: ignored rather than overwriting newer data
+        counter.add(BASE + 300)
+        counter.add(BASE)
+        self.assertEqual(sum(counter.series(BASE + 300)), 1)
+
+    def test_hour_and_day_windows(self):
+        """Counts roll out of the hour window but stay in the day window"""
+        self._report("Fire in chemistry lab", "Chemistry Lab", BASE - 2 * 3600)
+        self._report("Phone stolen", "Central Library", BASE - 120)
+        self._report("Wallet stolen", "Central Library", BASE - 60)
+
+        hour = self.stats.snapshot("hour")
+        day = self.stats.snapshot("day")
+
+        self.assertEqual(hour["total"], 2)
+        self.assertEqual(len(hour["series"]), 60)
+        self.assertEqual(hour["by_incident_type"], {"Theft": 2})
+        self.assertEqual(day["total"], 3)
+        self.assertEqual(day["by_risk_level"].get("High"), 1)
+
+        self.now += 3600
+        self.assertEqual(self.stats.snapshot("hour")["total"], 0)
+
+    def test_filters_and_unknown_window(self):
+        """Snapshots filter on any key part; bad windows are rejected"""
+        self._report("Fire in chemistry lab", "Chemistry Lab", BASE)
+        self._report("Phone stolen", "Central Library", BASE)
+
+        theft = self.stats.snapshot("day", incident_type="Theft")
+        self.assertEqual(theft["total"], 1)
+        self.assertEqual(theft["rows"][0]["campus_id"], "gla_university")
+        self.assertEqual(self.stats.snapshot("day", campus_id="demo_university")["total"], 0)
+
+        with self.assertRaises(ValueError):
+            self.stats.snapshot("week")
+
+    def test_free_text_locations_are_sketched(self):
+        """Unindexed locations are estimated and ranked, never undercounted"""
+        for minute in range(5):
+            self._report("Bag stolen", "  Behind the OLD canteen ", BASE - minute * 60)
+        self._report("Bag stolen", "Bus Parking", BASE)
+
+        self.assertGreaterEqual(self.stats.location_count("behind the old canteen"), 5)
+        top = self.stats.snapshot("hour")["top_locations"]
+        self.assertEqual(top[0]["location"], "  Behind the OLD canteen ")
+        self.assertGreaterEqual(top[0]["count"], 5)
+
+    def test_key_space_is_capped(self):
+        """New keys past max_keys are counted as dropped"""
+        stats = IncidentStats(max_keys=1, clock=lambda: self.now)
+        self.coordinator.sinks.append(stats.record)
+        self._report("Fire in chemistry lab", "Chemistry Lab", BASE)
+        self._report("Phone stolen", "Central Library", BASE)
+        self._report("Fire in chemistry lab", "Chemistry Lab", BASE)
+
+        self.assertEqual(stats.dropped, 1)
+        self.assertEqual(stats.snapshot("hour")["total"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.incident_store import IncidentStore
+
+
+class TestIncidentStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = IncidentStore(os.path.join(self.tmpdir, "incidents.db"), batch_size=4)
+        self.coordinator = CoordinatorAgent(
+            campus_config_path="config/gla_university.json",
+            sinks=[self.store.record]
+        )
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def _report(self, description, location, source="Student"):
+        return self.coordinator.process_incident({
+            "source": source,
+            "description": description,
+            "location": location
+        })
+
+    def test_records_are_persisted(self):
+        """Pipeline results should land in the store via the sink"""
+        self._report("Fire in chemistry lab", "Chemistry Lab")
+        self._report("Noise complaint", "Central Library")
+        self.store.flush()
+
+        self.assertEqual(self.store.count(), 2)
+
+        page = self.store.query(risk_level="High")
+        self.assertEqual(len(page["items"]), 1)
+        self.assertEqual(page["items"][0]["location"], "Chemistry Lab")
+        self.assertIsInstance(page["items"][0]["escalation_chain"], list)
+
+    def test_keyset_pagination(self):
+        """Pages should walk newest-first without gaps or repeats"""
+        for _ in range(7):
+            self._report("Bike stolen", "Student Parking")
+        self.coordinator.process_batch([
+            {"source": "Staff", "description": "Bike stolen", "location": "Student Parking"}
+        ] * 3)
+        self.store.flush()
+
+        seen = []
+        cursor = None
+        while True:
+            page = self.store.query(location="Student Parking", limit=4, cursor=cursor)
+            seen.extend(item["incident_id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(len(seen), 10)
+        self.assertEqual(len(set(seen)), 10)
+
+    def test_campus_filter_and_migration(self):
+        """Older stores gain campus_id; records are kept apart by campus"""
+        path = os.path.join(self.tmpdir, "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE incidents (seq INTEGER PRIMARY KEY AUTOINCREMENT, incident_id TEXT NOT NULL, "
+            "timestamp TEXT NOT NULL, location TEXT NOT NULL, incident_type TEXT NOT NULL, source TEXT, "
+            "confidence_level TEXT, risk_score INTEGER, risk_level TEXT NOT NULL, zone TEXT, decision TEXT, "
+            "priority TEXT, escalation_chain TEXT, config_version TEXT)"
+        )
+        conn.close()
+
+        store = IncidentStore(path)
+        self.coordinator.sinks.append(store.record)
+        try:
+            for campus_id in ("gla_university", "demo_university", "demo_university"):
+                self.coordinator.process_incident({
+                    "source": "Student", "description": "Bike stolen",
+                    "location": "Student Parking", "campus_id": campus_id,
+                })
+            store.flush()
+            self.assertEqual(len(store.query(campus_id="demo_university")["items"]), 2)
+            self.assertEqual(store.query(campus_id="gla_university")["items"][0]["campus_id"], "gla_university")
+        finally:
+            store.close()
+
+    def test_bad_query_parameters_are_named(self):
+        self._report("Noise complaint", "Central Library")
+        self.store.flush()
+
+        page = self.store.query(since="2000-01-01T00:00:00Z", until="2999-01-01")
+        self.assertEqual(len(page["items"]), 1)
+
+        for kwargs, name in (
+            ({"since": "yesterday"}, "'since'"),
+            ({"until": "2024-13-01"}, "'until'"),
+            ({"cursor": "garbage"}, "cursor"),
+        ):
+            with self.assertRaises(ValueError) as caught:
+                self.store.query(**kwargs)
+            self.assertIn(name, str(caught.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
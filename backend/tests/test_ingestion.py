@@ -0,0 +1,86 @@
+import threading
+import unittest
+
+from backend.core.coordinator import CoordinatorAgent, build_payload
+from backend.core.ingestion import (
+    PRIORITY_CRITICAL,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    IngestionQueue,
+    QueueFullError,
+    classify_priority,
+)
+
+
+class TestIngestionQueue(unittest.TestCase):
+
+    def test_classify_priority(self):
+        coordinator = CoordinatorAgent("config/gla_university.json")
+
+        fire = build_payload("Fire near the canteen", "Library", "Student")
+        panic = build_payload("Someone is following me", "Library", "Student", panic=True)
+        quiet = build_payload("Lost my umbrella", "Main Gate", "Student")
+
+        priority, features = classify_priority(fire, coordinator)
+        self.assertEqual(priority, PRIORITY_CRITICAL)
+        self.assertTrue(features.critical)
+        self.assertEqual(classify_priority(panic, coordinator)[0], PRIORITY_CRITICAL)
+        self.assertGreater(classify_priority(quiet, coordinator)[0], PRIORITY_CRITICAL)
+
+        # Night zones follow the report's own timestamp, as risk scoring does
+        ground = build_payload("Group of people shouting", "Cricket Ground", "Student")
+        ground["timestamp"] = "2026-03-02T21:30:00"
+        night = classify_priority(ground, coordinator)[0]
+        ground["timestamp"] = "2026-03-02T10:30:00+00:00"
+        day = classify_priority(ground, coordinator)[0]
+        self.assertEqual(night, PRIORITY_HIGH)
+        self.assertGreater(day, night)
+
+    def test_urgent_work_jumps_the_queue(self):
+        gate = threading.Event()
+        busy = threading.Event()
+        order = []
+
+        def handler(payload, features):
+            busy.set()
+            gate.wait(timeout=5)
+            order.append(payload["id"])
+            return payload["id"]
+
+        queue = IngestionQueue(handler, workers=1)
+        queue.start()
+        try:
+            # The first item occupies the only worker while the rest queue up
+            first = queue.submit({"id": "busy"}, PRIORITY_LOW)
+            self.assertTrue(busy.wait(timeout=5))
+            futures = [
+                queue.submit({"id": "low"}, PRIORITY_LOW),
+                queue.submit({"id": "high"}, PRIORITY_HIGH),
+                queue.submit({"id": "critical"}, PRIORITY_CRITICAL),
+            ]
+            gate.set()
+            self.assertEqual(first.result(timeout=5), "busy")
+            for future in futures:
+                future.result(timeout=5)
+        finally:
+            queue.shutdown()
+
+        self.assertEqual(order, ["busy", "critical", "high", "low"])
+
+    def test_full_class_rejects_without_blocking_others(self):
+        queue = IngestionQueue(lambda payload, features: None, capacity={
+            PRIORITY_CRITICAL: 2,
+            PRIORITY_LOW: 1,
+        })
+        # Not started: nothing drains, so capacity is reached immediately
+        queue.submit({}, PRIORITY_LOW)
+        with self.assertRaises(QueueFullError) as ctx:
+            queue.submit({}, PRIORITY_LOW)
+        self.assertGreaterEqual(ctx.exception.retry_after, 1.0)
+
+        queue.submit({}, PRIORITY_CRITICAL)
+        self.assertEqual(queue.stats()["depth"], {"critical": 1, "low": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
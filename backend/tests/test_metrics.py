@@ -0,0 +1,61 @@
+import unittest
+
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.metrics import INCIDENTS_TOTAL, STAGE_LATENCY, MetricsRegistry
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("demo_requests_total", "Requests", ("path",))
+        latency = registry.histogram("demo_seconds", "Latency", ("stage",), buckets=(0.1, 1.0))
+
+        requests.inc("/api/report-incident")
+        requests.inc("/api/report-incident")
+        latency.observe(0.05, "risk")
+        latency.observe(0.5, "risk")
+
+        text = registry.render()
+
+        self.assertIn("# TYPE demo_requests_total counter", text)
+        self.assertIn('demo_requests_total{path="/api/report-incident"} 2', text)
+        self.assertIn('demo_seconds_bucket{stage="risk",le="0.1"} 1', text)
+        self.assertIn('demo_seconds_bucket{stage="risk",le="+Inf"} 2', text)
+        self.assertIn('demo_seconds_count{stage="risk"} 2', text)
+
+    def test_drained_observations_merge_into_another_registry(self):
+        """A shard's observations add up in the parent's registry"""
+        shard, parent = MetricsRegistry(), MetricsRegistry()
+        shard_reports = shard.counter("reports_total", "Reports", ("risk_level",))
+        shard_latency = shard.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        reports = parent.counter("reports_total", "Reports", ("risk_level",))
+        latency = parent.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        reports.inc("High")
+        shard_reports.inc("High", amount=2)
+        shard_latency.observe(0.5)
+        parent.merge(shard.drain())
+
+        self.assertEqual(reports.value("High"), 3)
+        self.assertEqual(latency.count(), 1)
+        self.assertEqual(shard.drain(), {})
+
+    def test_pipeline_is_instrumented(self):
+        """Every stage and the outcome should be recorded"""
+        coordinator = CoordinatorAgent(campus_config_path="config/gla_university.json")
+        before_risk = STAGE_LATENCY.count("risk")
+        before_high = INCIDENTS_TOTAL.value("High", "Fire")
+
+        coordinator.process_incident({
+            "source": "Student",
+            "description": "Fire in the cafeteria",
+            "location": "Cafeteria"
+        })
+
+        self.assertEqual(STAGE_LATENCY.count("risk"), before_risk + 1)
+        self.assertEqual(INCIDENTS_TOTAL.value("High", "Fire"), before_high + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from backend.core.ndjson_stream import stream_ndjson
+
+CONFIG = "config/gla_university.json"
+
+
+def _line(description, location, timestamp=None):
+    payload = {"source": "Security", "description": description, "location": location}
+    if timestamp:
+        payload["timestamp"] = timestamp
+    return json.dumps(payload) + "\n"
+
+
+class TestNdjsonStream(unittest.TestCase):
+
+    def test_results_keep_input_order(self):
+        source = io.StringIO(
+            _line("Fire in the chemistry lab", "Chemistry Lab")
+            + "\n"
+            + "{not json\n"
+            + "[1, 2]\n"
+            + _line("Lost a water bottle", "Main Academic Block")
+        )
+        sink = io.StringIO()
+
+        stats = stream_ndjson(source, sink, config_path=CONFIG, batch_size=2, queue_size=1)
+        results = [json.loads(line) for line in sink.getvalue().splitlines()]
+
+        self.assertEqual([r["line"] for r in results], [1, 3, 4, 5])
+        self.assertEqual([r["ok"] for r in results], [True, False, False, True])
+        self.assertEqual(results[0]["risk_level"], "High")
+        self.assertEqual((stats.lines, stats.processed, stats.failed), (4, 2, 2))
+
+    def test_payload_timestamp_drives_night_scoring(self):
+        source = io.StringIO(
+            _line("Loud noise", "Cricket Ground", "2026-01-01T22:30:00")
+            + _line("Loud noise", "Cricket Ground", "2026-01-01T10:30:00+00:00")
+        )
+        sink = io.StringIO()
+        stream_ndjson(source, sink, config_path=CONFIG)
+        night, day = [json.loads(line) for line in sink.getvalue().splitlines()]
+
+        # "Cricket Ground (After 8 PM)" is only high risk in the evening
+        self.assertEqual(night["risk_level"], "High")
+        self.assertEqual(day["risk_level"], "Low")
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "FIFOs need a POSIX system")
+    def test_reads_from_fifo(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "incidents.fifo")
+        os.mkfifo(path)
+
+        def produce():
+            with open(path, "w") as fifo:
+                for _ in range(50):
+                    fifo.write(_line("Smoke near the cafeteria", "Cafeteria"))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        try:
+            sink = io.StringIO()
+            with open(path) as source:
+                stats = stream_ndjson(source, sink, config_path=CONFIG, batch_size=8)
+        finally:
+            producer.join()
+            os.remove(path)
+            os.rmdir(directory)
+
+        self.assertEqual(stats.processed, 50)
+        self.assertEqual(len(sink.getvalue().splitlines()), 50)
+
+    def test_live_input_is_not_held_for_a_full_batch(self):
+        """A lone report on a quiet pipe is answered before more lines arrive"""
+        read_fd, write_fd = os.pipe()
+        answered = threading.Event()
+
+        class Sink(io.StringIO):
+            def flush(self):
+                answered.set()
+
+        sink = Sink()
+        with open(read_fd) as source, open(write_fd, "w") as pipe:
+            worker = threading.Thread(
+                target=stream_ndjson, args=(source, sink), kwargs={"config_path": CONFIG}
+            )
+            worker.start()
+            pipe.write(_line("Fire in the chemistry lab", "Chemistry Lab"))
+            pipe.flush()
+            try:
+                self.assertTrue(answered.wait(5))
+                self.assertEqual(json.loads(sink.getvalue())["risk_level"], "High")
+            finally:
+                pipe.close()
+                worker.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
+import asyncio
 import unittest
 
-from core.coordinator import CoordinatorAgent
+from backend.core.coordinator import PIPELINE_STAGES, CoordinatorAgent
 
 
 class TestCampusSafetyPipeline(unittest.TestCase):
@@ -42,6 +43,77 @@ class TestCampusSafetyPipeline(unittest.TestCase):
 
         self.assertIn(result.risk_level, ["Low", "Medium"])
 
+    def test_batch_processing(self):
+        """Batches keep input order and isolate bad items"""
+        payloads = [
+            {"source": "Student", "description": "Fire in chemistry lab", "location": "Chemistry Lab"},
+            {"source": "Student", "description": None, "location": "Library"},
+            {"source": "Security", "description": "Noise complaint", "location": "Library"},
+        ]
+
+        results = self.coordinator.process_batch(payloads)
+
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual(results[0].result.risk_level, "High")
+        self.assertFalse(results[1].ok)
+        self.assertIsNone(results[1].result)
+        self.assertTrue(results[2].ok)
+        self.assertEqual(results[2].result.confidence_level, "High")
+
+    def test_async_stage_stream(self):
+        """Stages stream in pipeline order and end with the audit"""
+        payload = {
+            "source": "Security",
+            "description": "Student fainted near the cafeteria",
+            "location": "Cafeteria"
+        }
+
+        async def collect():
+            return [step async for step in self.coordinator.astream_incident(payload)]
+
+        stages = asyncio.run(collect())
+
+        self.assertEqual([name for name, _ in stages], ["intake", "risk", "response", "audit"])
+        self.assertEqual(stages[1][1].risk_level, "High")
+        self.assertEqual(stages[-1][1].escalation_chain, stages[2][1].escalation_chain)
+
+    def test_progress_callback(self):
+        """Progress fires once per stage, in order, before the result returns"""
+        payload = {
+            "source": "Student",
+            "description": "Phone stolen from the library",
+            "location": "Central Library"
+        }
+        seen = []
+
+        result = self.coordinator.process_incident(
+            payload, progress=lambda stage, stage_result: seen.append((stage, stage_result))
+        )
+
+        self.assertEqual(tuple(stage for stage, _ in seen), PIPELINE_STAGES)
+        self.assertIs(seen[-1][1], result)
+        self.assertEqual(seen[0][1].incident_type, "Theft")
+
+    def test_decision_cache_and_lazy_explanation(self):
+        """Equivalent incidents reuse one decision; text renders on demand"""
+        cache = self.coordinator.decision_cache
+        first = self.coordinator.process_incident({
+            "source": "Faculty", "description": "Bike missing", "location": "Student Parking"
+        })
+        hits = cache.hits
+        second = self.coordinator.process_incident({
+            "source": "Faculty", "description": "Bike missing", "location": "Bus Parking"
+        })
+
+        self.assertEqual(cache.hits, hits + 1)
+        self.assertEqual(second.risk_level, first.risk_level)
+        self.assertIsNone(second.explanation)
+        self.assertIn("'Bus Parking'", second.explain())
+        self.assertIn(", ".join(second.escalation_chain) or "authorities", second.explain())
+
+        cache.invalidate("another-version")
+        self.assertEqual(cache.stats()["entries"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from backend.core.config_loader import resolve_config_path
+from backend.core.policy_simulation import simulate, split_ranges
+
+BASELINE = "config/gla_university.json"
+
+
+class TestPolicySimulation(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.history = os.path.join(self.tmpdir, "history.ndjson")
+        payloads = [
+            {"source": "Student", "description": "Noise complaint", "location": "Central Library",
+             "timestamp": "2026-10-18T19:30:00"},
+            {"source": "Student", "description": "Bike missing", "location": "Student Parking",
+             "timestamp": "2026-10-18T19:45:00"},
+            {"source": "Security", "description": "Fire in chemistry lab", "location": "Chemistry Lab",
+             "timestamp": "2026-10-18T11:00:00"},
+        ]
+        with open(self.history, "w", encoding="utf-8") as f:
+            for payload in payloads * 4:
+                f.write(json.dumps(payload) + "\n")
+            f.write("not json\n")
+
+        with open(resolve_config_path(BASELINE), encoding="utf-8") as f:
+            config = json.load(f)
+        # Night starts an hour earlier: the 19:xx reports move into night hours
+        config["campus"]["operating_hours"]["night_start"] = "19:00"
+        self.candidate = os.path.join(self.tmpdir, "earlier_night.json")
+        with open(self.candidate, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_reports_shifted_decisions(self):
+        """Earlier night hours raise the evening reports and nothing else"""
+        report = simulate(self.history, BASELINE, [self.candidate, BASELINE], workers=1)
+
+        self.assertEqual(report["incidents"], 12)
+        self.assertEqual(report["failed"], 1)
+
+        shifted, unchanged = report["candidates"]
+        self.assertEqual(shifted["changed"], 8)
+        self.assertEqual(sum(t["count"] for t in shifted["transitions"]), 8)
+        self.assertTrue(all(t["from"] != t["to"] for t in shifted["transitions"]))
+        self.assertEqual(sum(z["raised"] for z in shifted["zones"].values()), 8)
+        self.assertEqual(shifted["examples"][0]["line"], 1)
+        self.assertEqual(unchanged["changed"], 0)
+        self.assertEqual(unchanged["risk_levels"], report["baseline"]["risk_levels"])
+
+    def test_parallel_workers_match_single_process(self):
+        """Splitting the history across processes does not change the report"""
+        single = simulate(self.history, BASELINE, [self.candidate], workers=1)
+        parallel = simulate(self.history, BASELINE, [self.candidate], workers=2)
+
+        self.assertEqual(parallel, single)
+
+    def test_line_separators_inside_strings(self):
+        """U+2028 and friends are valid unescaped in JSON strings and do not end a line"""
+        with open(self.history, "w", encoding="utf-8") as f:
+            for text in ("Noise\u2028complaint", "Bike\u0085missing\u2029"):
+                payload = {"source": "Student", "description": text, "location": "Central Library"}
+                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+
+        report = simulate(self.history, BASELINE, [self.candidate], workers=1)
+        self.assertEqual((report["incidents"], report["failed"]), (2, 0))
+
+    def test_ranges_cut_on_line_boundaries(self):
+        """Byte ranges cover the file exactly and never split a line"""
+        ranges = split_ranges(self.history, 5)
+        with open(self.history, "rb") as f:
+            data = f.read()
+
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(data))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[start - 1:start], b"\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from backend.core.config_loader import resolve_config_path
+from backend.core.coordinator import CoordinatorAgent, DEFAULT_CAMPUS_CONFIG
+from backend.core.registry import CampusRegistry
+
+
+class TestCampusRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "campus.json")
+        shutil.copy(resolve_config_path(DEFAULT_CAMPUS_CONFIG), self.path)
+        self.registry = CampusRegistry(
+            factory=lambda loader: CoordinatorAgent(config_loader=loader),
+            check_interval=0
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _rewrite(self, mutate=None):
+        with open(self.path, encoding="utf-8") as f:
+            config = json.load(f)
+        if mutate:
+            mutate(config)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_coordinator_is_reused(self):
+        """Unchanged configs should not rebuild the coordinator"""
+        first = self.registry.get(self.path)
+        self.assertIs(self.registry.get(self.path), first)
+
+    def test_touch_without_content_change_keeps_version(self):
+        """An mtime bump alone should not trigger a rebuild"""
+        first = self.registry.get(self.path)
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1_000_000))
+        self.assertIs(self.registry.get(self.path), first)
+
+    def test_content_change_hot_reloads(self):
+        """Edited configs should be swapped in with a new version"""
+        first = self.registry.get(self.path)
+
+        def rename(config):
+            config["campus"]["name"] = "Renamed University"
+
+        self._rewrite(rename)
+        second = self.registry.get(self.path)
+
+        self.assertIsNot(second, first)
+        self.assertNotEqual(second.config_version, first.config_version)
+        self.assertEqual(second.config_loader.get_campus_name(), "Renamed University")
+
+        result = second.process_incident({
+            "source": "Student",
+            "description": "Noise complaint in library",
+            "location": "Library"
+        })
+        self.assertEqual(result.config_version, second.config_version)
+
+    def test_invalid_reload_keeps_previous_version(self):
+        """A broken edit should not take the campus offline"""
+        first = self.registry.get(self.path)
+        self._rewrite(lambda config: config.pop("risk_zones"))
+        self.assertIs(self.registry.get(self.path), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from backend.agents.risk_agent import RiskEvaluationAgent
+from backend.core.config_loader import resolve_config_path
+from backend.core.config_schema import ConfigValidationError, validate_config
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.stage_graph import CORE_STAGE_TIMEOUT, Stage, StageGraph
+
+FIRE = {"source": "Security", "description": "Fire in chemistry lab", "location": "Chemistry Lab"}
+NOISE = {"source": "Student", "description": "Noise complaint", "location": "Central Library"}
+
+
+def slow_lookup(results):
+    time.sleep(0.2)
+    return {"cameras": [results["intake"].location]}
+
+
+def broken_lookup(results):
+    raise RuntimeError("camera index offline")
+
+
+def thread_name(results):
+    return threading.current_thread().name
+
+
+class SlowRiskAgent(RiskEvaluationAgent):
+
+    def score_features(self, features):
+        time.sleep(0.5)
+        return super().score_features(features)
+
+
+class TestStageGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _coordinator(self, pipeline, **kwargs):
+        with open(resolve_config_path("config/gla_university.json"), encoding="utf-8") as f:
+            config = json.load(f)
+        config["pipeline"] = pipeline
+        path = os.path.join(self.tmpdir, f"campus_{len(os.listdir(self.tmpdir))}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        return CoordinatorAgent(campus_config_path=path, **kwargs)
+
+    def _timeline(self, coordinator, payload):
+        started = time.perf_counter()
+        return {
+            stage: time.perf_counter() - started
+            for stage, _ in coordinator.iter_stages(dict(payload))
+        }
+
+    def test_fast_path_escalates_before_enrichment(self):
+        """Critical reports skip enrichment until the response is out; others wait for it"""
+        coordinator = self._coordinator({"stages": [{
+            "name": "cameras",
+            "callable": "backend.tests.test_stage_graph:slow_lookup",
+            "before": ["response"],
+            "timeout": 1.0,
+        }]})
+        records = []
+        coordinator.sinks.append(records.append)
+
+        fire = self._timeline(coordinator, FIRE)
+        self.assertLess(fire["response"], 0.1)
+        self.assertGreaterEqual(fire["audit"], 0.2)
+
+        noise = self._timeline(coordinator, NOISE)
+        self.assertGreaterEqual(noise["response"], 0.2)
+
+        self.assertEqual(
+            [r.enrichment["cameras"] for r in records],
+            [{"cameras": ["Chemistry Lab"]}, {"cameras": ["Central Library"]}]
+        )
+
+    def test_stage_timeout_uses_fallback(self):
+        """A risk stage past its timeout is replaced by the safety-first fallback"""
+        coordinator = self._coordinator({"timeouts": {"risk": 0.05}})
+        coordinator.risk_agent = SlowRiskAgent()
+
+        started = time.perf_counter()
+        audit = coordinator.process_incident(dict(NOISE))
+        self.assertLess(time.perf_counter() - started, 0.3)
+        self.assertEqual(audit.risk_level, "High")
+        self.assertEqual(audit.final_decision, "Immediate escalation as per campus safety policy")
+
+    def test_independent_stages_overlap(self):
+        """Two slow enrichment stages with timeouts run side by side"""
+        coordinator = self._coordinator({"stages": [
+            {"name": "cameras", "callable": "backend.tests.test_stage_graph:slow_lookup", "timeout": 1.0},
+            {"name": "badges", "callable": "backend.tests.test_stage_graph:slow_lookup", "timeout": 1.0},
+            {"name": "floorplan", "callable": "backend.tests.test_stage_graph:broken_lookup",
+             "fallback": {"cameras": []}},
+        ]})
+        records = []
+        coordinator.sinks.append(records.append)
+
+        timeline = self._timeline(coordinator, NOISE)
+        self.assertLess(timeline["audit"], 0.35)
+        self.assertEqual(records[0].enrichment["floorplan"], {"cameras": []})
+
+    def test_deadlines_hold_while_an_untimed_stage_runs(self):
+        """A pooled stage times out on schedule even while a stage without a timeout is busy"""
+        graph = StageGraph([
+            Stage("lookup", lambda results: time.sleep(0.5), timeout=0.05, fallback=lambda results: "fallback"),
+            Stage("slow", lambda results: time.sleep(0.3) or "slow"),
+        ])
+        started = time.perf_counter()
+        stages = graph.run({})
+        self.assertEqual(next(stages), ("lookup", "fallback"))
+        self.assertLess(time.perf_counter() - started, 0.2)
+        self.assertEqual(next(stages), ("slow", "slow"))
+
+    def test_enrichment_has_its_own_pool(self):
+        """Optional stages run on the enrichment pool; core stages get default deadlines"""
+        coordinator = self._coordinator({"stages": [
+            {"name": "where", "callable": "backend.tests.test_stage_graph:thread_name", "timeout": 1.0},
+        ]})
+        records = []
+        coordinator.sinks.append(records.append)
+        coordinator.process_incident(dict(NOISE))
+
+        self.assertTrue(records[0].enrichment["where"].startswith("pipeline-enrichment"))
+        self.assertEqual(coordinator.graph.stages["risk"].timeout, CORE_STAGE_TIMEOUT)
+        # Without timeouts nothing is pooled and the core stays inline
+        self.assertIsNone(CoordinatorAgent().graph.stages["risk"].timeout)
+
+    def test_escalation_is_handed_off_before_the_audit(self):
+        coordinator = self._coordinator({"stages": [
+            {"name": "cameras", "callable": "backend.tests.test_stage_graph:slow_lookup", "timeout": 1.0},
+        ]})
+        escalations, records = [], []
+        coordinator.escalation_sinks.append(escalations.append)
+        coordinator.sinks.append(records.append)
+
+        for stage, _ in coordinator.iter_stages(dict(FIRE)):
+            if stage == "response":
+                self.assertEqual((len(escalations), len(records)), (1, 0))
+        self.assertEqual(escalations[0].response.escalation_chain, records[0].response.escalation_chain)
+
+    def test_required_stage_failure_fails_the_run(self):
+        graph = StageGraph([
+            Stage("first", lambda results: 1),
+            Stage("second", lambda results: 1 / 0, after=("first",)),
+        ])
+        with self.assertRaises(ZeroDivisionError):
+            list(graph.run({}))
+
+    def test_pipeline_config_is_validated(self):
+        with open(resolve_config_path("config/gla_university.json"), encoding="utf-8") as f:
+            config = json.load(f)
+        config["pipeline"] = {
+            "timeouts": {"risk": 0, "cameras": 1},
+            "stages": [
+                {"name": "cameras", "callable": "not a path", "after": ["response"], "before": ["risk"]},
+            ],
+        }
+
+        with self.assertRaises(ConfigValidationError) as caught:
+            validate_config(config)
+        errors = caught.exception.errors
+        self.assertEqual(len(errors), 4)
+        self.assertTrue(any("cycle" in error for error in errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from backend.core.coordinator import CoordinatorAgent
+from backend.core.zone_activity import ZoneActivity
+
+
+class TestZoneActivity(unittest.TestCase):
+
+    def test_decays_by_half_life(self):
+        """Activity halves every half-life and late reports do not rewind it"""
+        activity = ZoneActivity(half_life_seconds=600)
+        self.assertEqual(activity.observe("Back Gate", 0.0), 0)
+        self.assertAlmostEqual(activity.level("Back Gate", 600.0), 0.5)
+
+        self.assertEqual(activity.observe("Back Gate", 600.0), 1)
+        self.assertAlmostEqual(activity.level("Back Gate", 600.0), 1.5)
+
+        activity.observe("Back Gate", 0.0)
+        self.assertAlmostEqual(activity.level("Back Gate", 600.0), 2.0)
+        self.assertEqual(activity.level("Library", 600.0), 0.0)
+
+    def test_unzoned_reports_are_not_tracked(self):
+        """Memory is bounded by zones; free-text locations never get state"""
+        activity = ZoneActivity()
+        self.assertEqual(activity.observe(None, 0.0), 0)
+        self.assertEqual(activity.snapshot(0.0), {})
+
+    def test_repeated_reports_raise_risk(self):
+        """Reports close together in one zone escalate; the boost is capped"""
+        coordinator = CoordinatorAgent(
+            campus_config_path="config/gla_university.json",
+            zone_activity=ZoneActivity(half_life_seconds=900, max_boost=2)
+        )
+
+        def report(minute):
+            stages = dict(coordinator.iter_stages({
+                "source": "Anonymous",
+                "description": "Group of people loitering and shouting",
+                "location": "Back Gate",
+                "timestamp": f"2026-10-18T10:{minute:02d}:00"
+            }))
+            return stages["risk"]
+
+        first, second = report(0), report(10)
+        self.assertEqual(first.risk_level, "Low")
+        self.assertEqual(second.risk_score, first.risk_score + 1)
+        self.assertEqual(second.risk_level, "Medium")
+        self.assertIn("Repeated recent incidents", second.reason)
+
+        for minute in range(21, 30):
+            capped = report(minute)
+        self.assertEqual(capped.risk_score, first.risk_score + 2)
+
+        # Boosted and unboosted decisions are cached separately
+        self.assertGreaterEqual(coordinator.decision_cache.stats()["entries"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Offline audit log verification: walks the hash chain once, in bounded
+memory, and reports the first broken link.
+
+    python -m backend.verify_audit backend/data/audit.log
+    python -m backend.verify_audit audit.log --expect-head <hash from /api/audit>
+
+Exit status is 0 when the chain is intact, 1 when it is broken and 2
+when the log cannot be read.
+"""
+import argparse
+import json
+import sys
+from time import perf_counter
+
+from backend.core.audit_log import DEFAULT_AUDIT_LOG_PATH, verify_log
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify the hash chain of an audit log")
+    parser.add_argument("path", nargs="?", default=DEFAULT_AUDIT_LOG_PATH, help="Audit log file")
+    parser.add_argument("--expect-head", help="Hash the log must end with (detects truncation)")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    started = perf_counter()
+    try:
+        result = verify_log(args.path, expected_head=args.expect_head)
+    except OSError as exc:
+        print(f"verification failed: {exc}", file=sys.stderr)
+        return 2
+    elapsed = perf_counter() - started
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    elif result["ok"]:
+        print(f"OK: {result['entries']} entries, head {result['head']}")
+    else:
+        print(
+            f"BROKEN at line {result['line']} (byte {result['offset']}): {result['error']}\n"
+            f"{result['entries']} entries verified before it, last good hash {result['head']}"
+        )
+    print(f"verified in {elapsed:.1f}s", file=sys.stderr)
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
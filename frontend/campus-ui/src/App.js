@@ -41,6 +41,45 @@ const LOCATIONS = [
 
 const USER_ROLES = ["Student","Faculty","Staff","Security"];
 
+const API_BASE = process.env.REACT_APP_API_BASE || "http://localhost:8000";
+
+/* Stage events pushed by /api/report-incident/stream, in pipeline order */
+const STAGE_EVENTS = ["intake", "risk", "response", "audit"];
+
+/* Minimal SSE parser for a fetch() body (EventSource cannot POST) */
+async function streamIncident(body, onEvent) {
+  const res = await fetch(`${API_BASE}/api/report-incident/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(body),
+  });
+  if (!res.ok) throw new Error(`API error ${res.status}`);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) >= 0) {
+      const chunk = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = "message";
+      let data = "";
+      for (const line of chunk.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      onEvent(event, data ? JSON.parse(data) : {});
+    }
+  }
+}
+
 /* ===== THEME ===== */
 const theme = createTheme({
   palette: {
@@ -61,6 +100,9 @@ export default function App() {
   const [panic, setPanic] = useState(false);
   const [submitted, setSubmitted] = useState(false);
   const [step, setStep] = useState(0);
+  const [risk, setRisk] = useState(null);
+  const [decision, setDecision] = useState(null);
+  const [error, setError] = useState(null);
 
   const steps = [
     "Incident Intake",
@@ -69,7 +111,7 @@ export default function App() {
     "Audit & Governance",
   ];
 
-  function handleSubmit() {
+  async function handleSubmit() {
     if (!description.trim()) {
       alert("Please enter incident description");
       return;
@@ -77,13 +119,30 @@ export default function App() {
 
     setSubmitted(true);
     setStep(0);
+    setRisk(null);
+    setDecision(null);
+    setError(null);
 
-    let i = 0;
-    const interval = setInterval(() => {
-      i++;
-      setStep(i);
-      if (i === steps.length) clearInterval(interval);
-    }, 400);
+    try {
+      await streamIncident(
+        {
+          incident_type: incidentType,
+          description,
+          location,
+          user_role: role,
+          panic,
+        },
+        (event, data) => {
+          const index = STAGE_EVENTS.indexOf(event);
+          if (index >= 0) setStep(index + 1);
+          if (event === "risk") setRisk(data);
+          if (event === "audit") setDecision(data);
+          if (event === "error") setError(data.error);
+        }
+      );
+    } catch (err) {
+      setError(err.message);
+    }
   }
 
   return (
@@ -171,6 +230,9 @@ export default function App() {
                     <p><b>Incident:</b> {incidentType}</p>
                     <p><b>Location:</b> {location}</p>
                     <p><b>Status:</b> {panic ? "Immediate Threat" : "Under Review"}</p>
+                    {risk && <p><b>Risk Level:</b> {risk.risk_level} ({risk.risk_score})</p>}
+                    {decision && <p><b>Action:</b> {decision.decision}</p>}
+                    {error && <p style={{ color: "#ef4444" }}><b>Error:</b> {error}</p>}
                   </>
                 )}
               </CardContent>
@@ -202,8 +264,10 @@ export default function App() {
               Why this decision?
             </AccordionSummary>
             <AccordionDetails>
-              Decision derived from campus risk zones, incident type,
-              operating hours, and institutional safety policies.
+              {decision ? decision.explanation : (
+                "Decision derived from campus risk zones, incident type, " +
+                "operating hours, and institutional safety policies."
+              )}
             </AccordionDetails>
           </Accordion>
         )}